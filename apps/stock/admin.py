@@ -2,20 +2,24 @@ from django.contrib import admin
 
 from apps.stock import models
 from apps.stock import forms
+from core.admin import IndexedSearchAdminMixin
 
 
 @admin.register(models.Category)
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
     """ Category Admin """
     form = forms.CategoryForm
     search_fields = ('pk', 'name',)
+    search_text_fields = ('name',)
     list_display = ('name', 'active', 'created_at', 'updated_at')
 
 
 @admin.register(models.Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
     """ Product Admin """
     form = forms.ProductForm
     search_fields = ('pk', 'name', 'category__name', 'category_id')
+    search_uuid_fields = ('pk', 'category_id')
+    search_text_fields = ('name', 'category__name')
     list_display = ('name', 'category', 'active', 'created_at', 'updated_at')
     list_filter = ('category',)
@@ -16,8 +16,20 @@ class SimpleCategorySerializer(FormSerializerMixin, serializers.ModelSerializer)
 
 
 class CategorySerializer(SimpleCategorySerializer):
+    is_deletable = serializers.SerializerMethodField()
+
     class Meta(SimpleCategorySerializer.Meta):
         fields = SimpleCategorySerializer.Meta.fields + (
             'created_at',
             'updated_at',
+            'is_deletable',
+        )
+        optional_fields = (
+            'is_deletable',
         )
+        annotated_fields = {
+            'is_deletable': SimpleCategorySerializer.Meta.model.annotate_deletable,
+        }
+
+    def get_is_deletable(self, instance) -> bool:
+        return instance.get_deletable()
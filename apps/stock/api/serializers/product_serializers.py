@@ -1,11 +1,13 @@
 from rest_framework import serializers
 
-from core.serializers import FormSerializerMixin
+from core.serializers import FormSerializerMixin, NestedSerializerMixin
 from ... import forms
 from .category_serializers import SimpleCategorySerializer
 
 
-class ProductSerializer(FormSerializerMixin, serializers.ModelSerializer):
+class ProductSerializer(NestedSerializerMixin, FormSerializerMixin, serializers.ModelSerializer):
+    is_deletable = serializers.SerializerMethodField()
+
     class Meta:
         form = forms.ProductForm
         model = forms.ProductForm.Meta.model
@@ -16,12 +18,17 @@ class ProductSerializer(FormSerializerMixin, serializers.ModelSerializer):
             'created_at',
             'updated_at',
             'category',
+            'is_deletable',
         )
+        nested_serializers = {
+            'category': SimpleCategorySerializer,
+        }
+        optional_fields = (
+            'is_deletable',
+        )
+        annotated_fields = {
+            'is_deletable': forms.ProductForm.Meta.model.annotate_deletable,
+        }
 
-    def to_representation(self, instance):
-        rep = super().to_representation(instance)
-
-        if 'category' in rep:
-            rep['category'] = SimpleCategorySerializer(instance=instance.category).data
-
-        return rep
+    def get_is_deletable(self, instance) -> bool:
+        return instance.get_deletable()
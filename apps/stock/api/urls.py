@@ -1,12 +1,14 @@
 from django.urls import path, include
 from rest_framework_nested import routers
 
+from core.viewsets import JobViewSet
 from . import viewsets
 
 router = routers.DefaultRouter()
 
 router.register('categories', viewsets.CategoryViewSet)
 router.register('products', viewsets.ProductViewSet)
+router.register('jobs', JobViewSet, basename='job')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,9 +1,33 @@
 from rest_framework.viewsets import ModelViewSet
 
-from core.viewsets import FieldRequestViewsetMixin
+from core.viewsets import (
+    BulkViewsetMixin,
+    CachedResponseViewsetMixin,
+    ConditionalResponseViewsetMixin,
+    QuerysetPlannerViewsetMixin,
+    RowRendererViewsetMixin,
+    StreamingListViewsetMixin,
+)
+from ... import tasks
 from .. import serializers
 
 
-class CategoryViewSet(FieldRequestViewsetMixin, ModelViewSet):
+class CategoryViewSet(ConditionalResponseViewsetMixin,
+                       CachedResponseViewsetMixin,
+                       StreamingListViewsetMixin,
+                       RowRendererViewsetMixin,
+                       BulkViewsetMixin,
+                       QuerysetPlannerViewsetMixin,
+                       ModelViewSet):
     serializer_class = serializers.CategorySerializer
     queryset = serializers.CategorySerializer.Meta.model.objects.get_queryset()
+    bulk_job_task = tasks.process_bulk_job
+
+    query_budgets = {
+        'list': 3,
+        'retrieve': 2,
+        'create': 1,
+        'update': 2,
+        'partial_update': 2,
+        'destroy': 3,
+    }
@@ -1,10 +1,73 @@
+import os
+from uuid import uuid4
+
+from django.core.files.storage import default_storage
+from django.utils.translation import gettext as _
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.viewsets import ModelViewSet
 
-from core.viewsets import FieldRequestViewsetMixin
+from core.viewsets import (
+    BulkViewsetMixin,
+    CachedResponseViewsetMixin,
+    ConditionalResponseViewsetMixin,
+    ExportViewsetMixin,
+    QuerysetPlannerViewsetMixin,
+    RowRendererViewsetMixin,
+    StreamingListViewsetMixin,
+    SuggestViewsetMixin,
+)
+from ... import tasks
 from .. import serializers
 
 
-class ProductViewSet(FieldRequestViewsetMixin, ModelViewSet):
+class ProductViewSet(ConditionalResponseViewsetMixin,
+                      CachedResponseViewsetMixin,
+                      StreamingListViewsetMixin,
+                      RowRendererViewsetMixin,
+                      ExportViewsetMixin,
+                      SuggestViewsetMixin,
+                      BulkViewsetMixin,
+                      QuerysetPlannerViewsetMixin,
+                      ModelViewSet):
     serializer_class = serializers.ProductSerializer
     queryset = serializers.ProductSerializer.Meta.model.objects.get_queryset()
     filterset_fields = ('category', 'active', 'category__active')
+    search_vector_column = 'search_vector'
+    bulk_job_task = tasks.process_bulk_job
+
+    query_budgets = {
+        # Filtering by category validates it once.
+        'list': 4,
+        'retrieve': 2,
+        'create': 4,
+        'update': 5,
+        'partial_update': 5,
+        'destroy': 2,
+        'export': 1,
+        'suggest': 1,
+    }
+
+    import_formats = ('csv', 'ndjson')
+
+    @action(detail=False, methods=['post'], url_path='import', url_name='import', parser_classes=[MultiPartParser])
+    def import_file(self, request, *args, **kwargs):
+        """
+        Imports products from an uploaded CSV/NDJSON `file` in background,
+        as the `import_stock` command does.
+        """
+        file = request.FILES.get('file')
+        if file is None:
+            raise ValidationError({'file': [_('No file was submitted.')]})
+
+        extension = os.path.splitext(file.name)[1].lstrip('.').lower()
+        file_format = request.data.get('file_format') or extension
+        if file_format not in self.import_formats:
+            raise ValidationError({'file_format': [
+                _('Supported formats: {}.').format(', '.join(self.import_formats))
+            ]})
+
+        name = default_storage.save(f'imports/{uuid4()}.{file_format}', file)
+        job = tasks.import_stock_file.delay(name, file_format)
+        return self.get_job_response(job.id)
@@ -0,0 +1,265 @@
+import random
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.stock.models import Category, Product
+from core.bench import Benchmark, BenchmarkCase, build_report, compare_reports, load_report, write_report
+from core.cache import bump_generation
+from core.cli.mixins import CliInteractionMixin
+
+CASES = ('list', 'filtered_list', 'detail', 'create', 'patch', 'delete')
+
+
+class Command(CliInteractionMixin, BaseCommand):
+    help = (
+        'Benchmarks stock API hot paths (list, filtered list, detail, create,'
+        ' PATCH and delete of products) through the URLconf with the DRF test'
+        ' client, reporting p50/p95/p99 latency, queries per request and'
+        ' allocated memory. Runs on a throwaway database seeded with the'
+        ' requested volumes, unless --in-place is given. Results can be written'
+        ' as JSON and compared to a previous run with --baseline.'
+    )
+
+    seed_chunk_size = 100000
+    sample_size = 1000
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=10000, help='Products seeded.')
+        parser.add_argument('--categories', type=int, default=100, help='Categories seeded.')
+        parser.add_argument('--iterations', type=int, default=200, help='Measured runs of each case.')
+        parser.add_argument('--warmup', type=int, default=20, help='Unmeasured runs of each case.')
+        parser.add_argument(
+            '--memory-iterations',
+            type=int,
+            default=10,
+            help='Runs of each case traced for allocated memory.',
+        )
+        parser.add_argument(
+            '--case',
+            action='append',
+            choices=CASES,
+            dest='cases',
+            help='Case to run, may be repeated. All of them by default.',
+        )
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Clears the cache before every run, benchmarking uncached responses.',
+        )
+        parser.add_argument('--output', help='JSON file the report is written to.')
+        parser.add_argument('--baseline', help='JSON report of a previous run to compare with.')
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=10.0,
+            help='Tolerated increase of latencies and memory over the baseline, in percent.',
+        )
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            help='Keeps the benchmark database, and its seeds, for following runs.',
+        )
+        parser.add_argument(
+            '--in-place',
+            action='store_true',
+            help='Runs on the configured database, seeding it up to the requested volumes.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Seeding requires PostgreSQL.')
+
+        baseline = load_report(options['baseline']) if options['baseline'] else None
+
+        try:
+            setup_test_environment()
+            environment = True
+        except RuntimeError:
+            # Already set up, eg by the test runner
+            environment = False
+
+        old_config = None
+        try:
+            if options['in_place'] is False:
+                old_config = setup_databases(
+                    verbosity=options['verbosity'],
+                    interactive=False,
+                    keepdb=options['keepdb'],
+                    aliases={connection.alias},
+                    serialized_aliases=set(),
+                )
+            report = self.bench(options)
+        finally:
+            if old_config is not None:
+                teardown_databases(old_config, verbosity=options['verbosity'], keepdb=options['keepdb'])
+            if environment:
+                teardown_test_environment()
+
+        if options['output']:
+            write_report(report, options['output'])
+            self.stdout.write(f"Report written to {options['output']}")
+
+        if baseline is not None:
+            for key in ('products', 'categories', 'cold'):
+                if baseline['meta'].get(key) != report['meta'][key]:
+                    self.stderr.write(self.style.WARNING(
+                        f"Baseline {key} was {baseline['meta'].get(key)}, not {report['meta'][key]}."
+                    ))
+
+            regressions = compare_reports(report, baseline, options['threshold'])
+            for regression in regressions:
+                self.stderr.write(regression)
+
+            if regressions:
+                raise CommandError(f'{len(regressions)} regressions over the baseline.')
+
+            self.stdout.write(self.style.SUCCESS('No regressions over the baseline.'))
+
+    def bench(self, options: dict) -> dict:
+        self.seed(options['categories'], options['products'], options['verbosity'])
+        volumes = {'products': Product.objects.count(), 'categories': Category.objects.count()}
+
+        benchmark = Benchmark(
+            self.get_cases(APIClient()),
+            iterations=options['iterations'],
+            warmup=options['warmup'],
+            memory_iterations=options['memory_iterations'],
+            before_each=cache.clear if options['cold'] else None,
+            using=connection.alias,
+        )
+
+        self.stdout.write(f"{'case':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>10}{'KiB':>10}")
+        results = benchmark.run(options['cases'] or CASES, callback=self.write_result)
+
+        return build_report(
+            results,
+            **volumes,
+            iterations=options['iterations'],
+            cold=options['cold'],
+        )
+
+    def write_result(self, result):
+        self.stdout.write(
+            f'{result.name:<16}{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{result.p99_ms:>10.2f}'
+            f'{result.queries:>10.1f}{result.memory_kib:>10.1f}'
+        )
+
+    def seed(self, categories: int, products: int, verbosity: int):
+        """ Inserts categories and products missing to reach the volumes """
+        category_table = connection.ops.quote_name(Category._meta.db_table)
+        product_table = connection.ops.quote_name(Product._meta.db_table)
+
+        with connection.cursor() as cursor:
+            existing = Category.objects.count()
+            if existing < categories:
+                cursor.execute(
+                    f'INSERT INTO {category_table} (id, name, active, created_at, updated_at)'
+                    " SELECT gen_random_uuid(), 'Category ' || i, true, now(), now()"
+                    ' FROM generate_series(%s, %s) i',
+                    [existing + 1, categories],
+                )
+
+            existing = Product.objects.count()
+            total = products - existing
+            for start in range(existing + 1, products + 1, self.seed_chunk_size):
+                end = min(start + self.seed_chunk_size - 1, products)
+                # Products are spread over categories, one in ten inactive
+                cursor.execute(
+                    f'INSERT INTO {product_table} (id, name, active, category_id, created_at, updated_at)'
+                    " SELECT gen_random_uuid(), 'Product ' || i, i %% 10 <> 0, c.id, now(), now()"
+                    ' FROM generate_series(%s, %s) i'
+                    ' JOIN ('
+                    f'  SELECT id, row_number() OVER (ORDER BY id) - 1 AS position FROM {category_table}'
+                    ' ) c ON c.position = i %% %s',
+                    [start, end, max(Category.objects.count(), 1)],
+                )
+                if verbosity > 0:
+                    self.progress_bar(end - existing, total, prefix='Seeding', length=50)
+
+            cursor.execute(f'ANALYZE {category_table}')
+            cursor.execute(f'ANALYZE {product_table}')
+
+        bump_generation(Category, Product)
+
+    def get_cases(self, client: APIClient) -> list:
+        category_pks = [str(pk) for pk in Category.objects.values_list('pk', flat=True)[:self.sample_size]]
+        product_pks = [str(pk) for pk in Product.objects.values_list('pk', flat=True)[:self.sample_size]]
+        if not category_pks or not product_pks:
+            raise CommandError('At least one category and one product must be seeded.')
+
+        list_url = reverse('stock:product-list')
+
+        def detail_url(pk):
+            return reverse('stock:product-detail', kwargs={'pk': pk})
+
+        def create_product():
+            return str(Product.objects.bulk_create([
+                Product(name=f'Product {uuid4()}', category_id=random.choice(category_pks)),
+            ])[0].pk)
+
+        return [
+            BenchmarkCase(
+                'list',
+                lambda state: self.request(client.get, list_url),
+                check=self.expect(status.HTTP_200_OK),
+            ),
+            BenchmarkCase(
+                'filtered_list',
+                lambda category_pk: self.request(client.get, list_url, {'category': category_pk, 'active': 'true'}),
+                setup=lambda: random.choice(category_pks),
+                check=self.expect(status.HTTP_200_OK),
+            ),
+            BenchmarkCase(
+                'detail',
+                lambda pk: self.request(client.get, detail_url(pk)),
+                setup=lambda: random.choice(product_pks),
+                check=self.expect(status.HTTP_200_OK),
+            ),
+            BenchmarkCase(
+                'create',
+                lambda data: self.request(client.post, list_url, data, format='json'),
+                setup=lambda: {'name': f'Product {uuid4()}', 'category': random.choice(category_pks)},
+                check=self.expect(status.HTTP_201_CREATED),
+            ),
+            BenchmarkCase(
+                'patch',
+                lambda pk: self.request(client.patch, detail_url(pk), {'name': f'Product {uuid4()}'}, format='json'),
+                setup=lambda: random.choice(product_pks),
+                check=self.expect(status.HTTP_200_OK),
+            ),
+            BenchmarkCase(
+                'delete',
+                lambda pk: self.request(client.delete, detail_url(pk)),
+                setup=create_product,
+                check=self.expect(status.HTTP_204_NO_CONTENT),
+            ),
+        ]
+
+    @staticmethod
+    def request(method, url: str, data=None, **extra):
+        response = method(url, data=data, secure=True, **extra)
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response
+
+    @staticmethod
+    def expect(status_code: int):
+        def check(response):
+            if response.status_code != status_code:
+                raise CommandError(
+                    f"{response.request['REQUEST_METHOD']} {response.request['PATH_INFO']}"
+                    f' answered {response.status_code}, expected {status_code}.'
+                )
+        return check
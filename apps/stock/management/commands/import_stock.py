@@ -0,0 +1,243 @@
+import csv
+import json
+import os
+import uuid
+from io import StringIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.stock.models import Category, Product
+from core.cache import bump_generation
+from core.cli.mixins import CliInteractionMixin
+
+FORMATS = ('csv', 'ndjson')
+TRUE_VALUES = ('1', 'true', 't', 'yes', 'y')
+FALSE_VALUES = ('0', 'false', 'f', 'no', 'n')
+
+
+class Command(CliInteractionMixin, BaseCommand):
+    help = (
+        'Imports products, and the categories they are in, from CSV or NDJSON'
+        ' files as exported by /stock/products/export/. Rows are staged by'
+        ' PostgreSQL COPY and merged in bulk: missing categories are created by'
+        ' name and products are inserted, or updated when their pk exists.'
+        ' Domain rules are not checked and model signals are not sent.'
+    )
+
+    staging_table = 'stock_import_staging'
+
+    # `progress` is a callable given (processed, total, errors) row counts
+    # after each chunk is staged (see `import_stock_file`).
+    stealth_options = ('progress',)
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', help='CSV or NDJSON file with product rows')
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            help='Format of the file. Inferred from its extension by default.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='Rows copied to the database at once.',
+        )
+        parser.add_argument(
+            '--no-input',
+            action='store_false',
+            dest='interactive',
+            help='Does not ask for confirmation.',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Importing requires PostgreSQL COPY.')
+
+        path = options['file']
+        if not os.path.isfile(path):
+            raise CommandError(f'File not found: {path}')
+
+        file_format = options['format'] or os.path.splitext(path)[1].lstrip('.').lower()
+        if file_format not in FORMATS:
+            raise CommandError(f'Unknown format of {path}: use --format {"|".join(FORMATS)}.')
+
+        total = self.count_rows(path, file_format)
+        if options['interactive'] is True:
+            self.confirmation_yesno(f'Import {total} rows from {path}?')
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.create_staging_table(cursor)
+            staged, errors = self.stage_rows(cursor, path, file_format, total, options)
+            categories = self.merge_categories(cursor)
+            products = self.merge_products(cursor)
+
+        bump_generation(Category, Product)
+
+        for line, error in errors[:20]:
+            self.stderr.write(f'Line {line}: {error}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{staged} rows imported, {len(errors)} skipped:'
+            f' {categories} categories created, {products} products created or updated.'
+        ))
+
+    @staticmethod
+    def count_rows(path: str, file_format: str) -> int:
+        with open(path, encoding='utf-8') as f:
+            count = sum(1 for line in f if line.strip())
+
+        # Header line
+        if file_format == 'csv' and count:
+            count -= 1
+
+        return count
+
+    @staticmethod
+    def iter_rows(path: str, file_format: str):
+        """ Yields (line number, row) of the file """
+        with open(path, encoding='utf-8', newline='') as f:
+            if file_format == 'csv':
+                reader = csv.DictReader(f)
+                for row in reader:
+                    yield reader.line_num, row
+                return
+
+            for line_num, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    yield line_num, json.loads(line)
+                except ValueError as e:
+                    yield line_num, e
+
+    @staticmethod
+    def normalize_row(row: dict) -> tuple:
+        """
+        Staging values of the row: (id, name, category name, active).
+        :raise ValueError
+        """
+        if not isinstance(row, dict):
+            raise ValueError(f'Invalid row: {row}')
+
+        pk = row.get('pk') or row.get('id')
+        pk = uuid.UUID(str(pk)) if pk else uuid.uuid4()
+
+        name = (row.get('name') or '').strip()
+        if not name or len(name) > Product._meta.get_field('name').max_length:
+            raise ValueError('Product name must have from 1 to 100 characters.')
+
+        category = row.get('category.name') or row.get('category')
+        if isinstance(category, dict):
+            category = category.get('name')
+
+        category = (category or '').strip() if isinstance(category, str) else ''
+        if not category or len(category) > Category._meta.get_field('name').max_length:
+            raise ValueError('Category name must have from 1 to 100 characters.')
+
+        active = row.get('active')
+        if active is None or active == '':
+            active = True
+        elif isinstance(active, str):
+            if active.strip().lower() not in TRUE_VALUES + FALSE_VALUES:
+                raise ValueError(f'Invalid active value: {active}')
+            active = active.strip().lower() in TRUE_VALUES
+
+        return pk, name, category, bool(active)
+
+    def create_staging_table(self, cursor):
+        cursor.execute(
+            f'CREATE TEMPORARY TABLE {self.staging_table} ('
+            ' line bigint NOT NULL,'
+            ' id uuid NOT NULL,'
+            ' name varchar(100) NOT NULL,'
+            ' category_name varchar(100) NOT NULL,'
+            ' active boolean NOT NULL'
+            ') ON COMMIT DROP'
+        )
+
+    def stage_rows(self, cursor, path: str, file_format: str, total: int, options: dict) -> tuple:
+        """ Copies rows to the staging table, in chunks """
+        show_progress = options['verbosity'] > 0 and total > 0
+        progress = options.get('progress')
+        staged = 0
+        read = 0
+        errors = list()
+
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+
+        for line, row in self.iter_rows(path, file_format):
+            read += 1
+            try:
+                writer.writerow((line, *self.normalize_row(row)))
+            except ValueError as e:
+                errors.append((line, e))
+                continue
+
+            staged += 1
+            if staged % options['chunk_size'] == 0:
+                self.copy_chunk(cursor, buffer)
+                if show_progress:
+                    self.progress_bar(min(read, total), total, prefix='Staging', length=50)
+                if progress is not None:
+                    progress(processed=min(read, total), total=total, errors=len(errors))
+
+        self.copy_chunk(cursor, buffer)
+        if show_progress:
+            self.progress_bar(total, total, prefix='Staging', length=50)
+        if progress is not None:
+            progress(processed=read, total=total, errors=len(errors))
+
+        return staged, errors
+
+    def copy_chunk(self, cursor, buffer: StringIO):
+        if not buffer.tell():
+            return
+
+        buffer.seek(0)
+        cursor.copy_expert(
+            f'COPY {self.staging_table} (line, id, name, category_name, active)'
+            ' FROM STDIN WITH (FORMAT csv)',
+            buffer,
+        )
+        buffer.seek(0)
+        buffer.truncate()
+
+    def merge_categories(self, cursor) -> int:
+        """ Creates categories not found by name, returning how many """
+        table = connection.ops.quote_name(Category._meta.db_table)
+        cursor.execute(
+            f'INSERT INTO {table} (id, name, active, created_at, updated_at)'
+            ' SELECT gen_random_uuid(), s.category_name, true, now(), now()'
+            f' FROM (SELECT DISTINCT category_name FROM {self.staging_table}) s'
+            f' WHERE NOT EXISTS (SELECT 1 FROM {table} c WHERE c.name = s.category_name)'
+        )
+        return cursor.rowcount
+
+    def merge_products(self, cursor) -> int:
+        """
+        Inserts products, updating the ones whose pk exists. When a pk is
+        repeated in the file, its last row wins; when category names are
+        repeated in the database, the oldest category is used.
+        """
+        table = connection.ops.quote_name(Product._meta.db_table)
+        category_table = connection.ops.quote_name(Category._meta.db_table)
+        cursor.execute(
+            f'INSERT INTO {table} (id, name, active, category_id, created_at, updated_at)'
+            ' SELECT DISTINCT ON (s.id) s.id, s.name, s.active, c.id, now(), now()'
+            f' FROM {self.staging_table} s'
+            ' JOIN ('
+            '  SELECT DISTINCT ON (name) id, name'
+            f'  FROM {category_table} ORDER BY name, created_at'
+            ' ) c ON c.name = s.category_name'
+            ' ORDER BY s.id, s.line DESC'
+            ' ON CONFLICT (id) DO UPDATE SET'
+            ' name = EXCLUDED.name,'
+            ' active = EXCLUDED.active,'
+            ' category_id = EXCLUDED.category_id,'
+            ' updated_at = EXCLUDED.updated_at'
+        )
+        return cursor.rowcount
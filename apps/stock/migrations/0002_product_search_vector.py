@@ -0,0 +1,83 @@
+from django.contrib.postgres.operations import UnaccentExtension
+from django.db import migrations
+
+# Text search configurations products are indexed in, one per language of
+# `settings.LANGUAGES` (see `settings.SEARCH_CONFIGS`). Lexemes of every
+# configuration go to the same vector, so a query parsed in the language of
+# the request matches its own stems.
+SEARCH_VECTOR_SQL = """
+CREATE FUNCTION stock_product_search_vector(product_name text, category_name text)
+RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT setweight(to_tsvector('english', unaccent(coalesce(product_name, ''))), 'A')
+        || setweight(to_tsvector('portuguese', unaccent(coalesce(product_name, ''))), 'A')
+        || setweight(to_tsvector('english', unaccent(coalesce(category_name, ''))), 'B')
+        || setweight(to_tsvector('portuguese', unaccent(coalesce(category_name, ''))), 'B')
+$$;
+
+ALTER TABLE stock_product ADD COLUMN search_vector tsvector;
+
+UPDATE stock_product p
+SET search_vector = stock_product_search_vector(p.name, c.name)
+FROM stock_category c
+WHERE c.id = p.category_id;
+
+CREATE INDEX stock_product_search_vector_idx ON stock_product USING gin (search_vector);
+
+CREATE FUNCTION stock_product_search_vector_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := stock_product_search_vector(
+        NEW.name,
+        (SELECT name FROM stock_category WHERE id = NEW.category_id)
+    );
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER stock_product_search_vector
+BEFORE INSERT OR UPDATE OF name, category_id ON stock_product
+FOR EACH ROW EXECUTE FUNCTION stock_product_search_vector_trigger();
+
+CREATE FUNCTION stock_category_search_vector_trigger() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF NEW.name IS DISTINCT FROM OLD.name THEN
+        UPDATE stock_product
+        SET search_vector = stock_product_search_vector(name, NEW.name)
+        WHERE category_id = NEW.id;
+    END IF;
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER stock_category_search_vector
+AFTER UPDATE OF name ON stock_category
+FOR EACH ROW EXECUTE FUNCTION stock_category_search_vector_trigger();
+"""
+
+DROP_SEARCH_VECTOR_SQL = """
+DROP TRIGGER stock_category_search_vector ON stock_category;
+DROP FUNCTION stock_category_search_vector_trigger();
+DROP TRIGGER stock_product_search_vector ON stock_product;
+DROP FUNCTION stock_product_search_vector_trigger();
+DROP INDEX stock_product_search_vector_idx;
+ALTER TABLE stock_product DROP COLUMN search_vector;
+DROP FUNCTION stock_product_search_vector(text, text);
+"""
+
+
+class Migration(migrations.Migration):
+    """
+    Stored full-text search vector of products, over their name and the name
+    of their category, unaccented and weighted (product name first). It is
+    kept by triggers rather than signals, so bulk writes and imports by COPY
+    keep it up to date as well. It is not a model field: it is only read by
+    `core.filters.FullTextSearchFilter`.
+    """
+
+    dependencies = [
+        ('stock', '0001_initial'),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        migrations.RunSQL(SEARCH_VECTOR_SQL, DROP_SEARCH_VECTOR_SQL),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.13 on 2026-10-18 07:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock', '0003_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['name', 'id'], name='stock_category_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'name', 'id'], name='stock_product_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('active', True)), fields=['category', 'name', 'id'], name='stock_product_active_idx'),
+        ),
+        # The foreign key index is dropped once the listing index covers it
+        migrations.AlterField(
+            model_name='product',
+            name='category',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, to='stock.category', verbose_name='Category'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from core.models import mixins
@@ -20,6 +22,12 @@ class Category(mixins.UUIDPkMixin,
         verbose_name = _('Category')
         verbose_name_plural = _('Categories')
         ordering = ['name']
+        indexes = [
+            # Listing order, as paginated by keyset: (name, id)
+            models.Index(fields=['name', 'id'], name='stock_category_listing_idx'),
+            # Trigrams of UPPER(name), as compared by icontains and typeahead lookups
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='stock_category_name_trgm_idx'),
+        ]
 
     name = models.CharField(
         max_length=100,
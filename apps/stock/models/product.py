@@ -1,5 +1,7 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 from core.models import mixins
@@ -11,15 +13,30 @@ class Product(mixins.UUIDPkMixin,
               mixins.EntityMixin,
               mixins.DomainRuleMixin,
               mixins.DeletableModelMixin,
+              mixins.ChangeTrackerMixin,
               models.Model):
     """
     Product to be stored in stock
     """
+    track_changes = True
 
     class Meta:
         verbose_name = _('Product')
         verbose_name_plural = _('Products')
         ordering = ['category_id', 'name']
+        indexes = [
+            # Listing order, as paginated by keyset: (category_id, name, id).
+            # It serves lookups by category as well, so the foreign key is not
+            # indexed on its own.
+            models.Index(fields=['category', 'name', 'id'], name='stock_product_listing_idx'),
+            models.Index(
+                fields=['category', 'name', 'id'],
+                condition=models.Q(active=True),
+                name='stock_product_active_idx',
+            ),
+            # Trigrams of UPPER(name), as compared by icontains and typeahead lookups
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='stock_product_name_trgm_idx'),
+        ]
 
     name = models.CharField(
         max_length=100,
@@ -32,6 +49,7 @@ class Product(mixins.UUIDPkMixin,
     category = models.ForeignKey(
         'Category',
         on_delete=models.PROTECT,
+        db_index=False,
         verbose_name=_('Category'),
         null=False,
         blank=False,
@@ -1 +1,2 @@
+from .category_signals import *
 from .product_signals import *
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.stock.models import Category
+from core.cache import bump_generation
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def cache_generation_handler(instance: Category, **kwargs) -> None:
+    bump_generation(Category)
@@ -1,7 +1,8 @@
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 
 from apps.stock.models import Product
+from core.cache import bump_generation
 
 
 @receiver(pre_save, sender=Product)
@@ -20,3 +21,9 @@ def post_save_handler(instance: Product, raw: bool, **kwargs) -> None:
         return
 
     print(f'This is a signal for post-save dispatch for {instance.__class__.__name__}')
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def cache_generation_handler(instance: Product, **kwargs) -> None:
+    bump_generation(Product)
@@ -0,0 +1,53 @@
+import os
+from io import StringIO
+
+from celery import shared_task
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+
+from core.bulk import PROGRESS_STATE, run_bulk_job
+from .api import serializers
+
+
+@shared_task(bind=True)
+def process_bulk_job(self, serializer_name: str, method: str, items: list, chunk_size: int = 500) -> dict:
+    """
+    Processes items of a bulk request (see `BulkViewsetMixin`) through the
+    stock serializer named `serializer_name`.
+    """
+    serializer_class = getattr(serializers, serializer_name)
+    return run_bulk_job(self, serializer_class, method, items, chunk_size=chunk_size)
+
+
+@shared_task(bind=True)
+def import_stock_file(self, name: str, file_format: str, chunk_size: int = 10000) -> dict:
+    """
+    Imports products from a file saved in the default storage (see the
+    `import_stock` command), removing it afterwards. Progress is reported as
+    the `PROGRESS` state of the task, with processed, total and errors rows
+    as meta, after each chunk is staged.
+    """
+    def progress(**meta):
+        self.update_state(state=PROGRESS_STATE, meta=meta)
+
+    output, errors = StringIO(), StringIO()
+    try:
+        call_command(
+            'import_stock',
+            default_storage.path(name),
+            format=file_format,
+            chunk_size=chunk_size,
+            progress=progress,
+            interactive=False,
+            verbosity=0,
+            stdout=output,
+            stderr=errors,
+        )
+    finally:
+        default_storage.delete(name)
+
+    return {
+        'file': os.path.basename(name),
+        'summary': output.getvalue().strip(),
+        'errors': errors.getvalue().splitlines(),
+    }
@@ -0,0 +1,89 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.stock.models import Category
+from apps.stock.tests.mocks import MockStockFactory
+from core.queries import QueryBudgetAPIClient
+
+mock_factory = MockStockFactory()
+
+
+class CategoryAPIEndpointsTestCase(APITestCase):
+    client_class = QueryBudgetAPIClient
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_bulk_creation(self):
+        """ Tests creation of many records at once """
+        items = [mock_factory.fake_category_data() for _ in range(3)]
+
+        endpoint = reverse('stock:category-bulk')
+        response = self.client.post(endpoint, data=items, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertListEqual(
+            sorted(i['name'] for i in response.json()),
+            sorted(Category.objects.values_list('name', flat=True)),
+        )
+
+    def test_retrieval_not_found(self):
+        """ Tests malformed and unknown pks are answered with 404 """
+        for pk in ('not-a-uuid', str(uuid4())):
+            response = self.client.get(reverse('stock:category-detail', kwargs={'pk': pk}))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_bulk_deletion_of_protected_records(self):
+        """ Tests nothing is deleted when any record is protected """
+        with self.captureOnCommitCallbacks(execute=True):
+            category = mock_factory.fake_category(persist=True)
+            protected_category = mock_factory.fake_product(persist=True).category
+
+        endpoint = reverse('stock:category-bulk')
+        response = self.client.delete(
+            endpoint,
+            data=[str(category.pk), str(protected_category.pk)],
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()['errors']
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]['index'], 1)
+        self.assertEqual(Category.objects.count(), 2)
+
+    def test_deletability_is_output_when_requested(self):
+        """ Tests is_deletable is only output on request, with no query per record """
+        with self.captureOnCommitCallbacks(execute=True):
+            category = mock_factory.fake_category(persist=True)
+            protected_category = mock_factory.fake_product(persist=True).category
+
+        endpoint = reverse('stock:category-list')
+        response = self.client.get(endpoint)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('is_deletable', response.json()['results'][0])
+
+        with CaptureQueriesContext(connection) as few_records_queries:
+            response = self.client.get(endpoint, data={'fields': 'pk,is_deletable'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            {r['pk']: r['is_deletable'] for r in response.json()['results']},
+            {str(category.pk): True, str(protected_category.pk): False},
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                mock_factory.fake_product(persist=True)
+
+        with CaptureQueriesContext(connection) as many_records_queries:
+            response = self.client.get(endpoint, data={'fields': 'pk,is_deletable'})
+
+        self.assertEqual(len(response.json()['results']), 5)
+        self.assertEqual(len(few_records_queries), len(many_records_queries))
@@ -0,0 +1,79 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase
+
+from apps.stock.models import Category, Product
+from core.bench import percentile
+
+CASES = ['list', 'filtered_list', 'detail', 'create', 'patch', 'delete']
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Seeding requires PostgreSQL')
+class BenchStockCommandTestCase(TestCase):
+    def _bench(self, **options) -> dict:
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        call_command(
+            'bench_stock',
+            in_place=True,
+            products=30,
+            categories=3,
+            iterations=3,
+            warmup=1,
+            memory_iterations=1,
+            output=path,
+            verbosity=0,
+            stdout=StringIO(),
+            stderr=StringIO(),
+            **options,
+        )
+
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_report(self):
+        """ Tests every case is measured on the seeded volumes """
+        report = self._bench()
+
+        self.assertEqual(Category.objects.count(), 3)
+        self.assertEqual(report['meta']['products'], 30)
+        self.assertListEqual(list(report['results'].keys()), CASES)
+
+        for name, result in report['results'].items():
+            self.assertEqual(result['iterations'], 3)
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+            self.assertLessEqual(result['p95_ms'], result['p99_ms'])
+            self.assertGreater(result['memory_kib'], 0)
+
+        self.assertGreater(report['results']['create']['queries'], 0)
+        self.assertEqual(Product.objects.count(), 30 + 3 + 1 + 1)
+
+        self.assertEqual(percentile([4, 1, 3, 2], 50), 2.5)
+
+    def test_regressions(self):
+        """ Tests runs fail when worse than the baseline beyond the threshold """
+        report = self._bench(cases=['detail'], cold=True)
+        result = report['results']['detail']
+
+        fd, baseline_path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(report, f)
+        self.addCleanup(os.remove, baseline_path)
+
+        self._bench(cases=['detail'], cold=True, baseline=baseline_path, threshold=100000)
+
+        result['queries'] = result['max_queries'] = 0
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f)
+
+        with self.assertRaisesMessage(CommandError, 'regressions over the baseline'):
+            self._bench(cases=['detail'], cold=True, baseline=baseline_path, threshold=100000)
@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock, skipUnless
+from uuid import uuid4
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from apps.stock import tasks
+from apps.stock.models import Category, Product
+from apps.stock.tests.mocks import MockStockFactory
+from core.bulk import PROGRESS_STATE
+
+mock_factory = MockStockFactory()
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Importing requires PostgreSQL COPY')
+class ImportStockCommandTestCase(TestCase):
+    def _write_file(self, suffix: str, content: str) -> str:
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def _import(self, path: str) -> str:
+        stdout = StringIO()
+        call_command('import_stock', path, interactive=False, verbosity=0, stdout=stdout, stderr=StringIO())
+        return stdout.getvalue()
+
+    def test_import_csv(self):
+        """ Tests products are created with categories resolved by name """
+        category = mock_factory.fake_category(persist=True)
+        path = self._write_file('.csv', '\n'.join([
+            'name,category,active',
+            f'Hammer,{category.name},true',
+            'Screw,Hardware,false',
+            'Nail,Hardware,',
+            ',Hardware,true',
+        ]))
+
+        output = self._import(path)
+
+        self.assertIn('3 rows imported, 1 skipped', output)
+        self.assertEqual(Category.objects.count(), 2)
+        self.assertEqual(Product.objects.get(name='Hammer').category_id, category.pk)
+        self.assertFalse(Product.objects.get(name='Screw').active)
+        self.assertEqual(Product.objects.get(name='Nail').category.name, 'Hardware')
+
+    def test_import_ndjson_updates_existing_products(self):
+        """ Tests products found by pk are updated, last row winning """
+        product = mock_factory.fake_product(persist=True)
+        new_pk = str(uuid4())
+        rows = [
+            {'pk': str(product.pk), 'name': 'Renamed', 'category': {'name': product.category.name}},
+            {'pk': new_pk, 'name': 'First', 'active': True, 'category': {'name': 'Tools'}},
+            {'pk': new_pk, 'name': 'Last', 'active': True, 'category': {'name': 'Tools'}},
+        ]
+        path = self._write_file('.ndjson', '\n'.join(json.dumps(r) for r in rows))
+
+        self._import(path)
+
+        self.assertEqual(Product.objects.count(), 2)
+        self.assertEqual(Product.objects.get(pk=product.pk).name, 'Renamed')
+        self.assertEqual(Product.objects.get(pk=new_pk).name, 'Last')
+        self.assertEqual(Product.objects.get(pk=new_pk).category.name, 'Tools')
+
+    def test_import_task_progress(self):
+        """ Tests the import task reports its progress after each chunk """
+        rows = [{'name': f'Product {i}', 'category': 'Tools'} for i in range(5)]
+        rows.insert(2, {'name': '', 'category': 'Tools'})
+        name = default_storage.save(
+            f'imports/{uuid4()}.ndjson',
+            ContentFile('\n'.join(json.dumps(r) for r in rows)),
+        )
+
+        with mock.patch.object(tasks.import_stock_file, 'update_state') as update_state:
+            result = tasks.import_stock_file.apply(args=(name, 'ndjson'), kwargs={'chunk_size': 2}).get()
+
+        self.assertEqual(Product.objects.count(), 5)
+        self.assertListEqual(result['errors'], ['Line 3: Product name must have from 1 to 100 characters.'])
+        self.assertFalse(default_storage.exists(name))
+
+        self.assertListEqual(
+            [call.kwargs for call in update_state.call_args_list],
+            [
+                {'state': PROGRESS_STATE, 'meta': {'processed': 2, 'total': 6, 'errors': 0}},
+                {'state': PROGRESS_STATE, 'meta': {'processed': 5, 'total': 6, 'errors': 1}},
+                {'state': PROGRESS_STATE, 'meta': {'processed': 6, 'total': 6, 'errors': 1}},
+            ],
+        )
@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.stock.tests.mocks import MockStockFactory
+
+mock_factory = MockStockFactory()
+
+
+class PerformanceMiddlewareTestCase(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    @staticmethod
+    def _get_timings(response) -> dict:
+        timings = dict()
+        for timing in response['Server-Timing'].split(', '):
+            name, *params = timing.split(';')
+            timings[name] = dict(p.split('=', 1) for p in params)
+        return timings
+
+    @staticmethod
+    def _get_sample(name: str, **labels) -> float:
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    @override_settings(SERVER_TIMING=True)
+    def test_server_timing(self):
+        """ Tests requests answer their total, database, serializer and form timings """
+        category = mock_factory.fake_category(persist=True)
+        mock_factory.fake_product(persist=True, category=category)
+
+        response = self.client.get(reverse('stock:product-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        timings = self._get_timings(response)
+        self.assertListEqual(list(timings)[:2], ['total', 'db'])
+        self.assertEqual(timings['db']['desc'], '"3 queries"')
+        self.assertIn('serializer', timings)
+        self.assertGreaterEqual(float(timings['total']['dur']), float(timings['db']['dur']))
+
+        data = {'name': 'Kettle', 'active': True, 'category': str(category.pk)}
+        response = self.client.post(reverse('stock:product-list'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('form', self._get_timings(response))
+
+        with override_settings(SERVER_TIMING=False):
+            response = self.client.get(reverse('stock:product-list'))
+        self.assertFalse(response.has_header('Server-Timing'))
+
+    def test_server_timing_off_by_default(self):
+        """ Tests timings are only answered under DEBUG unless enabled """
+        with self.settings():
+            del settings.SERVER_TIMING
+            self.assertFalse(self.client.get(reverse('stock:category-list')).has_header('Server-Timing'))
+            with override_settings(DEBUG=True):
+                self.assertTrue(self.client.get(reverse('stock:category-list')).has_header('Server-Timing'))
+
+    def test_route_metrics(self):
+        """ Tests requests are recorded in per-route histograms served by /metrics """
+        labels = {'route': 'stock:category-list', 'method': 'GET'}
+        requests = self._get_sample('django_http_request_duration_seconds_count', status='200', **labels)
+        queries = self._get_sample('django_http_request_db_queries_sum', **labels)
+
+        self.client.get(reverse('stock:category-list'))
+        # Served from the response cache, without queries
+        self.client.get(reverse('stock:category-list'))
+
+        self.assertEqual(self._get_sample('django_http_request_duration_seconds_count', status='200', **labels), requests + 2)
+        self.assertEqual(self._get_sample('django_http_request_db_queries_sum', **labels), queries + 3)
+        self.assertEqual(self._get_sample('django_http_request_phase_duration_seconds_count', phase='db', **labels), requests + 2)
+
+        # Without a token, metrics are only served under DEBUG
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_404_NOT_FOUND)
+        with override_settings(DEBUG=True):
+            response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertIn(
+            'django_http_request_duration_seconds_count{method="GET",route="stock:category-list",status="200"}',
+            response.content.decode(),
+        )
+
+        with override_settings(METRICS_TOKEN='scraper-token'):
+            self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_401_UNAUTHORIZED)
+            response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scraper-token')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,115 @@
+import time
+from unittest import mock
+
+from celery import signals
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.stock import tasks
+from apps.stock.api.viewsets import ProductViewSet
+from core.profiling import StackSampler, add_profile, make_profile_token
+
+
+def slow_get_queryset(viewset):
+    time.sleep(0.05)
+    return viewset.queryset.all()
+
+
+@override_settings(PROFILING_INTERVAL=0.001)
+class ProfilingTestCase(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        user_model = get_user_model()
+        self.staff = user_model.objects.create_user('staff', password='staff', is_staff=True)
+        self.user = user_model.objects.create_user('user', password='user')
+
+    def _get_products(self, **extra):
+        with mock.patch.object(ProductViewSet, 'get_queryset', slow_get_queryset):
+            return self.client.get(reverse('stock:product-list'), **extra)
+
+    def test_profiled_requests(self):
+        """ Tests requests sending a staff profile token or sampled are profiled """
+        self.client.force_authenticate(self.staff)
+        response = self.client.post(reverse('profiling:profile-token'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token = response.json()['token']
+        self.client.force_authenticate(None)
+
+        self.assertFalse(self._get_products().has_header('X-Profile-Id'))
+        self.assertFalse(self._get_products(HTTP_X_PROFILE_TOKEN=f'{token}x').has_header('X-Profile-Id'))
+        user_token = make_profile_token(self.user)
+        self.assertFalse(self._get_products(HTTP_X_PROFILE_TOKEN=user_token).has_header('X-Profile-Id'))
+
+        response = self._get_products(HTTP_X_PROFILE_TOKEN=token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_id = response['X-Profile-Id']
+
+        self.client.force_authenticate(self.staff)
+        profile = self.client.get(reverse('profiling:profile-detail', args=[profile_id])).json()
+        self.assertEqual(profile['kind'], 'request')
+        self.assertEqual(profile['name'], 'stock:product-list')
+        self.assertEqual(profile['status'], 200)
+        self.assertGreater(profile['samples'], 0)
+        self.assertTrue(any(
+            'rest_framework.views:dispatch' in stack and stack.endswith(f'{__name__}:slow_get_queryset')
+            for stack in profile['stacks']
+        ))
+
+        self.client.force_authenticate(None)
+        with override_settings(PROFILING_SAMPLE_RATE=1.0):
+            self.assertTrue(self._get_products().has_header('X-Profile-Id'))
+
+        # Tokens are read from the query string as well
+        response = self._get_products(data={'profile': token})
+        self.assertTrue(response.has_header('X-Profile-Id'))
+
+    def test_profiled_tasks(self):
+        """ Tests selected Celery tasks are profiled """
+        task = tasks.import_stock_file
+        with override_settings(PROFILING_TASKS=[task.name]):
+            signals.task_prerun.send(sender=task, task_id='job', task=task)
+            time.sleep(0.02)
+            signals.task_postrun.send(sender=task, task_id='job', task=task, state='SUCCESS')
+
+        self.client.force_authenticate(self.staff)
+        profiles = self.client.get(reverse('profiling:profile-list')).json()
+        self.assertEqual(len(profiles), 1)
+        self.assertEqual(profiles[0]['kind'], 'task')
+        self.assertEqual(profiles[0]['name'], task.name)
+        self.assertEqual(profiles[0]['task_id'], 'job')
+        self.assertEqual(profiles[0]['status'], 'SUCCESS')
+
+    def test_profile_buffer(self):
+        """ Tests profiles are kept in a bounded buffer, listed and downloaded by staff only """
+        with StackSampler(interval=0.001) as sampler:
+            time.sleep(0.02)
+
+        with override_settings(PROFILING_BUFFER_SIZE=2):
+            ids = [add_profile('request', f'view-{i}', sampler) for i in range(3)]
+
+            self.assertEqual(self.client.get(reverse('profiling:profile-list')).status_code, status.HTTP_403_FORBIDDEN)
+            self.client.force_authenticate(self.user)
+            self.assertEqual(self.client.get(reverse('profiling:profile-list')).status_code, status.HTTP_403_FORBIDDEN)
+
+            self.client.force_authenticate(self.staff)
+            profiles = self.client.get(reverse('profiling:profile-list')).json()
+            self.assertListEqual([p['id'] for p in profiles], [ids[2], ids[1]])
+            self.assertNotIn('stacks', profiles[0])
+
+            response = self.client.get(reverse('profiling:profile-detail', args=[ids[0]]))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+            response = self.client.get(reverse('profiling:profile-download', args=[ids[2]]))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Disposition'], f'attachment; filename="profile-{ids[2]}.folded"')
+
+        lines = response.content.decode().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, samples = line.rsplit(' ', 1)
+            self.assertIn(f'{__name__}:test_profile_buffer', stack)
+            self.assertGreater(int(samples), 0)
@@ -1,18 +1,42 @@
+import json
 from random import choice
 from typing import Dict
+from uuid import uuid4
 
+from unittest import mock, skipUnless
+
+from celery.backends.cache import CacheBackend
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
 
 from apps.stock.api.serializers import SimpleCategorySerializer, ProductSerializer
+from apps.stock import tasks
+from apps.stock.api.viewsets import ProductViewSet
 from apps.stock.models import Product
 from apps.stock.tests.mocks import MockStockFactory
+from core.cache import get_generations
+from core.models.mixins import IntegrityRuleChecker, RuleIntegrityError
+from core.pagination import CountStrategy
+from core.queries import QueryBudgetAPIClient, QueryBudgetExceeded, QueryInspector
+from core.renderers import FastJSONRenderer
+from project.celery import app as celery_app
 
 mock_factory = MockStockFactory()
 
 
 class ProductAPIEndpointsTestCase(APITestCase):
+    client_class = QueryBudgetAPIClient
+
+    def setUp(self) -> None:
+        cache.clear()
+
     def _create_product_data(self) -> dict:
         data = mock_factory.fake_product_data()
         category = mock_factory.fake_category(persist=True)
@@ -68,6 +92,336 @@ class ProductAPIEndpointsTestCase(APITestCase):
             self.assertIsNotNone(item['created_at'])
             self.assertIsNotNone(item['updated_at'])
 
+    def test_retrieval_collection_queries(self):
+        """ Tests number of queries does not grow with number of records listed """
+        endpoint = reverse('stock:product-list')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_collection(num=2, persist=True)
+        with CaptureQueriesContext(connection) as small_page_queries:
+            self.client.get(endpoint)
+
+        # Caches are invalidated once writes commit
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_collection(num=20, persist=True)
+
+        with CaptureQueriesContext(connection) as large_page_queries:
+            response = self.client.get(endpoint)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 22)
+        self.assertEqual(len(small_page_queries), len(large_page_queries))
+
+    def test_query_budgets(self):
+        """ Tests requests over the query budget of their action fail, and repeated queries are spotted """
+        categories = [mock_factory.fake_category(persist=True) for _ in range(3)]
+        for category in categories:
+            self._create_collection(num=4, persist=True, category=category)
+
+        endpoint = reverse('stock:product-list')
+        with QueryInspector() as inspector:
+            response = self.client.get(f'{endpoint}?fields=pk,name,category')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLessEqual(inspector.count, ProductViewSet.query_budgets['list'])
+        self.assertListEqual(inspector.get_repeated_shapes(), [])
+
+        with QueryInspector() as inspector:
+            for category in categories:
+                Product.objects.filter(category=category).first()
+
+        shape, times = inspector.get_repeated_shapes()[0]
+        self.assertEqual(times, 3)
+        self.assertIn('"stock_product"."category_id" = ?', shape)
+
+        with mock.patch.dict(ProductViewSet.query_budgets, {'list': 1}):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get(f'{endpoint}?count=exact')
+
+    def test_query_inspector_middleware(self):
+        """ Tests the development middleware reports query counts, N+1 patterns and exceeded budgets """
+        middleware = [*settings.MIDDLEWARE, 'core.middleware.QueryInspectorMiddleware']
+        product = self._create_product(persist=True)
+        endpoint = reverse('stock:product-detail', args=[product.pk])
+        # Budgets are reported, not enforced
+        client = APIClient()
+
+        cache.clear()
+        with override_settings(MIDDLEWARE=middleware):
+            response = client.get(endpoint)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(int(response['X-Query-Count']), 2)
+
+            with mock.patch.dict(ProductViewSet.query_budgets, {'retrieve': 1}), \
+                    self.assertLogs('core.queries', level='WARNING') as logs:
+                cache.clear()
+                client.get(endpoint)
+
+        self.assertIn('over its budget of 1', logs.output[0])
+
+    def test_retrieval_collection_pagination(self):
+        """ Tests walking through pages of records forwards and backwards """
+        category = mock_factory.fake_category(persist=True)
+        self._create_collection(num=4, persist=True, category=category, name='Same name')
+        self._create_collection(num=3, persist=True)
+
+        expected_pks = [
+            str(pk) for pk in Product.objects.order_by('category_id', 'name', 'id').values_list('pk', flat=True)
+        ]
+
+        pks = list()
+        next_endpoint = f"{reverse('stock:product-list')}?limit=3"
+        while next_endpoint:
+            response = self.client.get(next_endpoint)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            resp_data = response.json()
+            self.assertLessEqual(len(resp_data['results']), 3)
+            pks += [item['pk'] for item in resp_data['results']]
+            last_page = resp_data
+            next_endpoint = resp_data['next']
+
+        self.assertListEqual(pks, expected_pks)
+
+        response = self.client.get(last_page['previous'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        resp_data = response.json()
+        self.assertListEqual([item['pk'] for item in resp_data['results']], expected_pks[3:6])
+
+        response = self.client.get(f"{reverse('stock:product-list')}?cursor=invalid")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieval_collection_count(self):
+        """ Tests cached counts of filtered records are refreshed on writes """
+        with self.captureOnCommitCallbacks(execute=True):
+            category = mock_factory.fake_category(persist=True)
+            self._create_collection(num=3, persist=True, category=category)
+            self._create_collection(num=2, persist=True)
+
+        endpoint = f"{reverse('stock:product-list')}?category={category.pk}"
+        response = self.client.get(endpoint)
+        self.assertEqual(response.json()['count'], 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(endpoint)
+        self.assertEqual(response.json()['count'], 3)
+        self.assertFalse([q for q in queries if 'COUNT(' in q['sql']])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_product(persist=True, category=category)
+        response = self.client.get(endpoint)
+        self.assertEqual(response.json()['count'], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.filter(category=category).first().delete(ignore_validation=True)
+        response = self.client.get(endpoint)
+        self.assertEqual(response.json()['count'], 3)
+
+        response = self.client.get(f'{endpoint}&count=exact')
+        self.assertEqual(response.json()['count'], 3)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Row estimates are read from PostgreSQL catalog')
+    def test_retrieval_collection_estimated_count(self):
+        """ Tests unfiltered collections count from planner estimates """
+        self._create_collection(num=5, persist=True)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Product._meta.db_table}')
+
+        self.assertEqual(CountStrategy.get_estimated_count(Product.objects.all()), 5)
+
+    def test_retrieval_cached_responses(self):
+        """ Tests repeated reads are served from cache until records are written """
+        with self.captureOnCommitCallbacks(execute=True):
+            instance = self._create_product(persist=True)
+        list_endpoint = f"{reverse('stock:product-list')}?fields=pk,name&active=true"
+        detail_endpoint = reverse('stock:product-detail', kwargs={'pk': str(instance.pk)})
+
+        self.client.get(list_endpoint)
+        self.client.get(detail_endpoint)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                f"{reverse('stock:product-list')}?active=true&fields=name,pk"
+            )
+            self.client.get(detail_endpoint)
+
+        self.assertListEqual(response.json()['results'], [{'pk': str(instance.pk), 'name': instance.name}])
+        self.assertFalse([q for q in queries if 'SELECT' in q['sql']])
+
+        instance.category.name = 'renamed'
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.category.save(ignore_validation=True)
+
+        response = self.client.get(detail_endpoint)
+        self.assertEqual(response.json()['category']['name'], 'renamed')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(detail_endpoint, data={'name': 'renamed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(list_endpoint)
+        self.assertEqual(response.json()['results'][0]['name'], 'renamed')
+
+    def test_retrieval_cached_responses_by_host(self):
+        """ Tests cached pages are not shared by hosts and schemes, as their links are absolute """
+        self._create_collection(num=2, persist=True)
+        endpoint = f"{reverse('stock:product-list')}?limit=1"
+
+        self.assertTrue(self.client.get(endpoint).json()['next'].startswith('http://testserver/'))
+        response = self.client.get(endpoint, HTTP_HOST='stock.example.com', secure=True)
+        self.assertTrue(response.json()['next'].startswith('https://stock.example.com/'))
+
+    def test_cache_invalidation_on_commit(self):
+        """ Tests cached reads are invalidated when writes commit, not before """
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_product(persist=True)
+        endpoint = reverse('stock:product-list')
+        self.assertEqual(self.client.get(endpoint).json()['count'], 1)
+        generations = get_generations(Product._meta.db_table)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(endpoint, data=self._create_product_data(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(callbacks)
+
+        # Reads before the commit are still served from cache
+        self.assertTupleEqual(get_generations(Product._meta.db_table), generations)
+        self.assertEqual(self.client.get(endpoint).json()['count'], 1)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertNotEqual(get_generations(Product._meta.db_table), generations)
+        self.assertEqual(self.client.get(endpoint).json()['count'], 2)
+
+    def test_retrieval_conditional_requests(self):
+        """ Tests unchanged records are answered with 304 Not Modified """
+        with self.captureOnCommitCallbacks(execute=True):
+            instance = self._create_product(persist=True)
+            self._create_collection(num=2, persist=True)
+        list_endpoint = reverse('stock:product-list')
+        detail_endpoint = reverse('stock:product-detail', kwargs={'pk': str(instance.pk)})
+
+        for endpoint in (list_endpoint, detail_endpoint):
+            response = self.client.get(endpoint)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            response = self.client.get(endpoint, HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+            other_response = self.client.get(f'{endpoint}?fields=pk')
+            self.assertNotEqual(response['ETag'], other_response['ETag'])
+
+        # Lists are validated by ETag alone
+        response = self.client.get(detail_endpoint)
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(
+            self.client.get(detail_endpoint, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        response = self.client.get(list_endpoint)
+        self.assertNotIn('Last-Modified', response)
+        self.assertEqual(
+            self.client.get(list_endpoint, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT').status_code,
+            status.HTTP_200_OK,
+        )
+
+        # Renaming the category changes both
+        list_etag = self.client.get(list_endpoint)['ETag']
+        detail_etag = self.client.get(detail_endpoint)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                reverse('stock:category-detail', kwargs={'pk': str(instance.category.pk)}),
+                data={'name': 'renamed category'},
+                format='json',
+            )
+
+        response = self.client.get(detail_endpoint, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['category']['name'], 'renamed category')
+        response = self.client.get(list_endpoint, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        list_etag = self.client.get(list_endpoint)['ETag']
+        detail_etag = self.client.get(detail_endpoint)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(detail_endpoint, data={'name': 'renamed'}, format='json')
+
+        response = self.client.get(detail_endpoint, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['name'], 'renamed')
+
+        response = self.client.get(list_endpoint, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        list_etag = response['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Product.objects.exclude(pk=instance.pk).first().delete(ignore_validation=True)
+        response = self.client.get(list_endpoint, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 2)
+
+    def test_retrieval_not_found(self):
+        """ Tests malformed and unknown pks are answered with 404 """
+        for pk in ('not-a-uuid', str(uuid4())):
+            response = self.client.get(reverse('stock:product-detail', kwargs={'pk': pk}))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieval_collection_streaming(self):
+        """ Tests large pages are streamed with the same output """
+        self._create_collection(num=3, persist=True)
+        endpoint = f"{reverse('stock:product-list')}?limit=2"
+
+        response = self.client.get(endpoint)
+        self.assertFalse(response.streaming)
+        expected = response.json()
+
+        with mock.patch.object(ProductViewSet, 'stream_min_page_size', 2):
+            response = self.client.get(f'{endpoint}&active=true')
+            self.assertTrue(response.streaming)
+            self.assertEqual(response['Content-Type'], 'application/json')
+            streamed = json.loads(b''.join(response.streaming_content))
+
+            response = self.client.get(f"{endpoint}&fields=pk,is_deletable")
+            self.assertTrue(response.streaming)
+            self.assertEqual(len(json.loads(b''.join(response.streaming_content))['results']), 2)
+
+        self.assertEqual(streamed['count'], expected['count'])
+        self.assertListEqual(streamed['results'], expected['results'])
+        self.assertIsNotNone(streamed['next'])
+
+        data = ProductSerializer(instance=Product.objects.all(), many=True).data
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_export(self):
+        """ Tests filtered records are streamed as NDJSON and CSV """
+        category = mock_factory.fake_category(persist=True)
+        instances = self._create_collection(num=3, persist=True, category=category)
+        self._create_collection(num=2, persist=True)
+        endpoint = reverse('stock:product-export')
+
+        response = self.client.get(endpoint, data={'format': 'ndjson', 'category': str(category.pk)})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertListEqual(sorted(r['pk'] for r in rows), sorted(instances.keys()))
+        self.assertTrue(all(r['category']['name'] == category.name for r in rows))
+
+        response = self.client.get(endpoint, data={'format': 'csv', 'fields': 'pk,category.name'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'pk,category.name')
+        self.assertEqual(len(lines), 6)
+
+        response = self.client.get(endpoint, data={'format': 'ndjson', 'fields': 'pk,is_deletable'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertTrue(all(r['is_deletable'] is True for r in rows))
+
     def test_creation(self):
         """ Tests creation of a record """
         data = self._create_product_data()
@@ -151,6 +505,159 @@ class ProductAPIEndpointsTestCase(APITestCase):
 
         self.assertNotIn(str(instance.pk), retrieved_pks)
 
+    def test_bulk_creation(self):
+        """ Tests creation of many records at once """
+        items = [self._create_product_data() for _ in range(3)]
+        items[1]['category'] = items[1]['category']['pk']
+
+        endpoint = reverse('stock:product-bulk')
+        response = self.client.post(endpoint, data=items, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        resp_data = response.json()
+        self.assertEqual(len(resp_data), 3)
+        self.assertEqual(Product.objects.count(), 3)
+
+        for data, result in zip(items, resp_data):
+            self.assertIsNotNone(result['pk'])
+            self.assertEqual(data['name'], result['name'])
+            self.assertIsNotNone(result['created_at'])
+            self.assertIsNotNone(result['updated_at'])
+
+    def test_bulk_creation_errors(self):
+        """ Tests nothing is created when any item is invalid """
+        items = [self._create_product_data() for _ in range(3)]
+        del items[2]['name']
+
+        endpoint = reverse('stock:product-bulk')
+        response = self.client.post(endpoint, data=items, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()['errors']
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]['index'], 2)
+        self.assertIn('name', errors[0]['errors'])
+        self.assertEqual(Product.objects.count(), 0)
+
+        response = self.client.post(endpoint, data=items[0], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_creation_domain_rule_errors(self):
+        """ Tests domain rules are checked once for all items """
+        class ForbiddenNameRule(IntegrityRuleChecker):
+            batches = list()
+
+            def check(self, instance):  # pragma: no cover
+                raise AssertionError('Rules must be checked for the whole batch')
+
+            def check_many(self, instances):
+                self.batches.append(instances)
+                return {
+                    i: RuleIntegrityError('Forbidden name', field_name='name')
+                    for i, instance in enumerate(instances)
+                    if instance.name == 'forbidden'
+                }
+
+        items = [self._create_product_data() for _ in range(3)]
+        items[1]['name'] = 'forbidden'
+
+        endpoint = reverse('stock:product-bulk')
+        with mock.patch.object(Product, 'integrity_rules', [ForbiddenNameRule]):
+            response = self.client.post(endpoint, data=items, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.json()['errors']
+        self.assertListEqual([e['index'] for e in errors], [1])
+        self.assertIn('name', errors[0]['errors'])
+        self.assertEqual(len(ForbiddenNameRule.batches), 1)
+        self.assertEqual(Product.objects.count(), 0)
+
+    def test_bulk_partial_update(self):
+        """ Tests partial update of many records at once """
+        instances = list(self._create_collection(num=3, persist=True, active=True).values())
+
+        items = [{'pk': str(i.pk), 'active': False} for i in instances[:2]]
+        items.append({'pk': str(instances[2].pk), 'name': 'Renamed'})
+
+        endpoint = reverse('stock:product-bulk')
+        response = self.client.patch(endpoint, data=items, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        for instance in instances[:2]:
+            saved_instance = Product.objects.get(pk=instance.pk)
+            self.assertFalse(saved_instance.active)
+            self.assertEqual(instance.name, saved_instance.name)
+            self.assertGreater(saved_instance.updated_at, instance.updated_at)
+
+        saved_instance = Product.objects.get(pk=instances[2].pk)
+        self.assertEqual('Renamed', saved_instance.name)
+        self.assertTrue(saved_instance.active)
+
+        response = self.client.patch(endpoint, data=[{'pk': str(uuid4()), 'active': False}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['errors'][0]['index'], 0)
+
+    def test_bulk_deletion(self):
+        """ Tests deletion of many records at once """
+        with self.captureOnCommitCallbacks(execute=True):
+            pks = list(self._create_collection(num=4, persist=True).keys())
+
+        endpoint = reverse('stock:product-bulk')
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.delete(endpoint, data=[pks[0], {'pk': pks[1]}, pks[2]], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertSetEqual(
+            set(str(pk) for pk in Product.objects.values_list('pk', flat=True)),
+            set(pks[3:]),
+        )
+
+        # Records are fetched, checked and deleted by a single statement each, bumping the table once
+        statements = [q['sql'] for q in queries if not q['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[-1].startswith('DELETE'))
+        self.assertEqual(len(callbacks), 1)
+
+    def test_bulk_job(self):
+        """ Tests bulk requests preferring async answers are processed as jobs """
+        items = [self._create_product_data() for _ in range(3)]
+        del items[1]['name']
+
+        # Tasks run eagerly, keeping their results in memory
+        backend = CacheBackend(app=celery_app, backend='memory')
+        eager = celery_app.conf.task_always_eager
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, 'task_always_eager', eager)
+
+        endpoint = reverse('stock:product-bulk')
+        with mock.patch.object(type(celery_app), 'backend', new_callable=mock.PropertyMock, return_value=backend), \
+                mock.patch.object(tasks.process_bulk_job, 'store_eager_result', True), \
+                mock.patch.object(ProductViewSet, 'bulk_job_chunk_size', 2):
+            response = self.client.post(endpoint, data=items, format='json', HTTP_PREFER='respond-async')
+
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+            self.assertEqual(response['Preference-Applied'], 'respond-async')
+            job = response.json()
+            self.assertEqual(response['Location'], job['url'])
+            self.assertTrue(job['url'].endswith(reverse('stock:job-detail', kwargs={'pk': job['id']})))
+
+            response = self.client.get(reverse('stock:job-detail', kwargs={'pk': job['id']}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data['status'], 'SUCCESS')
+        self.assertEqual(data['result']['total'], 3)
+        self.assertEqual(data['result']['written'], 1)
+        self.assertEqual(data['result']['failed'], 2)
+
+        # The chunk with the invalid item is not written
+        chunk = data['result']['chunks'][0]
+        self.assertEqual(chunk['start'], 0)
+        self.assertEqual(chunk['errors'][0]['index'], 1)
+        self.assertIn('name', chunk['errors'][0]['errors'])
+        self.assertListEqual(list(Product.objects.values_list('name', flat=True)), [items[2]['name']])
+
     def test_filtering(self):
         """ Tests filtering records by fields """
         instances = list()
@@ -222,6 +729,13 @@ class ProductAPIEndpointsTestCase(APITestCase):
         for item in resp_data['results']:
             self.assertIn(item['pk'], pks)
 
+        # Unknown categories are rejected
+        response = self.client.get(f'{endpoint}?category={uuid4()}')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(f'{endpoint}?category=not-a-pk')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
         # Filter by category active field
         response = self.client.get(f'{endpoint}?category__active=false')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -232,6 +746,73 @@ class ProductAPIEndpointsTestCase(APITestCase):
         for item in resp_data['results']:
             self.assertIn(item['pk'], pks)
 
+    @skipUnless(connection.vendor == 'postgresql', 'Full-text search is backed by PostgreSQL')
+    def test_search(self):
+        """ Tests full-text search over product and category names, ranked """
+        with self.captureOnCommitCallbacks(execute=True):
+            drinks = mock_factory.fake_category(persist=True, name='Bebidas')
+            kitchen = mock_factory.fake_category(persist=True, name='Kitchen mugs')
+            coffee = self._create_product(persist=True, category=drinks, name='Café torrado')
+            mug = self._create_product(persist=True, category=drinks, name='Mug')
+            kettle = self._create_product(persist=True, category=kitchen, name='Kettle')
+            self._create_product(persist=True, category=drinks, name='Orange juice')
+
+        endpoint = reverse('stock:product-list')
+
+        # Unaccented and stemmed
+        response = self.client.get(f'{endpoint}?search=cafes')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual([item['pk'] for item in response.json()['results']], [str(coffee.pk)])
+
+        # Product name matches rank above category name matches
+        response = self.client.get(f'{endpoint}?search=mugs')
+        self.assertListEqual([item['pk'] for item in response.json()['results']], [str(mug.pk), str(kettle.pk)])
+
+        response = self.client.get(f'{endpoint}?search=mug -kettle')
+        self.assertListEqual([item['pk'] for item in response.json()['results']], [str(mug.pk)])
+
+        pks = list()
+        next_endpoint = f'{endpoint}?search=bebidas&limit=2'
+        while next_endpoint:
+            resp_data = self.client.get(next_endpoint).json()
+            pks += [item['pk'] for item in resp_data['results']]
+            next_endpoint = resp_data['next']
+
+        self.assertEqual(resp_data['count'], 3)
+        self.assertListEqual(sorted(pks), sorted(str(i.pk) for i in Product.objects.filter(category=drinks)))
+
+        # Renaming the category changes what its products are found by
+        drinks.name = 'Beverages'
+        with self.captureOnCommitCallbacks(execute=True):
+            drinks.save(ignore_validation=True)
+        response = self.client.get(f'{endpoint}?search=beverage&fields=pk')
+        self.assertEqual(response.json()['count'], 3)
+        response = self.client.get(f'{endpoint}?search=bebidas')
+        self.assertEqual(response.json()['count'], 0)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Trigram similarity is backed by PostgreSQL')
+    def test_suggest(self):
+        """ Tests typeahead suggestions by trigram similarity of names """
+        kettle = self._create_product(persist=True, active=True, name='Kettle')
+        electric_kettle = self._create_product(persist=True, active=True, name='Electric kettle 1.7L')
+        self._create_product(persist=True, active=False, name='Kettle lid')
+        self._create_product(persist=True, active=True, name='Toaster')
+
+        endpoint = reverse('stock:product-suggest')
+        response = self.client.get(f'{endpoint}?q=kett&active=true')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        resp_data = response.json()
+        self.assertListEqual([item['pk'] for item in resp_data], [str(kettle.pk), str(electric_kettle.pk)])
+        self.assertListEqual(list(resp_data[0].keys()), ['pk', 'name', 'similarity'])
+        self.assertEqual(resp_data[0]['name'], 'Kettle')
+
+        response = self.client.get(f'{endpoint}?q=kett&limit=1')
+        self.assertEqual(len(response.json()), 1)
+
+        response = self.client.get(f'{endpoint}?q=k')
+        self.assertListEqual(response.json(), [])
+
     def test_creation_with_category_pk_and_object_support(self):
         """
         Tests tests supports to related category to product using primary key or object
@@ -303,3 +884,35 @@ class ProductAPIEndpointsTestCase(APITestCase):
         for item in resp_data['results']:
             for f_name in field_names:
                 self.assertIn(f_name, item.keys())
+
+    def test_fields_query_string_for_selected_columns(self):
+        """ Tests whether only columns of requested fields are read from database. """
+        self._create_collection(num=3, persist=True)
+
+        endpoint = reverse('stock:product-list')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'{endpoint}?fields=pk,name')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for item in response.json()['results']:
+            self.assertListEqual(sorted(item.keys()), ['name', 'pk'])
+
+        select_sql = [q['sql'] for q in queries if 'ORDER BY' in q['sql']][0]
+        self.assertIn('"stock_product"."name"', select_sql)
+        self.assertNotIn('"stock_product"."active"', select_sql)
+        self.assertNotIn('"stock_product"."created_at"', select_sql)
+        self.assertNotIn('"stock_category"', select_sql)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'{endpoint}?fields=pk,category.name')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for item in response.json()['results']:
+            self.assertListEqual(sorted(item.keys()), ['category', 'pk'])
+            self.assertListEqual(list(item['category'].keys()), ['name'])
+
+        select_sql = [q['sql'] for q in queries if 'ORDER BY' in q['sql']][0]
+        self.assertIn('"stock_category"."name"', select_sql)
+        self.assertNotIn('"stock_category"."active"', select_sql)
+        self.assertNotIn('"stock_product"."active"', select_sql)
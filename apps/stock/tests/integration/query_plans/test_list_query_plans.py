@@ -0,0 +1,100 @@
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.stock.models import Category, Product
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Query plans are read from PostgreSQL EXPLAIN')
+class ListQueryPlansTestCase(APITestCase):
+    """
+    Pages of every supported list filter combination must be read by index,
+    in index order: their plans must not scan tables sequentially nor sort
+    rows. Both are disabled for the planner, which still falls back to them
+    when no index serves the query, so plans do not depend on how many rows
+    are seeded.
+    """
+    unindexed_nodes = ('Seq Scan', 'Sort', 'Incremental Sort')
+
+    @classmethod
+    def setUpTestData(cls):
+        categories = Category.objects.bulk_create([
+            Category(name=f'Category {i}', active=i % 4 != 0) for i in range(20)
+        ])
+        Product.objects.bulk_create([
+            Product(name=f'Product {i}', category=category, active=i % 3 != 0)
+            for category in categories
+            for i in range(25)
+        ])
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Category._meta.db_table}')
+            cursor.execute(f'ANALYZE {Product._meta.db_table}')
+
+        cls.category = categories[1]
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def _get_page_queries(self, endpoint: str) -> list:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(endpoint)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.next_endpoint = response.json()['next']
+        return [q['sql'] for q in queries if q['sql'].startswith('SELECT') and ' LIMIT ' in q['sql']]
+
+    def _get_plan_nodes(self, sql: str) -> list:
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('SET LOCAL enable_sort = off')
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+            plan = cursor.fetchone()[0]
+
+        nodes = list()
+        pending = [plan[0]['Plan']]
+        while pending:
+            node = pending.pop()
+            nodes.append(node)
+            pending += node.get('Plans', list())
+
+        return nodes
+
+    def assertIndexedPages(self, endpoint: str):
+        for page_endpoint in (endpoint, None):
+            queries = self._get_page_queries(page_endpoint or self.next_endpoint)
+            self.assertTrue(queries)
+
+            for sql in queries:
+                nodes = [
+                    (n['Node Type'], n.get('Relation Name'))
+                    for n in self._get_plan_nodes(sql)
+                    if n['Node Type'] in self.unindexed_nodes
+                ]
+                self.assertListEqual(nodes, [], msg=f'{endpoint}: {sql}')
+
+    def test_product_list_plans(self):
+        """ Tests product pages are read by index for every filter """
+        endpoint = reverse('stock:product-list')
+        for query_string in [
+            '?limit=10',
+            '?limit=10&active=true',
+            '?limit=10&active=false',
+            f'?limit=10&category={self.category.pk}',
+            f'?limit=10&category={self.category.pk}&active=true',
+            '?limit=10&category__active=true',
+            '?limit=10&active=true&category__active=true',
+            '?limit=10&fields=pk,name',
+        ]:
+            with self.subTest(query_string=query_string):
+                self.assertIndexedPages(f'{endpoint}{query_string}')
+
+    def test_category_list_plans(self):
+        """ Tests category pages are read by index """
+        endpoint = reverse('stock:category-list')
+        self.assertIndexedPages(f'{endpoint}?limit=5')
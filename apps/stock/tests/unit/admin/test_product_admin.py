@@ -0,0 +1,46 @@
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.stock.models import Product
+from ...mocks import MockStockFactory
+
+
+class ProductAdminTestCase(TestCase):
+    def setUp(self) -> None:
+        self.factory = MockStockFactory()
+        self.model_admin = site._registry[Product]
+        self.request = RequestFactory().get('/')
+
+    def _search(self, search_term: str) -> set:
+        queryset, may_have_duplicates = self.model_admin.get_search_results(
+            self.request, Product.objects.all(), search_term,
+        )
+        self.assertFalse(may_have_duplicates)
+        return set(queryset.values_list('pk', flat=True))
+
+    def test_search_results(self):
+        """ Tests searching by ids exactly and by names without joins """
+        category = self.factory.fake_category(persist=True, name='Kitchen tools')
+        knife = self.factory.fake_product(persist=True, category=category, name='Bread knife')
+        kettle = self.factory.fake_product(persist=True, name='Electric kettle')
+
+        self.assertSetEqual(self._search(str(knife.pk)), {knife.pk})
+        self.assertSetEqual(self._search(str(category.pk)), {knife.pk})
+        self.assertSetEqual(self._search('kettle'), {kettle.pk})
+        self.assertSetEqual(self._search('KITCHEN'), {knife.pk})
+        self.assertSetEqual(self._search('"bread knife" tools'), {knife.pk})
+        self.assertSetEqual(self._search('bread kettle'), set())
+        self.assertSetEqual(self._search(''), {knife.pk, kettle.pk})
+
+        with CaptureQueriesContext(connection) as queries:
+            self._search('knife')
+
+        # Names are compared as UPPER(name), which trigram indexes are built on,
+        # and category names in a subquery of a single query
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('JOIN', queries[0]['sql'])
+        self.assertNotIn('"id"::text', queries[0]['sql'])
+        self.assertIn('UPPER("stock_product"."name"::text) LIKE', queries[0]['sql'])
+        self.assertIn('"stock_product"."category_id" IN (SELECT', queries[0]['sql'])
@@ -0,0 +1,34 @@
+from unittest import mock
+
+import orjson
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from apps.stock.api.serializers import ProductSerializer
+from core.renderers import FastJSONRenderer
+from ....mocks import MockStockFactory
+
+
+class FastJSONRendererTestCase(TestCase):
+    def setUp(self) -> None:
+        self.factory = MockStockFactory()
+
+    def test_renders_with_orjson(self):
+        """ Tests compact output is encoded by orjson, as DRF would encode it """
+        data = ProductSerializer(instance=self.factory.fake_product(persist=True)).data
+        renderer = FastJSONRenderer()
+        self.assertTrue(renderer.is_fast_encoding_enabled())
+
+        with mock.patch.object(orjson, 'dumps', wraps=orjson.dumps) as dumps:
+            rendered = renderer.render(data)
+
+        dumps.assert_called_once()
+        self.assertEqual(rendered, JSONRenderer().render(data))
+
+    def test_indented_output_falls_back(self):
+        """ Tests indented output (eg browsable API) is encoded by DRF """
+        with mock.patch.object(orjson, 'dumps', wraps=orjson.dumps) as dumps:
+            rendered = FastJSONRenderer().render({'name': 'Kettle'}, renderer_context={'indent': 2})
+
+        dumps.assert_not_called()
+        self.assertEqual(rendered, b'{\n  "name": "Kettle"\n}')
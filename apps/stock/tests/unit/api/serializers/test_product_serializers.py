@@ -1,8 +1,13 @@
+from unittest import mock
+
 from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import ModelSerializer
 from uuid import UUID
 
 from apps.stock.api.serializers import ProductSerializer
 from apps.stock.models import Product
+from core.serializers import get_row_renderer, parse_requested_fields
 from ....mocks import MockStockFactory
 
 
@@ -39,6 +44,43 @@ class ProductSerializerTestCase(TestCase):
         for instance in instances:
             self.assertIn(str(instance.pk), pks)
 
+    def test_fields_cache(self):
+        """ Tests fields are built once per requested field set """
+        instance = self.factory.fake_product()
+        context = {'fields': ['pk', 'name'], 'excluded_fields': ['category']}
+
+        with mock.patch.object(ModelSerializer, 'get_fields', side_effect=ModelSerializer.get_fields, autospec=True) as m:
+            data = ProductSerializer(instance=instance, context=context).data
+            other_data = ProductSerializer(instance=instance, context=context).data
+            self.assertEqual(m.call_count, 1)
+
+            all_data = ProductSerializer(instance=instance, context={'excluded_fields': ['active']}).data
+            self.assertEqual(m.call_count, 2)
+
+        self.assertDictEqual(data, {'pk': str(instance.pk), 'name': instance.name})
+        self.assertDictEqual(data, other_data)
+        self.assertIn('category', all_data)
+        self.assertNotIn('active', all_data)
+        self.assertNotIn('is_deletable', all_data)
+
+    def test_row_renderer_parity(self):
+        """ Tests rows rendered from values are the same as serialized instances """
+        for _ in range(3):
+            self.factory.fake_product(persist=True)
+        queryset = Product.objects.order_by('pk')
+
+        for fields in [(), ('name', 'pk'), ('category.name', 'updated_at'), ('category', 'created_at')]:
+            field_names, nested_fields = parse_requested_fields(fields)
+            context = {'fields': field_names, 'nested_fields': nested_fields} if fields else {}
+            expected = ProductSerializer(instance=queryset, many=True, context=context).data
+
+            renderer = get_row_renderer(ProductSerializer, fields)
+            data = renderer.render_many(queryset.values(*renderer.lookups))
+
+            self.assertEqual(JSONRenderer().render(data), JSONRenderer().render(expected))
+
+        self.assertIsNone(get_row_renderer(ProductSerializer, ('is_deletable',)))
+
     def test_create(self):
         """ Tests instance creation from serializer """
         data = self.factory.fake_product_data()
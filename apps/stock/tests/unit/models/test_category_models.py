@@ -0,0 +1,34 @@
+from django.test import TestCase
+
+from apps.stock.models import Category
+from ...mocks import MockStockFactory
+
+
+class CategoryTestCase(TestCase):
+    def setUp(self) -> None:
+        self.factory = MockStockFactory()
+
+    def test_deletable_map(self):
+        """ Tests deletability of many records is resolved in one query """
+        category = self.factory.fake_category(persist=True)
+        protected_category = self.factory.fake_category(persist=True)
+        for _ in range(3):
+            self.factory.fake_product(persist=True, category=protected_category)
+
+        with self.assertNumQueries(1):
+            deletable = Category.deletable_map(Category.objects.filter(
+                pk__in=[category.pk, protected_category.pk]
+            ))
+
+        self.assertDictEqual(deletable, {category.pk: True, protected_category.pk: False})
+
+    def test_is_deletable(self):
+        """ Tests deletability of a record and objects protecting it """
+        category = self.factory.fake_category(persist=True)
+        self.assertTrue(category.is_deletable())
+        self.assertSetEqual(category.get_protecting_objects(), set())
+
+        product = self.factory.fake_product(persist=True, category=category)
+        self.assertFalse(category.is_deletable())
+        self.assertTrue(product.is_deletable())
+        self.assertSetEqual(category.get_protecting_objects(), {product})
@@ -1,7 +1,119 @@
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.stock.models import Product
+from core.models.mixins import IntegrityRuleChecker, RuleInstanceTypeError, RuleIntegrityError
+from ...mocks import MockStockFactory
+
+
+class ForbiddenNameRule(IntegrityRuleChecker):
+    """ Rule checked instance by instance """
+    def check(self, instance):
+        if instance.name == 'forbidden':
+            raise RuleIntegrityError('Forbidden name', field_name='name')
+
+
+class BatchForbiddenNameRule(ForbiddenNameRule):
+    """ Rule checked for the whole batch """
+    batches = list()
+
+    def check(self, instance):  # pragma: no cover
+        raise AssertionError('Batch rules must not be checked one by one')
+
+    def check_many(self, instances):
+        self.batches.append(list(instances))
+        return {
+            i: RuleIntegrityError('Forbidden name', field_name='name')
+            for i, instance in enumerate(instances)
+            if instance.name == 'forbidden'
+        }
 
 
 class ProductTestCase(TestCase):
+    def setUp(self) -> None:
+        self.factory = MockStockFactory()
+
     def test_whatever_rules_in_model(self):
         """ Add tests when model has logical implementation. """
         self.assertTrue(True)
+
+    def test_validate_many_with_instance_rules(self):
+        """ Tests batch validation falls back to per-instance rule checks """
+        instances = [self.factory.fake_product() for _ in range(3)]
+        instances[1].name = 'forbidden'
+
+        with mock.patch.object(Product, 'integrity_rules', [ForbiddenNameRule]):
+            errors = Product.validate_many(instances)
+
+        self.assertListEqual(list(errors.keys()), [1])
+        self.assertIn('name', errors[1].message_dict)
+        self.assertListEqual([i.valid for i in instances], [True, False, True])
+        self.assertTrue(all(i.validation_processed for i in instances))
+
+    def test_validate_many_with_batch_rules(self):
+        """ Tests batch rules are checked once for all instances """
+        instances = [self.factory.fake_product() for _ in range(3)]
+        instances[0].name = None
+        instances[2].name = 'forbidden'
+
+        BatchForbiddenNameRule.batches = list()
+        with mock.patch.object(Product, 'integrity_rules', [BatchForbiddenNameRule()]):
+            errors = Product.validate_many(instances)
+
+        self.assertListEqual(sorted(errors.keys()), [0, 2])
+        self.assertEqual(len(BatchForbiddenNameRule.batches), 1)
+        self.assertListEqual(BatchForbiddenNameRule.batches[0], instances[1:])
+
+    def test_validation_plan(self):
+        """ Tests validation plan is compiled once per model """
+        plan = Product.get_validation_plan()
+
+        self.assertIs(plan, Product.get_validation_plan())
+        self.assertListEqual(
+            sorted(name for name, _ in plan.required_fields),
+            ['active', 'category', 'name'],
+        )
+
+        with mock.patch.object(Product, 'integrity_rules', [ForbiddenNameRule]):
+            rules = Product.get_validation_plan().integrity_rules
+            self.assertEqual(len(rules), 1)
+            self.assertIsInstance(rules[0], ForbiddenNameRule)
+
+        with mock.patch.object(Product, 'integrity_rules', [object]):
+            with self.assertRaises(RuleInstanceTypeError):
+                Product.get_validation_plan()
+
+        self.assertTupleEqual(Product.get_validation_plan().integrity_rules, ())
+
+    def test_save_changed_fields_only(self):
+        """ Tests saving a loaded product only updates its changed fields """
+        product = Product.objects.get(pk=self.factory.fake_product(persist=True).pk)
+        updated_at = product.updated_at
+        product.name = 'renamed'
+
+        with CaptureQueriesContext(connection) as queries:
+            product.save(ignore_validation=True)
+
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"name"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+        self.assertNotIn('"active"', updates[0])
+        self.assertNotIn('"category_id"', updates[0])
+
+        product = Product.objects.get(pk=product.pk)
+        self.assertEqual(product.name, 'renamed')
+        self.assertGreater(product.updated_at, updated_at)
+
+    def test_save_without_changes(self):
+        """ Tests saving a loaded product without changes does not write """
+        product = Product.objects.get(pk=self.factory.fake_product(persist=True).pk)
+        product.name = 'renamed'
+        product.save(ignore_validation=True)
+        self.assertListEqual(product.get_changed_fields(), [])
+
+        with self.assertNumQueries(0):
+            product.save(ignore_validation=True)
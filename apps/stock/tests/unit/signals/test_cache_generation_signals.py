@@ -0,0 +1,45 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase
+
+from apps.stock.models import Category, Product
+from apps.stock.tests.mocks import MockStockFactory
+from core.cache import get_generations
+
+mock_factory = MockStockFactory()
+
+
+class CacheGenerationSignalsTestCase(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_bumped_once_per_transaction(self):
+        """ Tests writes of many rows queue a single bump of each table """
+        tables = (Category._meta.db_table, Product._meta.db_table)
+        generations = get_generations(*tables)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            for _ in range(3):
+                mock_factory.fake_product(persist=True)
+            Product.objects.first().delete(ignore_validation=True)
+
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertTupleEqual(get_generations(*tables), tuple(g + 1 for g in generations))
+
+    def test_bumped_after_rolled_back_savepoint(self):
+        """ Tests bumps queued in a rolled back savepoint are queued again by later writes """
+        with self.captureOnCommitCallbacks() as callbacks:
+            try:
+                with transaction.atomic():
+                    mock_factory.fake_category(persist=True)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+
+            mock_factory.fake_category(persist=True)
+
+        self.assertEqual(len(callbacks), 1)
+        generation = get_generations(Category._meta.db_table)[0]
+        callbacks[0]()
+        self.assertEqual(get_generations(Category._meta.db_table)[0], generation + 1)
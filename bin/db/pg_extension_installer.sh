@@ -3,4 +3,5 @@ set -e
 
 psql -v ON_ERROR_STOP=1 "$POSTGRES_DB" --username "$POSTGRES_USER" <<-EOSQL
 CREATE EXTENSION unaccent;
+CREATE EXTENSION pg_trgm;
 EOSQL
\ No newline at end of file
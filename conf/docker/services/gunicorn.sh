@@ -4,8 +4,12 @@ source /code/deploy/docker/scripts/runner.sh
 
 run_python_script "Collecting static files" "manage.py collectstatic --noinput --verbosity 0"
 
+# Workers write their metrics here, aggregated by /metrics
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR" && mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 echo " > Initilizing SERVER"
 echo ;
 echo "########################################################################"
 echo ;
-gunicorn project.wsgi:application --bind 0.0.0.0:8000
+gunicorn project.wsgi:application --config project/gunicorn.conf.py
@@ -0,0 +1 @@
+from .indexed_search_admin_mixin import IndexedSearchAdminMixin  # noqa
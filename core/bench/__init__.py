@@ -0,0 +1,2 @@
+from .benchmark import Benchmark, BenchmarkCase, BenchmarkResult, percentile  # noqa
+from .report import build_report, compare_reports, load_report, write_report  # noqa
@@ -0,0 +1,150 @@
+"""
+Latency, query and memory benchmarks of request hot paths
+"""
+import time
+import tracemalloc
+from collections import namedtuple
+from statistics import mean
+
+from django.db import connections
+
+BenchmarkResult = namedtuple('BenchmarkResult', (
+    'name',
+    'iterations',
+    'p50_ms',
+    'p95_ms',
+    'p99_ms',
+    'mean_ms',
+    'max_ms',
+    'queries',
+    'max_queries',
+    'memory_kib',
+))
+
+
+def percentile(values: list, percent: float) -> float:
+    """ Percentile of the values, linearly interpolated between ranks """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+
+    rank = (len(ordered) - 1) * percent / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class QueryCounter:
+    """ Database execute wrapper counting the queries run through it """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class BenchmarkCase:
+    """
+    Operation measured by `Benchmark`. `run(state)` is measured, while
+    `setup()`, whose return is the state, is not (eg creating the record a
+    deletion removes). `check(result)` raises when the operation failed, eg
+    when a response has an unexpected status code.
+    """
+
+    def __init__(self, name: str, run, setup=None, check=None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.check = check
+
+    def prepare(self):
+        return self.setup() if self.setup is not None else None
+
+    def verify(self, result):
+        if self.check is not None:
+            self.check(result)
+
+
+class Benchmark:
+    """
+    Runs each case `warmup` times unmeasured and then `iterations` times,
+    measuring wall-clock latency and queries of every run. Allocated memory
+    is measured apart, over `memory_iterations` runs traced by tracemalloc,
+    as tracing slows down the code it traces.
+
+    `before_each` is called before every run, unmeasured (eg to clear
+    caches and benchmark cold paths).
+    """
+
+    def __init__(self, cases: list, iterations: int = 100, warmup: int = 10,
+                 memory_iterations: int = 10, before_each=None, using: str = 'default'):
+        self.cases = {case.name: case for case in cases}
+        self.iterations = iterations
+        self.warmup = warmup
+        self.memory_iterations = memory_iterations
+        self.before_each = before_each
+        self.using = using
+
+    def run(self, names: list = None, callback=None) -> dict:
+        """ Results of the named cases (all of them by default) by name """
+        results = dict()
+        for name in names or self.cases.keys():
+            results[name] = self.run_case(self.cases[name])
+            if callback is not None:
+                callback(results[name])
+
+        return results
+
+    def run_case(self, case: BenchmarkCase) -> BenchmarkResult:
+        for _ in range(self.warmup):
+            state = self._prepare(case)
+            case.verify(case.run(state))
+
+        timings, queries = list(), list()
+        for _ in range(self.iterations):
+            state = self._prepare(case)
+            counter = QueryCounter()
+            with connections[self.using].execute_wrapper(counter):
+                start = time.perf_counter()
+                result = case.run(state)
+                elapsed = time.perf_counter() - start
+
+            case.verify(result)
+            timings.append(elapsed * 1000)
+            queries.append(counter.count)
+
+        return BenchmarkResult(
+            name=case.name,
+            iterations=self.iterations,
+            p50_ms=round(percentile(timings, 50), 3),
+            p95_ms=round(percentile(timings, 95), 3),
+            p99_ms=round(percentile(timings, 99), 3),
+            mean_ms=round(mean(timings), 3) if timings else 0.0,
+            max_ms=round(max(timings, default=0.0), 3),
+            queries=round(mean(queries), 2) if queries else 0.0,
+            max_queries=max(queries, default=0),
+            memory_kib=round(self.measure_memory(case) / 1024, 1),
+        )
+
+    def measure_memory(self, case: BenchmarkCase) -> float:
+        """ Mean of the peak memory allocated by runs of the case, in bytes """
+        peaks = list()
+        tracemalloc.start()
+        try:
+            for _ in range(self.memory_iterations):
+                state = self._prepare(case)
+                tracemalloc.reset_peak()
+                allocated = tracemalloc.get_traced_memory()[0]
+                case.verify(case.run(state))
+                peaks.append(tracemalloc.get_traced_memory()[1] - allocated)
+        finally:
+            tracemalloc.stop()
+
+        return mean(peaks) if peaks else 0.0
+
+    def _prepare(self, case: BenchmarkCase):
+        if self.before_each is not None:
+            self.before_each()
+        return case.prepare()
@@ -0,0 +1,74 @@
+"""
+JSON reports of benchmark results, comparable across commits
+"""
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+import django
+
+# Metrics compared against a baseline: latencies and memory regress beyond a
+# relative threshold, queries per request regress on any increase.
+RELATIVE_METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'memory_kib')
+ABSOLUTE_METRICS = ('queries', 'max_queries')
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True, text=True, check=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_report(results: dict, **meta) -> dict:
+    return {
+        'meta': {
+            'commit': get_commit(),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            **meta,
+        },
+        'results': {name: result._asdict() for name, result in results.items()},
+    }
+
+
+def write_report(report: dict, path: str):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_reports(report: dict, baseline: dict, threshold: float) -> list:
+    """
+    Regressions of the report against the baseline, as messages, for the
+    cases both of them have. `threshold` is the tolerated increase of
+    latencies and memory, in percent.
+    """
+    regressions = list()
+    for name, result in report['results'].items():
+        previous = baseline.get('results', dict()).get(name)
+        if previous is None:
+            continue
+
+        for metric in RELATIVE_METRICS:
+            limit = previous[metric] * (1 + threshold / 100)
+            if result[metric] > limit:
+                regressions.append(
+                    f'{name}: {metric} {result[metric]} > {previous[metric]} (+{threshold:g}%)'
+                )
+
+        for metric in ABSOLUTE_METRICS:
+            if result[metric] > previous[metric]:
+                regressions.append(f'{name}: {metric} {result[metric]} > {previous[metric]}')
+
+    return regressions
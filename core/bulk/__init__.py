@@ -0,0 +1,2 @@
+from .bulk_job import BULK_JOB_METHODS, PROGRESS_STATE, run_bulk_job  # noqa
+from .bulk_processor import BulkProcessor, BulkResult  # noqa
@@ -0,0 +1,64 @@
+"""
+Bulk processing in background jobs
+"""
+from .bulk_processor import BulkProcessor
+
+# Bulk processor methods by HTTP method of the bulk request
+BULK_JOB_METHODS = {
+    'POST': 'create',
+    'PATCH': 'update',
+    'DELETE': 'delete',
+}
+
+PROGRESS_STATE = 'PROGRESS'
+
+
+def run_bulk_job(task, serializer_class, method: str, items: list, chunk_size: int = 500) -> dict:
+    """
+    Processes items of a bulk request in chunks, each chunk written only when
+    all of its items are valid, so that one invalid item does not discard the
+    whole job. Progress is reported as the `PROGRESS` state of the task, with
+    the summary so far as meta; the final summary is returned:
+
+        {
+            'method': 'create',
+            'total': 1200,
+            'processed': 1200,
+            'written': 1000,
+            'failed': 200,
+            'chunks': [{'start': 500, 'size': 200, 'errors': [...]}],
+        }
+
+    `chunks` only reports chunks with errors, indexed by position of items in
+    the whole job.
+    """
+    processor = BulkProcessor(serializer_class)
+    process = getattr(processor, BULK_JOB_METHODS[method])
+
+    summary = {
+        'method': BULK_JOB_METHODS[method],
+        'total': len(items),
+        'processed': 0,
+        'written': 0,
+        'failed': 0,
+        'chunks': list(),
+    }
+
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+        result = process(chunk)
+
+        summary['processed'] += len(chunk)
+        if result.errors:
+            summary['failed'] += len(chunk)
+            summary['chunks'].append({
+                'start': start,
+                'size': len(chunk),
+                'errors': [dict(e, index=e['index'] + start) for e in result.errors],
+            })
+        else:
+            summary['written'] += len(chunk)
+
+        task.update_state(state=PROGRESS_STATE, meta=summary)
+
+    return summary
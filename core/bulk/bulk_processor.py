@@ -0,0 +1,222 @@
+"""
+Bulk processing of serializer payloads
+"""
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import gettext as _
+
+from core.cache import bump_generation
+
+BulkResult = namedtuple('BulkResult', ('instances', 'errors'))
+
+
+class BulkProcessor:
+    """
+    Validates many items through a (form) serializer and writes them in
+    batches: `bulk_create`, `bulk_update` or a single `DELETE ... WHERE id IN`.
+
+    Each invalid item is reported as `{'index': <position>, 'errors': {...}}`.
+    A batch is written only when all of its items are valid.
+
+    Domain rules of models with `DomainRuleMixin` are run once per batch
+    through `validate_many()`/`check_deletion_many()` instead of once per
+    item.
+
+    Per-row model signals are not sent: deletes skip Django's collector, as
+    their deletability is already checked, so that none of the rows is
+    fetched again. Generation counters of the model are bumped once per
+    batch instead.
+    """
+    pk_possible_keys = ['uuid', 'pk', 'id']
+    batch_size = 500
+
+    def __init__(self, serializer_class, context: dict = None):
+        self.serializer_class = serializer_class
+        self.model = serializer_class.Meta.model
+        self.context = dict(context or dict(), defer_domain_rules=True)
+
+    def create(self, items: list) -> BulkResult:
+        indexes, instances, errors = list(), list(), list()
+
+        for index, item in enumerate(items):
+            serializer = self.serializer_class(data=item, context=self.context)
+            if not serializer.is_valid():
+                errors.append(self._get_error(index, serializer.errors))
+                continue
+
+            indexes.append(index)
+            instances.append(self._build_instance(serializer))
+
+        errors += self._validate_domain_rules(indexes, instances)
+        if errors:
+            return BulkResult(list(), sorted(errors, key=lambda e: e['index']))
+
+        with transaction.atomic():
+            self.model._default_manager.bulk_create(instances, batch_size=self.batch_size)
+
+        bump_generation(self.model)
+        return BulkResult(instances, errors)
+
+    def update(self, items: list, partial: bool = True) -> BulkResult:
+        indexes, instances, errors = list(), list(), list()
+        existing = self._get_existing_instances(items)
+
+        for index, item in enumerate(items):
+            pk = self.get_item_pk(item)
+            instance = existing.get(str(pk)) if pk else None
+            if instance is None:
+                errors.append(self._get_not_found_error(index))
+                continue
+
+            serializer = self.serializer_class(
+                instance=instance,
+                data=item,
+                partial=partial,
+                context=self.context,
+            )
+            if not serializer.is_valid():
+                errors.append(self._get_error(index, serializer.errors))
+                continue
+
+            indexes.append(index)
+            instances.append(self._build_instance(serializer))
+
+        errors += self._validate_domain_rules(indexes, instances)
+        if errors:
+            return BulkResult(list(), sorted(errors, key=lambda e: e['index']))
+
+        fields = self.get_update_fields()
+        for instance in instances:
+            self._set_auto_now_values(instance)
+
+        with transaction.atomic():
+            self.model._default_manager.bulk_update(instances, fields, batch_size=self.batch_size)
+
+        bump_generation(self.model)
+        return BulkResult(instances, errors)
+
+    def delete(self, items: list) -> BulkResult:
+        indexes, instances, errors = list(), list(), list()
+        existing = self._get_existing_instances(items)
+
+        deletable = dict()
+        if hasattr(self.model, 'deletable_map'):
+            deletable = self.model.deletable_map(
+                self.model._default_manager.filter(pk__in=[i.pk for i in existing.values()])
+            )
+
+        for index, item in enumerate(items):
+            pk = self.get_item_pk(item)
+            instance = existing.get(str(pk)) if pk else None
+            if instance is None:
+                errors.append(self._get_not_found_error(index))
+                continue
+
+            if deletable.get(instance.pk, True) is False:
+                errors.append(self._get_error(index, {
+                    'pk': [_('You cannot delete this record.')],
+                }))
+                continue
+
+            indexes.append(index)
+            instances.append(instance)
+
+        if hasattr(self.model, 'check_deletion_many'):
+            for position, e in self.model.check_deletion_many(instances).items():
+                errors.append(self._get_error(indexes[position], {
+                    getattr(e, 'field_name', None) or 'pk': [str(e)],
+                }))
+
+        if errors:
+            return BulkResult(list(), sorted(errors, key=lambda e: e['index']))
+
+        queryset = self.model._default_manager.filter(pk__in=[i.pk for i in instances])
+        with transaction.atomic(using=queryset.db):
+            queryset._raw_delete(queryset.db)
+
+        bump_generation(self.model)
+        return BulkResult(instances, errors)
+
+    def get_item_pk(self, item):
+        if not isinstance(item, dict):
+            return item
+
+        for pk_key in self.pk_possible_keys:
+            if item.get(pk_key):
+                return item[pk_key]
+
+        return None
+
+    def get_update_fields(self) -> list:
+        """ Concrete fields written by an update, auto-now fields included. """
+        serializer = self.serializer_class(context=self.context)
+        form_class = getattr(getattr(serializer, 'Meta', None), 'form', None)
+        form_fields = form_class.base_fields.keys() if form_class else serializer.fields.keys()
+
+        fields = list()
+        for f in self.model._meta.concrete_fields:
+            if f.primary_key:
+                continue
+
+            if f.name in form_fields or getattr(f, 'auto_now', False) is True:
+                fields.append(f.name)
+
+        return fields
+
+    def _validate_domain_rules(self, indexes: list, instances: list) -> list:
+        if not hasattr(self.model, 'validate_many'):
+            return list()
+
+        for instance in instances:
+            instance.ignore_validation = False
+
+        return [
+            self._get_error(indexes[position], self._get_validation_error_detail(e))
+            for position, e in self.model.validate_many(instances).items()
+        ]
+
+    @staticmethod
+    def _get_validation_error_detail(e) -> dict:
+        if hasattr(e, 'error_dict'):
+            return e.message_dict
+        return {'non_field_errors': e.messages}
+
+    def _get_existing_instances(self, items: list) -> dict:
+        pks = list()
+        for item in items:
+            pk = self.get_item_pk(item)
+            if not pk:
+                continue
+
+            try:
+                pks.append(self.model._meta.pk.to_python(pk))
+            except ValidationError:
+                continue
+
+        instances = self.model._default_manager.in_bulk(pks)
+        return {str(pk): instance for pk, instance in instances.items()}
+
+    @staticmethod
+    def _build_instance(serializer):
+        form = getattr(serializer, 'form_instance', None)
+        if form is not None:
+            return form.save(commit=False)
+
+        instance = serializer.instance or serializer.Meta.model()
+        for attr, value in serializer.validated_data.items():
+            setattr(instance, attr, value)
+        return instance
+
+    def _set_auto_now_values(self, instance):
+        for f in self.model._meta.concrete_fields:
+            if getattr(f, 'auto_now', False) is True:
+                f.pre_save(instance, add=False)
+
+    @staticmethod
+    def _get_error(index: int, errors) -> dict:
+        return {'index': index, 'errors': errors}
+
+    def _get_not_found_error(self, index: int) -> dict:
+        return self._get_error(index, {'pk': [_('Record not found.')]})
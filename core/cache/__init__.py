@@ -0,0 +1 @@
+from .generations import bump_generation, get_generations  # noqa
@@ -0,0 +1,74 @@
+"""
+Generation counters for cache invalidation.
+
+Every database table has a counter that is bumped whenever rows of it are
+written. Cache keys built from the counters of the tables they were read from
+become unreachable as soon as any of them is written, so cached entries never
+need to be looked up to be invalidated.
+"""
+from django.core.cache import cache
+from django.db import transaction
+
+GENERATION_KEY_PREFIX = 'generation'
+
+
+def _get_key(table_name: str) -> str:
+    return f'{GENERATION_KEY_PREFIX}:{table_name}'
+
+
+def get_generations(*table_names) -> tuple:
+    """ Returns current counters of the tables, in the same order. """
+    values = cache.get_many([_get_key(t) for t in table_names])
+    return tuple(values.get(_get_key(t), 0) for t in table_names)
+
+
+def bump_generation(*models) -> None:
+    """
+    Bumps counters of the tables of the given models once the current
+    transaction commits (at once out of transactions). Bumping before would
+    let a concurrent request cache what it reads from the tables before the
+    commit under the new counters, where it would be served until expiring.
+
+    Tables are collected for the whole transaction and bumped by a single
+    callback, so writing many rows costs one bump per table.
+    """
+    table_names = {model._meta.db_table for model in models}
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        _bump(table_names)
+        return
+
+    pending = getattr(connection, 'pending_generations', None)
+    if pending is None or not pending.is_queued():
+        pending = PendingGenerations(connection)
+        connection.pending_generations = pending
+        transaction.on_commit(pending)
+
+    pending.table_names.update(table_names)
+
+
+class PendingGenerations:
+    """ Tables to bump once the transaction of the connection commits """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.table_names = set()
+
+    def __call__(self):
+        if self.connection.pending_generations is self:
+            self.connection.pending_generations = None
+        _bump(sorted(self.table_names))
+
+    def is_queued(self) -> bool:
+        """ False once discarded by a rollback (of the savepoint it was queued in) """
+        return any(func is self for _, func in self.connection.run_on_commit)
+
+
+def _bump(table_names) -> None:
+    for table_name in table_names:
+        key = _get_key(table_name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            if cache.add(key, 1, timeout=None) is False:
+                cache.incr(key)
@@ -0,0 +1,2 @@
+from .filter_backend import FilterBackend  # noqa
+from .full_text_search_filter import FullTextSearchFilter, get_search_config  # noqa
@@ -0,0 +1,24 @@
+from django_filters import rest_framework as filters
+
+
+class FilterBackend(filters.DjangoFilterBackend):
+    """
+    `DjangoFilterBackend` validating the filters of a request once. Views
+    filter their queryset more than once per request (eg the `ETag`
+    validator, then the list itself) and validating filters runs queries of
+    its own, eg `ModelChoiceFilter` fetching the related object: the bound
+    form of the first filterset is kept on the view and reused by the next.
+    """
+
+    def get_filterset(self, request, queryset, view):
+        filterset = super().get_filterset(request, queryset, view)
+        if filterset is None:
+            return None
+
+        form = getattr(view, '_filterset_form', None)
+        if form is None:
+            view._filterset_form = filterset.form  # pylint: disable=protected-access
+        else:
+            filterset._form = form  # pylint: disable=protected-access
+
+        return filterset
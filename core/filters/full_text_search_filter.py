@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.contrib.postgres.lookups import Unaccent
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorExact, SearchVectorField
+from django.db.models import FloatField, Value
+from django.db.models.expressions import Col
+from django.db.models.functions import Cast
+from django.utils.translation import get_language
+from rest_framework.filters import BaseFilterBackend
+
+
+def get_search_config(language: str = None) -> str:
+    """ Text search configuration of the language (the active one by default) """
+    language = (language or get_language() or settings.LANGUAGE_CODE).lower()
+    configs = getattr(settings, 'SEARCH_CONFIGS', dict())
+    return configs.get(language) or configs.get(language.split('-')[0]) or 'simple'
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Filters by `?search=` against a stored `tsvector` column of the model,
+    named by `search_vector_column` of the view and kept up to date by the
+    database (see the `stock` migrations). Terms are unaccented and parsed as
+    web search queries (`"quoted phrases"`, `or`, `-excluded`) in the text
+    search configuration of the request language.
+
+    Matches are ranked, best first, by the `search_rank` annotation; the
+    match itself is resolved by the GIN index of the column.
+    """
+    search_param = 'search'
+    rank_annotation = 'search_rank'
+
+    def filter_queryset(self, request, queryset, view):
+        column = getattr(view, 'search_vector_column', None)
+        terms = request.query_params.get(self.search_param, '').strip()
+        if column is None or not terms:
+            return queryset
+
+        vector = self.get_search_vector(queryset.model, column)
+        query = SearchQuery(Unaccent(Value(terms)), config=get_search_config(), search_type='websearch')
+
+        # ts_rank() is a real: as double, ranks round-trip through
+        # pagination cursors exactly.
+        rank = Cast(SearchRank(vector, query), output_field=FloatField())
+
+        return queryset.annotate(**{self.rank_annotation: rank}).filter(
+            SearchVectorExact(vector, query),
+        ).order_by(f'-{self.rank_annotation}')
+
+    @staticmethod
+    def get_search_vector(model, column: str) -> Col:
+        """ Reference to the `tsvector` column, which is not a model field """
+        field = SearchVectorField()
+        field.set_attributes_from_name(column)
+        return Col(model._meta.db_table, field)
@@ -0,0 +1,3 @@
+from .prometheus import observe_request, render_metrics  # noqa
+from .request_metrics import RequestMetrics, get_request_metrics, start_request_metrics, stop_request_metrics, timed  # noqa
+from .views import metrics_view  # noqa
@@ -0,0 +1,59 @@
+"""
+Per-route request metrics in Prometheus format.
+
+Under gunicorn every worker is a process of its own: with the
+`PROMETHEUS_MULTIPROC_DIR` environment variable set (to an empty directory,
+before the workers start) metrics are written there by each worker and
+`/metrics` aggregates all of them. Exited workers are marked dead by
+`project/gunicorn.conf.py`.
+"""
+import os
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+DURATION_BUCKETS = (.005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0, 2.5, 5.0, 7.5, 10.0, float('inf'))
+QUERIES_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, float('inf'))
+
+REQUEST_DURATION = Histogram(
+    'django_http_request_duration_seconds',
+    'Time to respond requests, by route',
+    ('route', 'method', 'status'),
+    buckets=DURATION_BUCKETS,
+)
+REQUEST_PHASE_DURATION = Histogram(
+    'django_http_request_phase_duration_seconds',
+    'Time requests spent by phase (db, serializer, form), by route',
+    ('route', 'method', 'phase'),
+    buckets=DURATION_BUCKETS,
+)
+REQUEST_DB_QUERIES = Histogram(
+    'django_http_request_db_queries',
+    'Database queries run by requests, by route',
+    ('route', 'method'),
+    buckets=QUERIES_BUCKETS,
+)
+
+
+def is_multiprocess() -> bool:
+    return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+
+def observe_request(route: str, method: str, status: int, duration: float, metrics):
+    """ Records a handled request and its `RequestMetrics` """
+    REQUEST_DURATION.labels(route, method, str(status)).observe(duration)
+    REQUEST_DB_QUERIES.labels(route, method).observe(metrics.db_queries)
+    REQUEST_PHASE_DURATION.labels(route, method, 'db').observe(metrics.db_duration)
+    for phase, phase_duration in metrics.phases.items():
+        REQUEST_PHASE_DURATION.labels(route, method, phase).observe(phase_duration)
+
+
+def render_metrics() -> tuple:
+    """ (content, content type) of the metrics of every process """
+    if is_multiprocess() is False:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
@@ -0,0 +1,99 @@
+"""
+Timings of the request being handled, see `PerformanceMiddleware`
+"""
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+# Transaction control, eg savepoints of ATOMIC_REQUESTS, is not counted as queries
+TRANSACTION_STATEMENTS = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT', 'BEGIN', 'COMMIT', 'ROLLBACK')
+
+_request_metrics = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """
+    Time spent by the request being handled, in seconds, by phase (eg
+    `serializer`), plus time and number of its database queries, recorded
+    through `connection.execute_wrapper` while it is active.
+    """
+
+    def __init__(self):
+        self.phases = dict()
+        self.db_duration = 0.0
+        self.db_queries = 0
+        self._running = set()
+
+    def add(self, phase: str, duration: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_duration += time.perf_counter() - start
+            if not sql.lstrip().upper().startswith(TRANSACTION_STATEMENTS):
+                self.db_queries += 1
+
+
+def start_request_metrics() -> tuple:
+    """ (metrics, token to reset them with `stop_request_metrics()`) """
+    metrics = RequestMetrics()
+    return metrics, _request_metrics.set(metrics)
+
+
+def stop_request_metrics(token):
+    _request_metrics.reset(token)
+
+
+def get_request_metrics():
+    """ Metrics of the request being handled, `None` out of requests """
+    return _request_metrics.get()
+
+
+class timed:
+    """
+    Adds the time of a block, or of the calls of a function, to a phase of
+    the request being handled:
+
+        with timed('serializer'):
+            ...
+
+        @timed('form')
+        def validate(self, data):
+            ...
+
+    Nested blocks of the same phase are counted once, by the outermost one,
+    so recursive or per-item calls (eg nested serializers) are not summed
+    twice. Out of requests it does nothing.
+    """
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        self._metrics = None
+        self._start = None
+
+    def __enter__(self):
+        metrics = _request_metrics.get()
+        if metrics is not None and self.phase not in metrics._running:
+            metrics._running.add(self.phase)
+            self._metrics = metrics
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        metrics, self._metrics = self._metrics, None
+        if metrics is not None:
+            metrics.add(self.phase, time.perf_counter() - self._start)
+            metrics._running.discard(self.phase)
+
+    def __call__(self, func):
+        phase = self.phase
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(phase):
+                return func(*args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+
+from .prometheus import render_metrics
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Request metrics in Prometheus format. Scrapers must send `METRICS_TOKEN`
+    as `Authorization: Bearer <token>`; without a token, metrics are only
+    served under `DEBUG`.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if not token and settings.DEBUG is False:
+        raise Http404
+
+    if token:
+        authorization = request.headers.get('Authorization', '')
+        if not constant_time_compare(authorization, f'Bearer {token}'):
+            return HttpResponse(status=401)
+
+    content, content_type = render_metrics()
+    return HttpResponse(content, content_type=content_type)
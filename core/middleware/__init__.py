@@ -0,0 +1,3 @@
+from .performance_middleware import PerformanceMiddleware  # noqa
+from .profiling_middleware import ProfilingMiddleware  # noqa
+from .query_inspector_middleware import QueryInspectorMiddleware  # noqa
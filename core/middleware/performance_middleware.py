@@ -0,0 +1,60 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from core.metrics import observe_request, start_request_metrics, stop_request_metrics
+
+
+class PerformanceMiddleware:
+    """
+    Measures every request: total time, time and number of database queries
+    and time by phase (`serializer`, `form`, see `core.metrics.timed`). They
+    are answered in a `Server-Timing` header (when `SERVER_TIMING` is on,
+    under `DEBUG` by default) and recorded in per-route histograms, served by `/metrics`.
+
+    It should come first in `MIDDLEWARE`, so that the time of the others is
+    measured as well. Content streamed after the response is returned is
+    not measured.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics, token = start_request_metrics()
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(metrics))
+                response = self.get_response(request)
+        finally:
+            stop_request_metrics(token)
+
+        duration = time.perf_counter() - start
+        observe_request(self.get_route(request), request.method, response.status_code, duration, metrics)
+
+        if getattr(settings, 'SERVER_TIMING', settings.DEBUG) is True:
+            response['Server-Timing'] = self.get_server_timing(duration, metrics)
+
+        return response
+
+    @staticmethod
+    def get_route(request) -> str:
+        """ Name of the view the request was resolved to, as route label """
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            return '<unresolved>'
+
+        return resolver_match.view_name or resolver_match.route
+
+    @staticmethod
+    def get_server_timing(duration: float, metrics) -> str:
+        timings = [
+            f'total;dur={duration * 1000:.1f}',
+            f'db;dur={metrics.db_duration * 1000:.1f};desc="{metrics.db_queries} queries"',
+        ]
+        timings += [f'{phase};dur={d * 1000:.1f}' for phase, d in metrics.phases.items()]
+        return ', '.join(timings)
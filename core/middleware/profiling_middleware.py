@@ -0,0 +1,35 @@
+from django.conf import settings
+
+from core.profiling import StackSampler, add_profile, should_profile_request
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests selected by `core.profiling.should_profile_request()`:
+    a sample of them (`PROFILING_SAMPLE_RATE`) and the ones sending a
+    staff profile token. Their call stacks are sampled and stored in the
+    profile ring buffer, and the profile id is answered in `X-Profile-Id`.
+    Other requests are not slowed down.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if should_profile_request(request) is False:
+            return self.get_response(request)
+
+        with StackSampler(interval=getattr(settings, 'PROFILING_INTERVAL', 0.005)) as sampler:
+            response = self.get_response(request)
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        profile_id = add_profile(
+            'request',
+            resolver_match.view_name if resolver_match is not None else '<unresolved>',
+            sampler,
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+        )
+        response['X-Profile-Id'] = str(profile_id)
+        return response
@@ -0,0 +1,44 @@
+import logging
+
+from django.conf import settings
+
+from core.queries import QueryInspector, get_query_budget
+
+logger = logging.getLogger('core.queries')
+
+
+class QueryInspectorMiddleware:
+    """
+    Development middleware inspecting the queries of every request. Their
+    number and time are answered in `X-Query-Count` and `X-Query-Duration`
+    (ms) headers, and warnings are logged for:
+
+    - SQL shapes run `QUERY_INSPECTOR_REPEAT_THRESHOLD` times or more (3 by
+      default), as N+1 patterns do;
+    - viewset actions running more queries than their `query_budgets`.
+
+    Queries run while streaming responses are not inspected.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.repeat_threshold = getattr(settings, 'QUERY_INSPECTOR_REPEAT_THRESHOLD', None)
+
+    def __call__(self, request):
+        with QueryInspector(repeat_threshold=self.repeat_threshold) as inspector:
+            response = self.get_response(request)
+
+        response['X-Query-Count'] = str(inspector.count)
+        response['X-Query-Duration'] = f'{inspector.duration * 1000:.1f}'
+
+        for shape, times in inspector.get_repeated_shapes():
+            logger.warning('Possible N+1 in %s %s: %s queries shaped %s', request.method, request.path, times, shape)
+
+        action, budget = get_query_budget(request.resolver_match, request.method)
+        if budget is not None and inspector.count > budget:
+            logger.warning(
+                '%s %s (%s) ran %s queries, over its budget of %s',
+                request.method, request.path, action, inspector.count, budget,
+            )
+
+        return response
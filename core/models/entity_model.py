@@ -1,14 +1,21 @@
 from django.db import models
 
 from .mixins import AuditableMixin
+from .mixins import ChangeTrackerMixin
 from .mixins import DeletableModelMixin
 from .mixins import EntityMixin
 from .mixins import UUIDPkMixin
 
 
-class EntityModelMixin(UUIDPkMixin, AuditableMixin, EntityMixin, DeletableModelMixin, models.Model):
+class EntityModelMixin(UUIDPkMixin,
+                       AuditableMixin,
+                       EntityMixin,
+                       DeletableModelMixin,
+                       ChangeTrackerMixin,
+                       models.Model):
     """
-    Parent class for entity models.
+    Parent class for entity models. Set `track_changes = True` to save only
+    changed fields.
     """
     class Meta:
         abstract = True
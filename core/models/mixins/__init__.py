@@ -11,3 +11,4 @@ from .domain_ruler_mixin import ( # noqa
 from .entity_mixin import EntityMixin  # noqa
 from .uuid_pk_mixin import UUIDPkMixin  # noqa
 from .deletable_mixin import DeletableModelMixin  # noqa
+from .change_tracker_mixin import ChangeTrackerMixin  # noqa
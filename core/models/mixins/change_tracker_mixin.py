@@ -0,0 +1,104 @@
+from django.db.models import DEFERRED
+
+
+class ChangeTrackerMixin:
+    """
+    Tracks changes of the concrete fields of instances loaded from the
+    database, so that saving them only updates the changed columns:
+
+        class Product(..., mixins.DomainRuleMixin, mixins.ChangeTrackerMixin, models.Model):
+            track_changes = True
+
+    The snapshot is a tuple of the loaded values, taken when the instance is
+    loaded and after it is saved. Values mutated in place (eg dicts of JSON
+    fields) are not noticed and must be reassigned.
+
+    Must come after `DomainRuleMixin` so that rules are checked before
+    the write is skipped.
+    """
+    track_changes = False
+
+    # (attnames, values) of the instance when loaded or last saved.
+    _snapshot = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if cls.track_changes is True:
+            loaded = [(n, v) for n, v in zip(field_names, values) if v is not DEFERRED]
+            instance._snapshot = (
+                tuple(n for n, _ in loaded),
+                tuple(v for _, v in loaded),
+            )
+        return instance
+
+    def get_changed_fields(self) -> list:
+        """
+        Names of concrete fields changed since the instance was loaded or
+        last saved, including the ones loaded later (eg deferred fields).
+        """
+        if self._snapshot is None:
+            return [f.name for f in self._meta.concrete_fields]
+
+        snapshot = dict(zip(*self._snapshot))
+        changed = list()
+        for f in self._meta.concrete_fields:
+            if f.attname not in self.__dict__:
+                continue
+
+            if f.attname not in snapshot or snapshot[f.attname] != self.__dict__[f.attname]:
+                changed.append(f.name)
+
+        return changed
+
+    def has_changed(self, field_name: str) -> bool:
+        return field_name in self.get_changed_fields()
+
+    def save(self, *args, **kwargs):
+        if self._is_partially_savable(*args, **kwargs) is False:
+            super().save(*args, **kwargs)
+            self._take_snapshot(kwargs.get('update_fields'))
+            return
+
+        changed_fields = self.get_changed_fields()
+        if not changed_fields:
+            return
+
+        kwargs['update_fields'] = changed_fields + [
+            f.name
+            for f in self._meta.concrete_fields
+            if getattr(f, 'auto_now', False) is True and f.name not in changed_fields
+        ]
+        super().save(**kwargs)
+        self._take_snapshot()
+
+    def _is_partially_savable(self, *args, **kwargs) -> bool:
+        """
+        Only loaded instances saved without explicit options, to the database
+        they were loaded from and keeping their primary key, are saved by
+        their changed fields.
+        """
+        if self.track_changes is False or self._snapshot is None or args:
+            return False
+
+        if self._state.adding is True or set(kwargs) - {'using'}:
+            return False
+
+        if kwargs.get('using') not in (None, self._state.db):
+            return False
+
+        return self.pk is not None and self.pk == dict(zip(*self._snapshot)).get(self._meta.pk.attname)
+
+    def _take_snapshot(self, update_fields=None):
+        if self.track_changes is False:
+            return
+
+        snapshot = dict(zip(*self._snapshot)) if self._snapshot and update_fields is not None else dict()
+        for f in self._meta.concrete_fields:
+            if f.attname not in self.__dict__:
+                continue
+
+            if update_fields is None or f.name in update_fields or f.attname in update_fields:
+                snapshot[f.attname] = self.__dict__[f.attname]
+
+        self._snapshot = (tuple(snapshot), tuple(snapshot.values()))
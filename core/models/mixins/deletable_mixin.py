@@ -1,11 +1,16 @@
 """
 Deletable model mixin
 """
+from functools import reduce
+from operator import or_
 
 from django.db import IntegrityError, models, router
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Q, Value
 from django.db.models.deletion import Collector
 from django.utils.translation import gettext_lazy as _
 
+DELETABLE_ANNOTATION = 'deletable'
+
 
 class NotDeletableError(IntegrityError):
     """Not deletable exception"""
@@ -41,20 +46,99 @@ class CheckerCollector(Collector):
         return False
 
 
+def get_protection_expressions(model, _visited: frozenset = frozenset()) -> list:
+    """
+    `Exists()` expressions telling whether a row of the model, referenced as
+    `OuterRef`, is protected from deletion: one per reverse relation with
+    `on_delete=PROTECT` or `RESTRICT`, and one per `CASCADE` relation whose
+    rows are protected themselves.
+    """
+    expressions = list()
+    visited = _visited | {model}
+
+    for rel in model._meta.related_objects:
+        if rel.many_to_many:
+            continue
+
+        field = rel.field
+        queryset = rel.related_model._base_manager.filter(**{
+            field.name: OuterRef(field.target_field.attname),
+        })
+
+        if rel.on_delete in (models.PROTECT, models.RESTRICT):
+            expressions.append(Exists(queryset))
+            continue
+
+        if rel.on_delete is not models.CASCADE or rel.related_model in visited:
+            continue
+
+        nested_expressions = get_protection_expressions(rel.related_model, visited)
+        if nested_expressions:
+            expressions.append(Exists(queryset.filter(
+                reduce(or_, [Q(e) for e in nested_expressions])
+            )))
+
+    return expressions
+
+
 class DeletableModelMixin:
     """Deletable model checker"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.checker = None
+    checker = None
+
+    @classmethod
+    def annotate_deletable(cls, queryset, name: str = DELETABLE_ANNOTATION):
+        """
+        Annotates whether each row can be deleted, resolved by the database in
+        the same query through `EXISTS` subqueries over protecting relations.
+        """
+        expressions = get_protection_expressions(queryset.model)
+        if not expressions:
+            return queryset.annotate(**{name: Value(True, output_field=BooleanField())})
+
+        return queryset.annotate(**{name: ExpressionWrapper(
+            ~reduce(or_, [Q(e) for e in expressions]),
+            output_field=BooleanField(),
+        )})
+
+    @classmethod
+    def deletable_map(cls, queryset=None) -> dict:
+        """
+        Tells in a single query whether each record of the queryset can be
+        deleted, as `{pk: bool}`.
+        """
+        if queryset is None:
+            queryset = cls._default_manager.all()
+
+        queryset = cls.annotate_deletable(queryset.order_by())
+        return dict(queryset.values_list('pk', DELETABLE_ANNOTATION))
+
+    def get_deletable(self) -> bool:
+        """
+        Deletability annotated by `annotate_deletable()` when the instance was
+        loaded with it, resolved with `is_deletable()` otherwise.
+        """
+        if DELETABLE_ANNOTATION in self.__dict__:
+            return self.__dict__[DELETABLE_ANNOTATION]
+
+        return self.is_deletable()
 
     def is_deletable(self):
         """Checks if model is deletable"""
-        if not self.checker:
-            self.checker = CheckerCollector(using=router.db_for_write(self))
+        queryset = self.__class__._base_manager.db_manager(
+            router.db_for_write(self.__class__, instance=self)
+        ).filter(pk=self.pk)
+        return self.deletable_map(queryset).get(self.pk, True)
 
+    def get_protecting_objects(self) -> set:
+        """
+        Objects which prevent the model from being deleted. They are loaded
+        through a deletion collector, so use `is_deletable()` when only a yes/no
+        answer is needed.
+        """
+        self.checker = CheckerCollector(using=router.db_for_write(self.__class__, instance=self))
         self.checker.collect(objs=[self])
-        return len(self.checker.protected) == 0
+        return self.checker.protected
 
     def check_deletable(self):
         """Raises an exception if model is not deletable"""
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections import namedtuple
 
 from django.forms import ValidationError
 from django.utils.translation import gettext as _
@@ -9,8 +10,16 @@ __all__ = [
     'IntegrityRuleChecker',
     'RuleIntegrityError',
     'RuleInstanceTypeError',
+    'ValidationPlan',
 ]
 
+ValidationPlan = namedtuple('ValidationPlan', (
+    'integrity_rules',
+    'deletion_rules',
+    'required_fields',
+    'sources',
+))
+
 
 class RuleValidationError(Exception):
     """ Raises when model is being saved and rule is not satisfied. """
@@ -58,46 +67,98 @@ class IntegrityRuleChecker(ABC):
     def check(self, instance):  # pragma: no cover
         pass
 
+    def check_many(self, instances: list) -> dict:
+        """
+        Checks many instances at once, returning errors by position of the
+        instance. Rules querying the database should override it to query
+        once for the whole batch; by default instances are checked one by one.
+        """
+        errors = dict()
+        for index, instance in enumerate(instances):
+            try:
+                self.check(instance)
+            except RuleIntegrityError as e:
+                errors[index] = e
+        return errors
+
 
 class DeletionRuleChecker(ABC):
     """ Concrete class to verify deletion rule in a model
-    :raise RuleIntegrityError
+    :raise RuleDeletionError
     """
 
     @abstractmethod
     def check(self, instance):  # pragma: no cover
         pass
 
+    def check_many(self, instances: list) -> dict:
+        """
+        Checks many instances at once, returning errors by position of the
+        instance. By default instances are checked one by one.
+        """
+        errors = dict()
+        for index, instance in enumerate(instances):
+            try:
+                self.check(instance)
+            except (RuleDeletionError, RuleIntegrityError) as e:
+                errors[index] = e
+        return errors
+
 
 class DomainRuleMixin:
     """ Adds support to check domain rules """
-    # Rule instances
+    # Rule classes or instances
     integrity_rules = list()
     deletion_rules = list()
 
-    def __init__(self, *args, **kwargs):
-        self.ignore_validation = False
-        self.validation_processed = False
-        self.valid = False
+    # Validation state of the instance
+    ignore_validation = False
+    validation_processed = False
+    valid = False
 
-        integrity_rules = set()
-
-        for rule in self.integrity_rules:
-            if self.is_valid_integrity_rule(rule):
-                integrity_rules.add(rule)
-                continue
-
-            raise RuleInstanceTypeError(rule.__name__)
-
-        deletion_rules = set()
-        for rule in self.deletion_rules:
-            if self.is_valid_deletion_rule(rule):
-                deletion_rules.add(rule)
-                continue
-
-            raise RuleInstanceTypeError(rule.__class__.__name__)
+    @classmethod
+    def get_validation_plan(cls) -> ValidationPlan:
+        """
+        Validated rule instances and required fields of the model, compiled
+        once per model class at first use so that instantiating models (eg
+        every row loaded from a queryset) does not pay for it.
 
-        super().__init__(*args, **kwargs)
+        Rules are shared by all instances of the model, so they must not keep
+        state between checks. The plan is compiled again when rule lists are
+        reassigned, but not when they are mutated in place.
+        """
+        plan = cls.__dict__.get('_validation_plan')
+        if plan is not None \
+                and plan.sources[0] is cls.integrity_rules \
+                and plan.sources[1] is cls.deletion_rules:
+            return plan
+
+        integrity_rules = list()
+        for rule in cls.integrity_rules:
+            if not cls.is_valid_integrity_rule(rule):
+                raise RuleInstanceTypeError(getattr(rule, '__name__', rule.__class__.__name__))
+            integrity_rules.append(cls._get_rule_instance(rule, IntegrityRuleChecker))
+
+        deletion_rules = list()
+        for rule in cls.deletion_rules:
+            if not cls.is_valid_deletion_rule(rule):
+                raise RuleInstanceTypeError(getattr(rule, '__name__', rule.__class__.__name__))
+            deletion_rules.append(cls._get_rule_instance(rule, DeletionRuleChecker))
+
+        required_fields = tuple(
+            (f.name, f.attname)
+            for f in cls._meta.concrete_fields
+            if getattr(f, 'null', False) is False and getattr(f, 'editable', True) is True
+        )
+
+        plan = ValidationPlan(
+            tuple(integrity_rules),
+            tuple(deletion_rules),
+            required_fields,
+            (cls.integrity_rules, cls.deletion_rules),
+        )
+        cls._validation_plan = plan
+        return plan
 
     def full_clean(self, exclude=None, validate_unique=True):
         super().full_clean(exclude, validate_unique)
@@ -114,6 +175,52 @@ class DomainRuleMixin:
 
             self.valid = True
 
+    @classmethod
+    def validate_many(cls, instances: list) -> dict:
+        """
+        Validates many instances at once, running each integrity rule once
+        over the whole batch. Returns `ValidationError` by position of the
+        invalid instances; valid ones are flagged as validated and can be
+        saved.
+        """
+        errors = dict()
+        for index, instance in enumerate(instances):
+            try:
+                instance._required_fields_filled()
+            except ValidationError as e:
+                errors[index] = e
+
+        checked = [(i, instance) for i, instance in enumerate(instances) if i not in errors]
+        for rule in cls.get_validation_plan().integrity_rules:
+            if not checked:
+                break
+
+            rule_errors = rule.check_many([instance for _, instance in checked])
+            for position, e in rule_errors.items():
+                errors[checked[position][0]] = cls._to_validation_error(e)
+
+            checked = [c for position, c in enumerate(checked) if position not in rule_errors]
+
+        for index, instance in enumerate(instances):
+            instance.validation_processed = True
+            instance.valid = index not in errors
+
+        return errors
+
+    @classmethod
+    def check_deletion_many(cls, instances: list) -> dict:
+        """
+        Checks deletion rules of many instances at once, running each rule
+        once over the whole batch. Returns errors by position of the instances
+        that cannot be deleted.
+        """
+        errors = dict()
+        for rule in cls.get_validation_plan().deletion_rules:
+            for index, e in rule.check_many(instances).items():
+                errors.setdefault(index, e)
+
+        return errors
+
     def delete(self, ignore_validation=False, *args, **kwargs):
         if self.ignore_validation is False and ignore_validation is False:
             self._check_deletion_rules()
@@ -137,13 +244,13 @@ class DomainRuleMixin:
 
     @staticmethod
     def is_valid_integrity_rule(rule):
-        is_subclass = issubclass(rule, IntegrityRuleChecker)
+        is_subclass = isinstance(rule, type) and issubclass(rule, IntegrityRuleChecker)
         is_instance = isinstance(rule, IntegrityRuleChecker)
         return is_subclass is True or is_instance is True
 
     @staticmethod
     def is_valid_deletion_rule(rule):
-        is_subclass = issubclass(rule, DeletionRuleChecker)
+        is_subclass = isinstance(rule, type) and issubclass(rule, DeletionRuleChecker)
         is_instance = isinstance(rule, DeletionRuleChecker)
         return is_subclass is True or is_instance is True
 
@@ -151,44 +258,43 @@ class DomainRuleMixin:
         """
         Check if all required fields are filled.
         """
-        required_empty_fields = list()
-        for f in self._meta.get_fields():
-            if getattr(f, 'null', False) is True:
-                continue
-
-            if getattr(f, 'editable', True) is False:
-                continue
-
-            v = getattr(self, f.name, None)
-            if v is None:
-                required_empty_fields.append(f.name)
+        required_empty_fields = [
+            name
+            for name, attname in self.get_validation_plan().required_fields
+            if getattr(self, attname, None) is None
+        ]
 
         if required_empty_fields:
             raise ValidationError(
                 _('Required fields must be provided: {}'.format(', '.join(required_empty_fields)))
             )
 
+    @staticmethod
+    def _get_rule_instance(rule, checker_class):
+        if not isinstance(rule, checker_class):
+            rule = rule()
+        return rule
+
+    @staticmethod
+    def _to_validation_error(e: RuleIntegrityError) -> ValidationError:
+        msg = e.message
+        if e.field_name is not None:
+            error_dict = dict()
+            error_dict[e.field_name] = msg
+            return ValidationError(error_dict)
+
+        return ValidationError(msg)
+
     def _check_integrity_rules(self):
         """ Verifica as regras de integridade de domínio. """
 
-        for rule in self.integrity_rules:
-            if not isinstance(rule, IntegrityRuleChecker):
-                rule = rule()
-
+        for rule in self.get_validation_plan().integrity_rules:
             try:
                 rule.check(self)
             except RuleIntegrityError as e:
-                msg = e.message
-                if e.field_name is not None:
-                    error_dict = dict()
-                    error_dict[e.field_name] = msg
-                    raise ValidationError(error_dict)
-
-                raise ValidationError(msg)
+                raise self._to_validation_error(e)
 
     def _check_deletion_rules(self):
         """ Verifica as regras de remoção de entidade de domínio. """
-        for rule in self.integrity_rules:
-            if not isinstance(rule, DeletionRuleChecker):
-                rule = rule()
-                rule.check(self)
+        for rule in self.get_validation_plan().deletion_rules:
+            rule.check(self)
@@ -1,15 +1,16 @@
 # pylint: disable=W0613
 """Decorator @track_data - Tracks changes in models"""
 
-from django.db.models.signals import post_init
-
 
 # from https://gist.github.com/dcramer/730765
 def track_data(*fields):
     """
     Tracks property changes on a model instance.
-    The changed list of properties is refreshed on model initialization
-    and save.
+    The changed list of properties is refreshed when the instance is loaded
+    from the database and on save; instances not loaded nor saved yet report
+    no changes.
+
+    To have saves write only changed fields, see `ChangeTrackerMixin`.
 
     @track_data('name')
     class Post(models.Model):
@@ -33,7 +34,7 @@ def track_data(*fields):
         """Inner callback to return"""
 
         # contains a local copy of the previous values of attributes
-        cls.data = {}
+        cls.data = not_saved
 
         def has_changed(self, field):
             """Returns `True` if `field` has changed since initialization."""
@@ -61,12 +62,16 @@ def track_data(*fields):
 
         cls.whats_changed = whats_changed
 
-        # Ensure we are updating local attributes on model init
-        # noinspection PyUnusedLocal
-        def _post_init(instance, **kwargs):
+        # Ensure we are updating local attributes on model loading, instead
+        # of on every model init.
+        def from_db(klass, db, field_names, values):
+            """Intercepts from_db() to store loaded values"""
+            instance = from_db.original(klass, db, field_names, values)
             _store(instance)
+            return instance
 
-        post_init.connect(_post_init, sender=cls, weak=False)
+        from_db.original = cls.from_db.__func__
+        cls.from_db = classmethod(from_db)
 
         # Ensure we are updating local attributes on model save
         def save(self, *args, **kwargs):
@@ -0,0 +1,3 @@
+from .count_strategy import CountStrategy  # noqa
+from .keyset_pagination import KeysetPagination  # noqa
+from .positive_int import positive_int  # noqa
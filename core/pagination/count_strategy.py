@@ -0,0 +1,82 @@
+"""
+Row count strategies for paginated list responses
+"""
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from core.cache import get_generations
+
+
+class CountStrategy:
+    """
+    Counts rows of a list without running an exact COUNT(*) on every request:
+
+    - `?count=exact` always counts;
+    - unfiltered lists use the planner estimate kept by PostgreSQL in
+      `pg_class.reltuples`, when the table is large enough for an exact count
+      to be expensive;
+    - any other list is counted once and cached until one of the tables it
+      reads from is written (see `core.cache.generations`) or the timeout
+      expires.
+    """
+    count_query_param = 'count'
+    exact_count_value = 'exact'
+
+    # Below this estimate, counting is cheap enough to be exact.
+    estimate_threshold = 10000
+
+    cache_key_prefix = 'count'
+
+    def get_count(self, queryset, request) -> int:
+        if request.query_params.get(self.count_query_param) == self.exact_count_value:
+            return queryset.count()
+
+        if queryset.query.has_filters() is False:
+            estimate = self.get_estimated_count(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+
+        return self.get_cached_count(queryset)
+
+    @staticmethod
+    def get_estimated_count(queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+
+        # Tables never vacuumed nor analyzed have no estimate (-1).
+        if row is None or row[0] < 0:
+            return None
+
+        return row[0]
+
+    def get_cached_count(self, queryset) -> int:
+        key = self.get_cache_key(queryset)
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, timeout=getattr(settings, 'PAGINATION_COUNT_CACHE_TIMEOUT', 300))
+
+        return count
+
+    def get_cache_key(self, queryset) -> str:
+        query = queryset.query
+        sql, params = query.sql_with_params()
+
+        table_names = sorted(set(
+            alias.table_name for alias in query.alias_map.values()
+        ) | {queryset.model._meta.db_table})
+        generations = get_generations(*table_names)
+
+        digest = md5(f'{sql}{params}{table_names}{generations}'.encode('utf-8')).hexdigest()
+        return f'{self.cache_key_prefix}:{queryset.model._meta.label_lower}:{digest}'
@@ -0,0 +1,287 @@
+"""
+Keyset (seek) pagination
+"""
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections import OrderedDict, namedtuple
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import reduce
+from operator import or_
+from uuid import UUID
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, ValidationError
+from django.db.models import BooleanField, Expression, F, Q, Value
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .count_strategy import CountStrategy
+from .positive_int import positive_int
+
+Cursor = namedtuple('Cursor', ('position', 'reverse'))
+OrderingField = namedtuple('OrderingField', ('field', 'lookup', 'descending'))
+
+
+class KeysetRowComparison(Expression):
+    """
+    Row value comparison, eg `(category_id, name, id) > (%s, %s, %s)`, which
+    databases resolve as a range scan over a matching composite index.
+    """
+    conditional = True
+    output_field = BooleanField()
+
+    def __init__(self, lhs: list, rhs: list, operator: str):
+        super().__init__()
+        self.lhs = lhs
+        self.rhs = rhs
+        self.operator = operator
+
+    def get_source_expressions(self):
+        return self.lhs + self.rhs
+
+    def set_source_expressions(self, exprs):
+        self.lhs = exprs[:len(self.lhs)]
+        self.rhs = exprs[len(self.lhs):]
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, rhs_sql, params = list(), list(), list()
+        for expressions, sqls in ((self.lhs, lhs_sql), (self.rhs, rhs_sql)):
+            for expression in expressions:
+                sql, expression_params = compiler.compile(expression)
+                sqls.append(sql)
+                params.extend(expression_params)
+
+        return f"({', '.join(lhs_sql)}) {self.operator} ({', '.join(rhs_sql)})", params
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates by seeking past the ordering values of the last row served
+    instead of using OFFSET, so every page costs the same no matter how deep
+    it is.
+
+    The ordering is the queryset's (or the model's `Meta.ordering`), with the
+    primary key appended as tie-breaker, eg `(category_id, name, id)` for
+    products. Ordering fields must be non-nullable columns of the model or
+    non-nullable annotations of the queryset (eg search ranks).
+
+    Unlike DRF's CursorPagination, which seeks by the first ordering field
+    only and skips ties with an offset, the position holds every ordering
+    field, so it is exact whatever the number of ties.
+
+    The total of rows is given by `count_strategy_class`, which avoids exact
+    counts unless the client asks for `?count=exact`.
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = _('Invalid cursor')
+    page_size = api_settings.PAGE_SIZE
+
+    # Client can control the page size using this query parameter, up to
+    # `max_page_size`.
+    page_size_query_param = 'limit'
+    max_page_size = 500
+
+    count_strategy_class = CountStrategy
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.count = self.count_strategy_class().get_count(queryset, request)
+        self.ordering = self.get_ordering(queryset)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+
+        queryset = queryset.order_by(*[
+            f'-{o.lookup}' if o.descending != reverse else o.lookup
+            for o in self.ordering
+        ])
+
+        if self.cursor is not None:
+            queryset = queryset.filter(self.get_keyset_condition(self.cursor))
+
+        # Fetches an extra row to know whether there is a following page.
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following = len(results) > self.page_size
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = True
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = self.cursor is not None
+
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('count', self.count),
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'count': {
+                    'type': 'integer',
+                    'example': 123,
+                },
+                'next': {
+                    'type': 'string',
+                    'nullable': True,
+                },
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                },
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                return positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size
+                )
+            except (KeyError, ValueError):
+                pass
+
+        return self.page_size
+
+    def get_ordering(self, queryset) -> list:
+        model = queryset.model
+        ordering = list()
+
+        for name in queryset.query.order_by or model._meta.ordering:
+            if not isinstance(name, str):
+                raise ImproperlyConfigured(
+                    f'{self.__class__.__name__} only supports ordering by field names.'
+                )
+
+            descending = name.startswith('-')
+            lookup = name.lstrip('-')
+            if lookup in queryset.query.annotations:
+                field = queryset.query.annotations[lookup].output_field
+                ordering.append(OrderingField(field, lookup, descending))
+                continue
+
+            try:
+                field = model._meta.pk if lookup == 'pk' else model._meta.get_field(lookup)
+            except FieldDoesNotExist:
+                raise ImproperlyConfigured(
+                    f'{self.__class__.__name__} cannot order by "{lookup}":'
+                    f' only columns and annotations of {model.__name__} are supported.'
+                )
+
+            ordering.append(OrderingField(field, lookup, descending))
+
+        if model._meta.pk not in [o.field for o in ordering]:
+            ordering.append(OrderingField(model._meta.pk, model._meta.pk.attname, False))
+
+        return ordering
+
+    def get_keyset_condition(self, cursor: Cursor):
+        """
+        Rows placed after the cursor position in the requested direction.
+        """
+        values = [
+            Value(o.field.to_python(v), output_field=o.field)
+            for o, v in zip(self.ordering, cursor.position)
+        ]
+        forward = [o.descending == cursor.reverse for o in self.ordering]
+
+        if all(forward) or not any(forward):
+            return KeysetRowComparison(
+                [F(o.lookup) for o in self.ordering],
+                values,
+                '>' if forward[0] else '<',
+            )
+
+        # Mixed directions cannot be expressed as a row comparison.
+        conditions = list()
+        for i, o in enumerate(self.ordering):
+            lookups = {p.lookup: v for p, v in zip(self.ordering[:i], values[:i])}
+            lookups[f"{o.lookup}__{'gt' if forward[i] else 'lt'}"] = values[i]
+            conditions.append(Q(**lookups))
+
+        return reduce(or_, conditions)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(Cursor(self.get_position(self.page[-1]), False))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+
+        return self.encode_cursor(Cursor(self.get_position(self.page[0]), True))
+
+    def get_position(self, row) -> list:
+        position = list()
+        for o in self.ordering:
+            if isinstance(row, dict):
+                value = row[o.lookup] if o.lookup in row else row[o.field.attname]
+            else:
+                # Annotation output fields are not bound to the model
+                value = getattr(row, getattr(o.field, 'attname', o.lookup))
+            position.append(self.encode_value(value))
+
+        return position
+
+    @staticmethod
+    def encode_value(value):
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+
+        if isinstance(value, (UUID, Decimal)):
+            return str(value)
+
+        return value
+
+    def encode_cursor(self, cursor: Cursor):
+        tokens = {'p': cursor.position}
+        if cursor.reverse:
+            tokens['r'] = 1
+
+        encoded = urlsafe_b64encode(json.dumps(tokens, separators=(',', ':')).encode('utf-8'))
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded.decode('ascii'))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            tokens = json.loads(urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            position = tokens['p']
+            reverse = bool(tokens.get('r', False))
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError()
+
+            for o, value in zip(self.ordering, position):
+                o.field.to_python(value)
+
+        except (BinasciiError, UnicodeError, TypeError, KeyError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(position, reverse)
@@ -0,0 +1,14 @@
+def positive_int(integer_string, strict: bool = False, cutoff: int = None) -> int:
+    """
+    Casts a query parameter to a positive integer, at most `cutoff`. Zero is
+    rejected when `strict`.
+    :raise ValueError
+    """
+    value = int(integer_string)
+    if value < 0 or (value == 0 and strict):
+        raise ValueError(f'Expected a positive integer: {integer_string}')
+
+    if cutoff:
+        return min(value, cutoff)
+
+    return value
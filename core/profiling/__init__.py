@@ -0,0 +1,10 @@
+from .profile_store import add_profile, get_profile, list_profiles  # noqa
+from .sampling import (  # noqa
+    PROFILE_TOKEN_HEADER,
+    PROFILE_TOKEN_PARAM,
+    is_valid_profile_token,
+    make_profile_token,
+    should_profile_request,
+    should_profile_task,
+)
+from .stack_sampler import StackSampler, format_folded  # noqa
@@ -0,0 +1,67 @@
+"""
+Bounded ring buffer of profiles, kept in the cache (Redis) so that every
+process writes to and reads from the same buffer.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+PROFILE_KEY_PREFIX = 'profiling'
+
+
+def _get_size() -> int:
+    return getattr(settings, 'PROFILING_BUFFER_SIZE', 100)
+
+
+def _get_slot_key(profile_id: int) -> str:
+    return f'{PROFILE_KEY_PREFIX}:slot:{profile_id % _get_size()}'
+
+
+def _next_id() -> int:
+    key = f'{PROFILE_KEY_PREFIX}:counter'
+    try:
+        return cache.incr(key)
+    except ValueError:
+        if cache.add(key, 1, timeout=None) is True:
+            return 1
+        return cache.incr(key)
+
+
+def add_profile(kind: str, name: str, sampler, **info) -> int:
+    """
+    Stores the stacks of a `StackSampler` with information about what was
+    profiled, eg the request method and status, overwriting the oldest
+    profile once the buffer is full. Returns the id of the profile.
+    """
+    profile_id = _next_id()
+    profile = {
+        'id': profile_id,
+        'kind': kind,
+        'name': name,
+        'created_at': timezone.now().isoformat(),
+        'duration_ms': round(sampler.duration * 1000, 1),
+        'interval_ms': round(sampler.interval * 1000, 1),
+        'samples': sampler.samples,
+        **info,
+        'stacks': dict(sampler.stacks),
+    }
+    cache.set(_get_slot_key(profile_id), profile, timeout=getattr(settings, 'PROFILING_TIMEOUT', 7 * 24 * 3600))
+    return profile_id
+
+
+def get_profile(profile_id: int):
+    """ The profile, `None` when it was overwritten or expired """
+    profile = cache.get(_get_slot_key(profile_id))
+    if profile is None or profile['id'] != profile_id:
+        return None
+    return profile
+
+
+def list_profiles() -> list:
+    """ Profiles in the buffer, without their stacks, newest first """
+    keys = [f'{PROFILE_KEY_PREFIX}:slot:{slot}' for slot in range(_get_size())]
+    profiles = [
+        {k: v for k, v in profile.items() if k != 'stacks'}
+        for profile in cache.get_many(keys).values()
+    ]
+    return sorted(profiles, key=lambda p: -p['id'])
@@ -0,0 +1,53 @@
+"""
+Selection of the requests and tasks to profile
+"""
+import random
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+
+PROFILE_TOKEN_SALT = 'core.profiling'
+PROFILE_TOKEN_HEADER = 'X-Profile-Token'
+PROFILE_TOKEN_PARAM = 'profile'
+
+
+def make_profile_token(user) -> str:
+    """
+    Token profiling every request it is sent with, as `X-Profile-Token`
+    header or `?profile=`, while the staff user it was made for stays staff
+    and for `PROFILING_TOKEN_MAX_AGE` seconds.
+    """
+    return signing.TimestampSigner(salt=PROFILE_TOKEN_SALT).sign(str(user.pk))
+
+
+def is_valid_profile_token(token: str) -> bool:
+    try:
+        user_pk = signing.TimestampSigner(salt=PROFILE_TOKEN_SALT).unsign(
+            token, max_age=getattr(settings, 'PROFILING_TOKEN_MAX_AGE', 3600),
+        )
+    except signing.BadSignature:
+        return False
+
+    return get_user_model().objects.filter(pk=user_pk, is_staff=True, is_active=True).exists()
+
+
+def is_sampled(rate: float) -> bool:
+    return rate > 0 and random.random() < rate
+
+
+def should_profile_request(request) -> bool:
+    """ Whether the request brings a valid profile token or is sampled by `PROFILING_SAMPLE_RATE` """
+    token = request.headers.get(PROFILE_TOKEN_HEADER) or request.GET.get(PROFILE_TOKEN_PARAM)
+    if token and is_valid_profile_token(token):
+        return True
+
+    return is_sampled(getattr(settings, 'PROFILING_SAMPLE_RATE', 0))
+
+
+def should_profile_task(task) -> bool:
+    """ Whether the task is one of `PROFILING_TASKS` or is sampled by `PROFILING_TASK_SAMPLE_RATE` """
+    if task.name in getattr(settings, 'PROFILING_TASKS', ()):
+        return True
+
+    return is_sampled(getattr(settings, 'PROFILING_TASK_SAMPLE_RATE', 0))
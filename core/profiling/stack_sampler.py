@@ -0,0 +1,78 @@
+import sys
+import threading
+import time
+from collections import Counter
+
+
+def get_frame_label(frame) -> str:
+    """ `module:function` of the frame """
+    module = frame.f_globals.get('__name__') or frame.f_code.co_filename
+    return f'{module}:{frame.f_code.co_name}'
+
+
+class StackSampler:
+    """
+    Statistical profiler of a thread (the one entering it by default): a
+    background thread samples its call stack every `interval` seconds while
+    the block runs, so the profiled code is not slowed down by tracing.
+
+        with StackSampler() as sampler:
+            ...
+
+        sampler.stacks  # {'root;caller;callee': samples}
+
+    Stacks are folded, outermost frame first, as flame graph tools
+    (flamegraph.pl, speedscope, inferno) read them; see `get_folded()`.
+    """
+    max_depth = 128
+
+    def __init__(self, interval: float = 0.005, thread_id: int = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._stopped = threading.Event()
+        self._thread = None
+        self._start = None
+
+    def start(self):
+        self.thread_id = self.thread_id or threading.get_ident()
+        self._stopped.clear()
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._start
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # pylint: disable=protected-access
+            if frame is None:
+                continue
+
+            labels = list()
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(get_frame_label(frame))
+                frame = frame.f_back
+
+            self.stacks[';'.join(reversed(labels))] += 1
+            self.samples += 1
+
+    def get_folded(self) -> str:
+        return format_folded(self.stacks)
+
+
+def format_folded(stacks: dict) -> str:
+    """ Folded stacks text, a `stack samples` line each, most sampled first """
+    return ''.join(f'{stack} {samples}\n' for stack, samples in sorted(stacks.items(), key=lambda s: -s[1]))
@@ -0,0 +1,31 @@
+"""
+Profiling of Celery tasks, connected to the signals of the worker they run
+in. Tasks are selected by `should_profile_task()`.
+"""
+from celery import signals
+from django.conf import settings
+
+from .profile_store import add_profile
+from .sampling import should_profile_task
+from .stack_sampler import StackSampler
+
+# Samplers of the tasks being profiled, by task id
+_samplers = dict()
+
+
+@signals.task_prerun.connect
+def start_task_profiling(task_id=None, task=None, **_):
+    if should_profile_task(task):
+        sampler = StackSampler(interval=getattr(settings, 'PROFILING_INTERVAL', 0.005))
+        _samplers[task_id] = sampler
+        sampler.start()
+
+
+@signals.task_postrun.connect
+def stop_task_profiling(task_id=None, task=None, state=None, **_):
+    sampler = _samplers.pop(task_id, None)
+    if sampler is None:
+        return
+
+    sampler.stop()
+    add_profile('task', task.name, sampler, task_id=task_id, status=state)
@@ -0,0 +1,2 @@
+from .query_budget import QueryBudgetAPIClient, QueryBudgetExceeded, get_query_budget  # noqa
+from .query_inspector import QueryInspector, normalize_sql  # noqa
@@ -0,0 +1,51 @@
+"""
+Query budgets of viewset actions
+"""
+from rest_framework.test import APIClient
+
+from .query_inspector import QueryInspector
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def get_query_budget(resolver_match, method: str) -> tuple:
+    """
+    (action, budget) of the viewset action the request was resolved to.
+    Viewsets declare budgets as the maximum number of queries by action:
+
+        query_budgets = {'list': 3, 'retrieve': 2}
+
+    The budget is `None` when the action has none declared, as bulk actions,
+    whose queries grow with the number of items.
+    """
+    func = getattr(resolver_match, 'func', None)
+    actions = getattr(func, 'actions', None) or dict()
+    action = actions.get(method.lower())
+    budgets = getattr(getattr(func, 'cls', None), 'query_budgets', None) or dict()
+    return action, budgets.get(action)
+
+
+class QueryBudgetAPIClient(APIClient):
+    """
+    Test client failing requests which run more queries than the budget of
+    the viewset action they are resolved to (`query_budgets` of the viewset,
+    see `get_query_budget`). Set it as `client_class` of
+    `APITestCase` suites to enforce budgets on every request they make.
+
+    Queries run while streaming responses are not counted.
+    """
+
+    def request(self, **kwargs):
+        with QueryInspector() as inspector:
+            response = super().request(**kwargs)
+
+        action, budget = get_query_budget(response.resolver_match, kwargs['REQUEST_METHOD'])
+        if budget is not None and inspector.count > budget:
+            queries = '\n'.join(f'  {q.sql}' for q in inspector.queries)
+            raise QueryBudgetExceeded(
+                f'{response.resolver_match.view_name} ({action}) ran {inspector.count} queries, over its budget of {budget}:\n{queries}'
+            )
+
+        return response
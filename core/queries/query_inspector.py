@@ -0,0 +1,88 @@
+"""
+Inspection of the queries run by a block of code, eg a request
+"""
+import re
+import time
+from collections import Counter, namedtuple
+
+from django.db import connections
+
+from core.metrics.request_metrics import TRANSACTION_STATEMENTS
+
+InspectedQuery = namedtuple('InspectedQuery', ('sql', 'shape', 'duration'))
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_VALUES_RE = re.compile(r'(\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Shape of the SQL: literals and parameters replaced by `?` and lists of
+    them, eg `IN (%s, %s)` or rows of `VALUES`, collapsed into `(...)`, so
+    that queries differing only by values share their shape.
+    """
+    shape = _STRING_RE.sub('?', sql.replace('%s', '?'))
+    shape = _NUMBER_RE.sub('?', shape)
+    shape = _PLACEHOLDER_LIST_RE.sub('(...)', shape)
+    shape = _VALUES_RE.sub(r'\1', shape)
+    return _SPACE_RE.sub(' ', shape).strip()
+
+
+class QueryInspector:
+    """
+    Context manager recording the queries run on the given database aliases
+    (all of them by default) through `connection.execute_wrapper`:
+
+        with QueryInspector() as inspector:
+            client.get('/stock/products/')
+
+        inspector.count                 # queries run, transaction control apart
+        inspector.get_repeated_shapes() # [(shape, times)], eg N+1 patterns
+
+    SQL shapes run `repeat_threshold` times or more are reported as
+    repeated: that is how a query per row of a list (N+1) shows up.
+    """
+    repeat_threshold = 3
+
+    def __init__(self, using: list = None, repeat_threshold: int = None):
+        self.using = using
+        self.repeat_threshold = repeat_threshold or self.repeat_threshold
+        self.queries = list()
+        self._wrappers = list()
+
+    def __enter__(self):
+        aliases = self.using or list(connections)
+        for alias in aliases:
+            wrapper = connections[alias].execute_wrapper(self)
+            wrapper.__enter__()
+            self._wrappers.append(wrapper)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        while self._wrappers:
+            self._wrappers.pop().__exit__(exc_type, exc_value, traceback)
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if not sql.lstrip().upper().startswith(TRANSACTION_STATEMENTS):
+                self.queries.append(InspectedQuery(sql, normalize_sql(sql), time.perf_counter() - start))
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def duration(self) -> float:
+        """ Seconds spent running queries """
+        return sum(q.duration for q in self.queries)
+
+    def get_repeated_shapes(self) -> list:
+        """ (shape, times) of the shapes run `repeat_threshold` times or more """
+        shapes = Counter(q.shape for q in self.queries)
+        return [(shape, times) for shape, times in shapes.most_common() if times >= self.repeat_threshold]
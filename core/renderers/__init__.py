@@ -0,0 +1,2 @@
+from .export_renderers import CSVRenderer, NDJSONRenderer  # noqa
+from .json_renderers import FastJSONRenderer, iter_json_envelope  # noqa
@@ -0,0 +1,74 @@
+import csv
+from abc import ABC, abstractmethod
+from io import StringIO
+
+from rest_framework.renderers import BaseRenderer
+
+from .json_renderers import FastJSONRenderer
+
+
+def flatten_row(row: dict, prefix: str = '') -> dict:
+    """ Nested objects as dotted keys, eg `{'category.name': ...}` """
+    flat = dict()
+    for key, value in row.items():
+        if isinstance(value, dict):
+            flat.update(flatten_row(value, f'{prefix}{key}.'))
+        else:
+            flat[f'{prefix}{key}'] = value
+    return flat
+
+
+class RowStreamRendererMixin(ABC):
+    """
+    Renders rows one by one through `iter_render()`, so that exports can be
+    streamed. Any other data (eg errors) is rendered as a single row.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        rows = data if isinstance(data, list) else [data]
+        return b''.join(self.iter_render(rows))
+
+    @abstractmethod
+    def iter_render(self, rows):  # pragma: no cover
+        pass
+
+
+class NDJSONRenderer(RowStreamRendererMixin, BaseRenderer):
+    """ One JSON object per line """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+
+    def iter_render(self, rows):
+        dumps = FastJSONRenderer().dumps
+        for row in rows:
+            yield dumps(row) + b'\n'
+
+
+class CSVRenderer(RowStreamRendererMixin, BaseRenderer):
+    """
+    Comma-separated values, with a header of the fields of the first row.
+    Nested objects are output as `<field>.<sub-field>` columns.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def iter_render(self, rows):
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        header = None
+
+        for row in rows:
+            row = flatten_row(row)
+            if header is None:
+                header = list(row.keys())
+                writer.writerow(header)
+
+            writer.writerow([row.get(f) for f in header])
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
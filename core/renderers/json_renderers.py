@@ -0,0 +1,72 @@
+import json
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.compat import SHORT_SEPARATORS
+
+# Escaped as DRF does, so output is a strict JavaScript subset.
+LINE_SEPARATORS = (
+    ('\u2028'.encode(), b'\\u2028'),
+    ('\u2029'.encode(), b'\\u2029'),
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer encoding with `orjson`, which serializes UUIDs, datetimes
+    and dicts natively, several times faster than the standard library.
+
+    Falls back to DRF's encoding when the output is indented (eg browsable
+    API) or configured to be ASCII only.
+    Unlike DRF's strict mode, NaN and infinite floats are output as `null`.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if not self.is_fast_encoding_enabled() or indent is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return self.dumps(data)
+
+    def is_fast_encoding_enabled(self) -> bool:
+        return self.compact is True and self.ensure_ascii is False
+
+    def dumps(self, data) -> bytes:
+        """ Compact JSON of `data`, as bytes """
+        if self.is_fast_encoding_enabled():
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        else:
+            ret = json.dumps(
+                data, cls=self.encoder_class,
+                ensure_ascii=self.ensure_ascii,
+                allow_nan=not self.strict, separators=SHORT_SEPARATORS,
+            ).encode()
+
+        for separator, escaped in LINE_SEPARATORS:
+            ret = ret.replace(separator, escaped)
+        return ret
+
+
+def iter_json_envelope(envelope: dict, rows, dumps, rows_key: str = 'results'):
+    """
+    Yields JSON of the envelope (eg `count`, `next`, `previous`) with `rows`
+    in its `rows_key` list, encoding rows one by one with `dumps`, so that
+    the whole output is never held in memory.
+    """
+    yield b'{'
+    for key, value in envelope.items():
+        if key == rows_key:
+            continue
+        yield dumps(key) + b':' + dumps(value) + b','
+
+    yield dumps(rows_key) + b':['
+    for index, row in enumerate(rows):
+        yield (b',' if index else b'') + dumps(row)
+    yield b']}'
@@ -1,2 +1,4 @@
-from .fields_serializer_mixin import FieldsSerializerMixin  # noqa
+from .fields_serializer_mixin import FieldsSerializerMixin, parse_requested_fields  # noqa
 from .form_serializer_mixin import FormSerializerMixin  # noqa
+from .nested_serializer_mixin import NestedSerializerMixin  # noqa
+from .row_renderer import RowRenderer, get_row_renderer  # noqa
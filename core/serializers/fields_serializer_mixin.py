@@ -1,20 +1,108 @@
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+
+from core.metrics import timed
+
+
+def parse_requested_fields(fields) -> tuple:
+    """
+    Splits requested fields into top-level field names and sub-fields
+    requested for nested objects, eg:
+
+        ['pk', 'category.name'] -> (['pk', 'category'], {'category': ['name']})
+
+    A bare name or `<name>.*` requests every sub-field of the nested object.
+    """
+    field_names = list()
+    nested_fields = dict()
+    all_nested_fields = set()
+
+    for f in fields or list():
+        name, _, sub_field = f.partition('.')
+        if name not in field_names:
+            field_names.append(name)
+
+        if not sub_field or sub_field == '*':
+            all_nested_fields.add(name)
+            continue
+
+        nested_fields.setdefault(name, list())
+        if sub_field not in nested_fields[name]:
+            nested_fields[name].append(sub_field)
+
+    for name in all_nested_fields:
+        nested_fields.pop(name, None)
+
+    return field_names, nested_fields
+
+
+# Pruned field maps shared by serializer instances, most recently used last.
+_fields_cache = OrderedDict()
+_fields_cache_lock = Lock()
+
+
 class FieldsSerializerMixin:
+    """
+    Outputs only fields requested through the context (`?fields=`), leaving
+    out excluded ones and optional ones not requested.
+
+    Building fields of model serializers is expensive, so pruned field maps
+    are built once per serializer class and requested/excluded fields and
+    kept in a bounded process-wide cache; serializers get copies of them.
+    Set `cache_fields = False` on serializers whose fields depend on anything
+    else, eg the request user.
+    """
+    cache_fields = True
+    fields_cache_size = 256
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        fields = self.get_requested_fields()
-        if fields:
+        # Fields are pruned according to the context the serializer is created
+        # with, before it is bound to any parent serializer.
+        self.fields  # pylint: disable=pointless-statement
+
+    def get_fields(self):
+        if self.cache_fields is False:
+            return self.prune_fields(super().get_fields())
+
+        key = (
+            self.__class__,
+            tuple(sorted(self.get_requested_fields())),
+            tuple(sorted(self.get_excluded_fields() or list())),
+        )
+
+        with _fields_cache_lock:
+            fields = _fields_cache.get(key)
+            if fields is not None:
+                _fields_cache.move_to_end(key)
+
+        if fields is None:
+            fields = self.prune_fields(super().get_fields())
+            with _fields_cache_lock:
+                _fields_cache[key] = fields
+                while len(_fields_cache) > self.fields_cache_size:
+                    _fields_cache.popitem(last=False)
+
+        return deepcopy(fields)
+
+    def prune_fields(self, fields: dict) -> dict:
+        requested_fields = self.get_requested_fields()
+        if requested_fields:
             # Drop any fields that are not specified in the `fields` argument.
-            for field_name in set(self.field_names) - set(fields):
-                self.fields.pop(field_name)
+            fields = {k: v for k, v in fields.items() if k in requested_fields}
+        else:
+            # Optional fields are only output when explicitly requested.
+            optional_fields = self.get_optional_fields()
+            fields = {k: v for k, v in fields.items() if k not in optional_fields}
+
+        excluded_fields = self.get_excluded_fields() or list()
+        return OrderedDict((k, v) for k, v in fields.items() if k not in excluded_fields)
 
-        excluded_fields = self.get_excluded_fields()
-        if excluded_fields:
-            for f in self.field_names:
-                if f not in excluded_fields:
-                    continue
-                self.fields.pop(f)
+    def to_representation(self, instance):
+        with timed('serializer'):
+            return super().to_representation(instance)
 
     @property
     def field_names(self):
@@ -23,6 +111,9 @@ class FieldsSerializerMixin:
     def has_field(self, field_name):
         return field_name in self.field_names
 
+    def get_optional_fields(self):
+        return getattr(getattr(self, 'Meta', None), 'optional_fields', tuple())
+
     def get_excluded_fields(self):
         return self.context.get('excluded_fields')
 
@@ -34,11 +125,12 @@ class FieldsSerializerMixin:
             if f not in excluded_fields
         ]
 
+    def get_requested_nested_fields(self, field_name):
+        return self.context.get('nested_fields', dict()).get(field_name, list())
+
     def has_requested_fields(self):
         return self.get_requested_fields() != []
 
     def is_requested_field(self, field_name):
-        if self.has_requested_fields() is False:
-            return True
-
-        return field_name in self.get_requested_fields()
+        requested_fields = self.get_requested_fields()
+        return not requested_fields or field_name in requested_fields
@@ -6,6 +6,7 @@ from django.forms.models import model_to_dict
 from rest_framework import serializers
 from rest_framework.fields import empty
 
+from core.metrics import timed
 from .fields_serializer_mixin import FieldsSerializerMixin
 
 
@@ -57,6 +58,7 @@ class FormSerializerMixin(FieldsSerializerMixin):
         data = self.normalize_data(data)
         return super().to_internal_value(data)
 
+    @timed('form')
     def validate(self, data):
 
         form_data = data
@@ -99,6 +101,11 @@ class FormSerializerMixin(FieldsSerializerMixin):
         if not self.form_instance:
             self.form_instance = self.Meta.form(data=data, files=files, **kwargs)
 
+            # Domain rules of batches are run once for all items, see
+            # DomainRuleMixin.validate_many().
+            if self.context.get('defer_domain_rules') is True:
+                self.form_instance.instance.ignore_validation = True
+
         return self.form_instance
 
     # def to_internal_value(self, data):
@@ -0,0 +1,51 @@
+from core.metrics import timed
+from .fields_serializer_mixin import parse_requested_fields
+
+
+class NestedSerializerMixin:
+    """
+    Outputs related objects through the serializers declared in
+    `Meta.nested_serializers`, eg:
+
+        class Meta:
+            nested_serializers = {'category': SimpleCategorySerializer}
+
+    The declaration is also read by `QuerysetPlannerViewsetMixin` to join
+    or prefetch those relations in advance. Sub-fields requested as
+    `?fields=category.name` are passed down to the nested serializer.
+    """
+
+    @classmethod
+    def get_nested_serializers(cls) -> dict:
+        meta = getattr(cls, 'Meta', None)
+        return getattr(meta, 'nested_serializers', None) or dict()
+
+    def get_nested_context(self, field_name) -> dict:
+        nested_fields = self.context.get('nested_fields', dict()).get(field_name)
+        fields, nested_fields = parse_requested_fields(nested_fields)
+        if not fields:
+            return dict()
+
+        return {'fields': fields, 'nested_fields': nested_fields}
+
+    @timed('serializer')
+    def to_representation(self, instance):
+        rep = super().to_representation(instance)
+
+        for field_name, serializer_class in self.get_nested_serializers().items():
+            if field_name not in rep:
+                continue
+
+            value = getattr(instance, field_name)
+            if value is None:
+                rep[field_name] = None
+                continue
+
+            many = hasattr(value, 'all')
+            rep[field_name] = serializer_class(
+                instance=value.all() if many else value,
+                many=many,
+                context=self.get_nested_context(field_name),
+            ).data
+
+        return rep
@@ -0,0 +1,132 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.relations import PKOnlyObject, RelatedField
+
+from core.metrics import timed
+from .fields_serializer_mixin import FieldsSerializerMixin, parse_requested_fields
+from .nested_serializer_mixin import NestedSerializerMixin
+
+RowColumn = namedtuple('RowColumn', ('field_name', 'lookup', 'to_representation', 'nested'))
+
+
+class RowRenderer:
+    """
+    Renders rows read by `queryset.values(*renderer.lookups)` as the
+    serializer would render model instances, skipping model instantiation
+    and the serializer machinery. Values are formatted by the serializer
+    fields themselves, so output is the same.
+
+    Only serializers whose output fields are model columns, forward
+    relations rendered as primary keys or objects of
+    `Meta.nested_serializers` can be rendered; see `get_row_renderer()`.
+    """
+
+    def __init__(self, columns: list, lookups: list):
+        self.columns = columns
+        self.lookups = lookups
+
+    def render(self, row: dict) -> dict:
+        rep = dict()
+        for column in self.columns:
+            value = row[column.lookup]
+            if value is None:
+                rep[column.field_name] = None
+            elif column.nested is not None:
+                rep[column.field_name] = column.nested.render(row)
+            else:
+                rep[column.field_name] = column.to_representation(value)
+
+        return rep
+
+    def render_many(self, rows) -> list:
+        with timed('serializer'):
+            return [self.render(row) for row in rows]
+
+    def iter_render(self, rows):
+        for row in rows:
+            yield self.render(row)
+
+
+def _to_pk_representation(field):
+    def to_representation(value):
+        return field.to_representation(PKOnlyObject(pk=value))
+
+    return to_representation
+
+
+def _build_row_renderer(serializer_class, context: dict, prefix: str = ''):
+    renderable_methods = (
+        serializers.Serializer.to_representation,
+        FieldsSerializerMixin.to_representation,
+        NestedSerializerMixin.to_representation,
+    )
+    if getattr(serializer_class, 'to_representation', None) not in renderable_methods:
+        return None
+
+    model = serializer_class.Meta.model
+    serializer = serializer_class(context=context)
+    get_nested_serializers = getattr(serializer_class, 'get_nested_serializers', dict)
+    nested_serializers = get_nested_serializers()
+
+    columns = list()
+    lookups = list()
+    for field_name, field in serializer.fields.items():
+        if field.write_only is True:
+            continue
+
+        if len(field.source_attrs) != 1 or isinstance(field, serializers.SerializerMethodField):
+            return None
+
+        source = field.source_attrs[0]
+        try:
+            model_field = model._meta.pk if source == 'pk' else model._meta.get_field(source)
+        except FieldDoesNotExist:
+            return None
+
+        lookup = f'{prefix}{source}'
+
+        if model_field.is_relation is False:
+            if isinstance(field, serializers.Serializer):
+                return None
+            columns.append(RowColumn(field_name, lookup, field.to_representation, None))
+            lookups.append(lookup)
+            continue
+
+        if model_field.concrete is False or model_field.many_to_many is True:
+            return None
+
+        if field_name in nested_serializers:
+            nested_context = serializer.get_nested_context(field_name)
+            nested = _build_row_renderer(nested_serializers[field_name], nested_context, f'{lookup}__')
+            if nested is None:
+                return None
+
+            columns.append(RowColumn(field_name, lookup, None, nested))
+            lookups += [lookup] + [n for n in nested.lookups if n not in lookups]
+            continue
+
+        if isinstance(field, RelatedField) is False:
+            return None
+
+        columns.append(RowColumn(field_name, lookup, _to_pk_representation(field), None))
+        lookups.append(lookup)
+
+    return RowRenderer(columns, list(dict.fromkeys(lookups)))
+
+
+@lru_cache(maxsize=256)
+def get_row_renderer(serializer_class, fields: tuple = (), excluded_fields: tuple = ()):
+    """
+    Row renderer of the serializer for the requested fields, or `None` when
+    some output field cannot be read from `.values()` (eg method fields,
+    multi-valued relations or serializers with custom representations).
+    """
+    field_names, nested_fields = parse_requested_fields(fields)
+    context = {'excluded_fields': list(excluded_fields)}
+    if field_names:
+        context.update({'fields': field_names, 'nested_fields': nested_fields})
+
+    return _build_row_renderer(serializer_class, context)
@@ -1 +1,11 @@
+from .bulk_viewset_mixin import BulkViewsetMixin  # noqa
+from .cached_response_viewset_mixin import CachedResponseViewsetMixin  # noqa
+from .conditional_response_viewset_mixin import ConditionalResponseViewsetMixin  # noqa
+from .export_viewset_mixin import ExportViewsetMixin  # noqa
 from .field_request_viewset_mixin import FieldRequestViewsetMixin  # noqa
+from .job_viewset import JobViewSet, is_async_request  # noqa
+from .profile_viewset import ProfileViewSet  # noqa
+from .queryset_planner_viewset_mixin import QuerysetPlannerViewsetMixin  # noqa
+from .row_renderer_viewset_mixin import RowRendererViewsetMixin  # noqa
+from .streaming_list_viewset_mixin import StreamingListViewsetMixin  # noqa
+from .suggest_viewset_mixin import SuggestViewsetMixin  # noqa
@@ -0,0 +1,102 @@
+from django.utils.translation import gettext as _
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+from core.bulk import BulkProcessor
+from .job_viewset import is_async_request
+
+
+class BulkViewsetMixin:
+    """
+    Adds `POST/PATCH/DELETE <list url>/bulk/` to create, partially update or
+    delete many records in one request. Payloads are lists of items, deletion
+    accepting primary keys as well. Nothing is written when any item is
+    invalid, and errors are reported per item index.
+
+    Requests with `Prefer: respond-async` are processed in chunks by
+    `bulk_job_task`, receiving the serializer class name, the HTTP method
+    and the items (and `bulk_job_chunk_size`), and are answered with
+    `202 Accepted` and the job URL. Up to `bulk_job_max_items` items are
+    accepted in such requests.
+    """
+    bulk_processor_class = BulkProcessor
+    bulk_max_items = 1000
+
+    bulk_job_task = None
+    bulk_job_max_items = 100000
+    bulk_job_chunk_size = 500
+    job_url_name = 'job-detail'
+
+    def get_bulk_processor(self):
+        return self.bulk_processor_class(
+            self.get_serializer_class(),
+            context=self.get_serializer_context(),
+        )
+
+    def get_bulk_items(self, max_items: int = None) -> list:
+        max_items = max_items or self.bulk_max_items
+        items = self.request.data
+        if not isinstance(items, list):
+            raise ValidationError({'non_field_errors': [_('Expected a list of items.')]})
+
+        if len(items) > max_items:
+            raise ValidationError({'non_field_errors': [
+                _('Ensure there are no more than {} items.').format(max_items)
+            ]})
+
+        return items
+
+    def is_bulk_job_request(self) -> bool:
+        return self.bulk_job_task is not None and is_async_request(self.request)
+
+    def get_job_response(self, job_id: str) -> Response:
+        url_name = self.job_url_name
+        namespace = self.request.resolver_match.namespace
+        if namespace:
+            url_name = f'{namespace}:{url_name}'
+
+        url = reverse(url_name, kwargs={'pk': job_id}, request=self.request)
+        return Response(
+            {'id': job_id, 'url': url},
+            status=status.HTTP_202_ACCEPTED,
+            headers={'Location': url, 'Preference-Applied': 'respond-async'},
+        )
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request, *args, **kwargs):
+        if self.is_bulk_job_request():
+            items = self.get_bulk_items(max_items=self.bulk_job_max_items)
+            job = self.bulk_job_task.delay(
+                self.get_serializer_class().__name__,
+                request.method,
+                items,
+                chunk_size=self.bulk_job_chunk_size,
+            )
+            return self.get_job_response(job.id)
+
+        items = self.get_bulk_items()
+        processor = self.get_bulk_processor()
+
+        if request.method == 'DELETE':
+            result = processor.delete(items)
+            success_status = status.HTTP_204_NO_CONTENT
+
+        elif request.method == 'PATCH':
+            result = processor.update(items)
+            success_status = status.HTTP_200_OK
+
+        else:
+            result = processor.create(items)
+            success_status = status.HTTP_201_CREATED
+
+        if result.errors:
+            return Response({'errors': result.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        if success_status == status.HTTP_204_NO_CONTENT:
+            return Response(status=success_status)
+
+        serializer = self.get_serializer(result.instances, many=True)
+        return Response(serializer.data, status=success_status)
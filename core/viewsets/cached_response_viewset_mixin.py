@@ -0,0 +1,91 @@
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.cache import get_generations
+
+
+def get_request_signature(viewset) -> str:
+    """
+    Identifies what a read request outputs: scheme and host (absolute links
+    are built from them), path, normalized query string, requested fields and
+    language.
+    """
+    request = viewset.request
+    query_params = sorted(
+        (name, sorted(values))
+        for name, values in request.query_params.lists()
+        if name != 'fields'
+    )
+    get_requested_fields = getattr(viewset, 'get_requested_fields', None)
+    fields = sorted(get_requested_fields()) if get_requested_fields else []
+
+    return f'{request.scheme}://{request.get_host()}{request.path}{query_params}{fields}{get_language()}'
+
+
+def get_read_tables(model) -> list:
+    """
+    Tables read to output records of the model: its own table and the ones
+    of the models related to it, which may be filtered by, output as nested
+    objects or annotated (eg deletability).
+    """
+    table_names = {model._meta.db_table}
+    for f in model._meta.get_fields(include_hidden=True):
+        if f.is_relation is True and f.related_model is not None:
+            table_names.add(f.related_model._meta.db_table)
+
+    return sorted(table_names)
+
+
+class CachedResponseViewsetMixin:
+    """
+    Caches data of successful list and retrieve responses. Entries are keyed
+    by the normalized query string, the requested fields, the language and
+    the generation counters of the tables the responses are read from (see
+    `core.cache.generations`), so any write to those tables makes them
+    unreachable.
+
+    Responses are shared by all users: do not use it on viewsets whose output
+    depends on who requests it.
+    """
+    cached_response_actions = ('list', 'retrieve')
+    response_cache_key_prefix = 'response'
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        if self.action not in self.cached_response_actions:
+            return handler(request, *args, **kwargs)
+
+        key = self.get_response_cache_key()
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = handler(request, *args, **kwargs)
+        # Streamed responses are not held in memory to be cached.
+        if isinstance(response, Response) and response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout=getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 600))
+
+        return response
+
+    def get_response_cache_tables(self) -> list:
+        return get_read_tables(self.get_queryset().model)
+
+    def get_response_cache_key(self) -> str:
+        table_names = self.get_response_cache_tables()
+        generations = get_generations(*table_names)
+
+        digest = md5(
+            f'{get_request_signature(self)}{table_names}{generations}'.encode('utf-8')
+        ).hexdigest()
+        label = self.get_queryset().model._meta.label_lower
+        return f'{self.response_cache_key_prefix}:{label}:{self.action}:{digest}'
@@ -0,0 +1,125 @@
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+
+from core.cache import get_generations
+from .cached_response_viewset_mixin import get_read_tables, get_request_signature
+
+
+class ConditionalResponseViewsetMixin:
+    """
+    Answers conditional GETs of list and retrieve with `304 Not Modified`
+    before the response is built (or read from cache, so it must come before
+    `CachedResponseViewsetMixin`):
+
+    - detail responses are validated by the `updated_at` of the record, also
+      sent as `Last-Modified`;
+    - list responses are validated by the greatest `updated_at` and the
+      number of records under the active filters, read in a single query.
+      They have no `Last-Modified`: deleting a record older than the rest
+      does not change it.
+
+    Validators are combined with the generations of the tables they are read
+    from (see `core.cache.generations`), the query string, requested fields
+    and the language into the `ETag`, so writes of related records, as
+    renaming a category of products, change it too.
+
+    Validators are cached until those tables are written, so unchanged
+    resources are validated without querying the database.
+    """
+    updated_at_field = 'updated_at'
+    validator_cache_key_prefix = 'validator'
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(super().list, self.get_list_validator, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(super().retrieve, self.get_detail_validator, request, *args, **kwargs)
+
+    def get_conditional_response(self, handler, get_validator, request, *args, **kwargs):
+        if self.has_updated_at_field() is False:
+            return handler(request, *args, **kwargs)
+
+        validator = self.get_cached_validator(get_validator)
+        if validator is None:
+            return handler(request, *args, **kwargs)
+
+        last_modified, version = validator
+        etag = self.get_etag(version)
+        last_modified = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+
+        return response
+
+    def has_updated_at_field(self) -> bool:
+        try:
+            self.get_queryset().model._meta.get_field(self.updated_at_field)
+        except FieldDoesNotExist:
+            return False
+        return True
+
+    def get_cached_validator(self, get_validator):
+        model = self.get_queryset().model
+        table_names = get_read_tables(model)
+        generations = get_generations(*table_names)
+
+        digest = md5(
+            f'{get_request_signature(self)}{table_names}{generations}'.encode('utf-8')
+        ).hexdigest()
+        key = f'{self.validator_cache_key_prefix}:{model._meta.label_lower}:{self.action}:{digest}'
+
+        validator = cache.get(key)
+        if validator is None:
+            validator = get_validator()
+            if validator is None:
+                return None
+            cache.set(key, validator, timeout=getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 600))
+
+        last_modified, version = validator
+        return last_modified, (version, generations)
+
+    def get_detail_validator(self):
+        """
+        (updated_at, version) of the requested record, if it exists. Malformed
+        lookups have none, so that the handler answers them as not found.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        try:
+            row = queryset.filter(**{
+                self.lookup_field: self.kwargs[lookup_url_kwarg],
+            }).values_list('pk', self.updated_at_field).first()
+        except (TypeError, ValueError, ValidationError):
+            return None
+
+        if row is None:
+            return None
+
+        return row[1], row
+
+    def get_list_validator(self):
+        """ (None, version) of the filtered records: lists are validated by ETag alone """
+        queryset = self.filter_queryset(self.get_queryset()).order_by()
+        row = queryset.aggregate(
+            last_modified=Max(self.updated_at_field),
+            count=Count('pk'),
+        )
+        return None, (row['last_modified'], row['count'])
+
+    def get_etag(self, version) -> str:
+        digest = md5(f'{get_request_signature(self)}{version}'.encode('utf-8')).hexdigest()
+        return f'"{digest}"'
@@ -0,0 +1,47 @@
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+
+from core.renderers import CSVRenderer, NDJSONRenderer
+
+
+class ExportViewsetMixin:
+    """
+    Adds `GET <list url>/export/?format=ndjson|csv` streaming every record
+    matching the list filters, read through a server-side cursor in chunks
+    of `export_chunk_size` rows, so memory stays constant whatever the
+    number of records.
+
+    Rows are read from `.values()` when `RowRendererViewsetMixin` can render
+    the requested fields, and serialized instance by instance otherwise.
+    """
+    export_chunk_size = 2000
+
+    @action(detail=False, methods=['get'], url_path='export', renderer_classes=[NDJSONRenderer, CSVRenderer])
+    def export(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = request.accepted_renderer
+
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f'{content_type}; charset={renderer.charset}'
+
+        response = StreamingHttpResponse(
+            renderer.iter_render(self.iter_export_rows(queryset)),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="{self.basename}.{renderer.format}"'
+        return response
+
+    def iter_export_rows(self, queryset):
+        get_row_renderer = getattr(self, 'get_row_renderer', None)
+        row_renderer = get_row_renderer() if get_row_renderer else None
+
+        if row_renderer is not None:
+            rows = queryset.prefetch_related(None).values(*row_renderer.lookups)
+            return row_renderer.iter_render(rows.iterator(chunk_size=self.export_chunk_size))
+
+        serializer = self.get_serializer()
+        return (
+            serializer.to_representation(instance)
+            for instance in queryset.iterator(chunk_size=self.export_chunk_size)
+        )
@@ -1,3 +1,6 @@
+from core.serializers import parse_requested_fields
+
+
 class FieldRequestViewsetMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -8,19 +11,30 @@ class FieldRequestViewsetMixin:
             return
         self.excluded_fields.append(field_name)
 
+    def get_requested_fields(self):
+        """
+        Fields requested through `?fields=` query string, excluded fields
+        left out. Sub-fields of nested objects come as `<name>.<sub-field>`.
+        """
+        fields = self.request.GET.get('fields') if self.request else None
+        if not fields:
+            return list()
+
+        cleaned_fields = list()
+        for f in list(set(fields.split(','))):
+            if f in self.excluded_fields or f.partition('.')[0] in self.excluded_fields:
+                continue
+            cleaned_fields.append(f)
+        return cleaned_fields
+
     def get_serializer_context(self):
         """
         Extra context provided to the serializer class.
         """
         context = super().get_serializer_context()
-        fields = self.request.GET.get('fields') if self.request else []
+        fields, nested_fields = parse_requested_fields(self.get_requested_fields())
         if fields:
-            cleaned_fields = list()
-            for f in list(set(fields.split(','))):
-                if f in self.excluded_fields:
-                    continue
-                cleaned_fields.append(f)
-            context.update({'fields': cleaned_fields})
+            context.update({'fields': fields, 'nested_fields': nested_fields})
 
         if self.excluded_fields:
             context.update({'excluded_fields': self.excluded_fields})
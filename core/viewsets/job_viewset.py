@@ -0,0 +1,39 @@
+from celery.result import AsyncResult
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from core.bulk import PROGRESS_STATE
+
+
+def is_async_request(request) -> bool:
+    """ Whether the client prefers to be answered before processing ends """
+    prefer = request.headers.get('Prefer', '')
+    return 'respond-async' in [p.split('=')[0].strip().lower() for p in prefer.split(',')]
+
+
+class JobViewSet(ViewSet):
+    """
+    Status of background jobs: `PENDING` (or unknown), `STARTED`,
+    `PROGRESS` with the progress reported so far, `SUCCESS` with the job
+    result or `FAILURE` with its error.
+    """
+
+    def retrieve(self, request, pk=None):
+        result = AsyncResult(pk)
+
+        data = {
+            'id': result.id,
+            'status': result.state,
+            'progress': None,
+            'result': None,
+            'error': None,
+        }
+
+        if result.state == PROGRESS_STATE:
+            data['progress'] = result.info
+        elif result.successful():
+            data['result'] = result.result
+        elif result.failed():
+            data['error'] = str(result.result)
+
+        return Response(data)
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.viewsets import ViewSet
+
+from core.profiling import PROFILE_TOKEN_HEADER, format_folded, get_profile, list_profiles, make_profile_token
+
+
+class ProfileViewSet(ViewSet):
+    """
+    Profiles of sampled requests and tasks in the profile ring buffer, for
+    staff users. `download/` answers the stacks of a profile folded, as
+    flame graph tools read them (eg `flamegraph.pl profile.folded`, or
+    speedscope), and `token/` a token to profile requests on demand.
+    """
+    permission_classes = [IsAdminUser]
+
+    def list(self, request):
+        return Response(list_profiles())
+
+    def retrieve(self, request, pk=None):
+        return Response(self.get_profile(pk))
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        profile = self.get_profile(pk)
+        response = HttpResponse(format_folded(profile['stacks']), content_type='text/plain; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="profile-{profile["id"]}.folded"'
+        return response
+
+    @action(detail=False, methods=['post'])
+    def token(self, request):
+        return Response({
+            'token': make_profile_token(request.user),
+            'header': PROFILE_TOKEN_HEADER,
+            'max_age': getattr(settings, 'PROFILING_TOKEN_MAX_AGE', 3600),
+        })
+
+    @staticmethod
+    def get_profile(pk) -> dict:
+        profile = get_profile(int(pk)) if str(pk).isdigit() else None
+        if profile is None:
+            raise NotFound()
+        return profile
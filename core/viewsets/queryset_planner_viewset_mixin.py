@@ -0,0 +1,223 @@
+from collections import namedtuple
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+from core.serializers import parse_requested_fields
+from .field_request_viewset_mixin import FieldRequestViewsetMixin
+
+QuerysetPlan = namedtuple('QuerysetPlan', ('select_related', 'prefetch_related', 'only', 'annotations'))
+
+
+def _get_output_field_names(serializer_class) -> list:
+    meta = getattr(serializer_class, 'Meta', None)
+    fields = getattr(meta, 'fields', None)
+
+    if fields is None or fields == '__all__':
+        model = getattr(meta, 'model', None)
+        fields = [f.name for f in model._meta.get_fields()] if model else []
+
+    declared_fields = getattr(serializer_class, '_declared_fields', dict())
+    return list(fields) + [f for f in declared_fields if f not in fields]
+
+
+def _get_annotated_fields(serializer_class) -> dict:
+    meta = getattr(serializer_class, 'Meta', None)
+    return getattr(meta, 'annotated_fields', None) or dict()
+
+
+def _get_nested_serializer_class(serializer_class, field_name):
+    get_nested_serializers = getattr(serializer_class, 'get_nested_serializers', None)
+    if get_nested_serializers is not None and field_name in get_nested_serializers():
+        return get_nested_serializers()[field_name]
+
+    declared_field = getattr(serializer_class, '_declared_fields', dict()).get(field_name)
+    if isinstance(declared_field, ListSerializer):
+        declared_field = declared_field.child
+
+    if isinstance(declared_field, BaseSerializer):
+        return declared_field.__class__
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def get_queryset_plan(serializer_class, fields: tuple = (), prefix: str = '', prefetching: bool = False):
+    """
+    Resolves how the queryset must be loaded for the serializer to output the
+    requested fields (all of them when `fields` is empty):
+
+    - `select_related`/`prefetch_related`: relations traversed by nested
+      serializers. Forward foreign keys rendered as primary keys only read the
+      `<name>_id` column, so they are not joined. Multi-valued relations are
+      always prefetched;
+    - `only`: columns to be selected, or `None` when some output field does
+      not map to a model column and the whole row must be loaded;
+    - `annotations`: callables annotating the queryset with values of output
+      fields computed by the database, declared by the serializer as
+      `Meta.annotated_fields = {<field name>: <callable(queryset)>}`.
+    """
+    model = serializer_class.Meta.model
+    declared_fields = getattr(serializer_class, '_declared_fields', dict())
+    annotated_fields = _get_annotated_fields(serializer_class)
+    optional_fields = getattr(serializer_class.Meta, 'optional_fields', tuple())
+    field_names, nested_fields = parse_requested_fields(fields)
+
+    select_related = list()
+    prefetch_related = list()
+    only = [f'{prefix}{model._meta.pk.name}']
+    annotations = list()
+    projectable = True
+
+    for field_name in _get_output_field_names(serializer_class):
+        if field_names and field_name not in field_names:
+            continue
+
+        if not field_names and field_name in optional_fields:
+            continue
+
+        if field_name in annotated_fields:
+            if not prefix:
+                annotations.append(annotated_fields[field_name])
+            continue
+
+        declared_field = declared_fields.get(field_name)
+        source = getattr(declared_field, 'source', None) or field_name
+        if source == 'pk':
+            continue
+
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            projectable = False
+            continue
+
+        lookup = f'{prefix}{model_field.name}'
+        if model_field.concrete is True:
+            only.append(lookup)
+
+        if model_field.is_relation is False:
+            continue
+
+        nested_class = _get_nested_serializer_class(serializer_class, field_name)
+        multiple = model_field.many_to_many or model_field.one_to_many
+        reverse_one = model_field.one_to_one and model_field.concrete is False
+
+        if nested_class is None and multiple is False and reverse_one is False:
+            continue
+
+        if multiple or prefetching:
+            prefetch_related.append(lookup)
+        else:
+            select_related.append(lookup)
+
+        if nested_class is None:
+            projectable = projectable and multiple
+            continue
+
+        nested_plan = get_queryset_plan(
+            nested_class,
+            tuple(nested_fields.get(field_name, ())),
+            prefix=f'{lookup}__',
+            prefetching=multiple or prefetching,
+        )
+        select_related += [
+            s for s in nested_plan.select_related if s not in select_related
+        ]
+        prefetch_related += [
+            p for p in nested_plan.prefetch_related if p not in prefetch_related
+        ]
+
+        # Prefetched rows are loaded by their own queries.
+        if multiple or prefetching:
+            continue
+
+        if nested_plan.only is None:
+            projectable = False
+            continue
+
+        only += nested_plan.only
+
+    return QuerysetPlan(
+        tuple(select_related),
+        tuple(prefetch_related),
+        tuple(only) if projectable else None,
+        tuple(annotations),
+    )
+
+
+class QuerysetPlannerViewsetMixin(FieldRequestViewsetMixin):
+    """
+    Plans the viewset queryset according to what the serializer outputs for
+    the requested fields:
+
+    - relations rendered by nested serializers are joined or prefetched, so
+      the number of queries does not grow with the page size;
+    - on reading requests with `?fields=`, only the columns needed by those
+      fields (including `category.<sub-field>`) and by the ordering are
+      selected;
+    - fields computed by the database, such as `is_deletable`, are annotated
+      to the queryset.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if isinstance(queryset, QuerySet) is False:
+            return queryset
+
+        return self.plan_queryset(queryset)
+
+    def get_queryset_plan(self) -> QuerysetPlan:
+        return get_queryset_plan(
+            self.get_serializer_class(),
+            tuple(sorted(self.get_requested_fields())),
+        )
+
+    def plan_queryset(self, queryset):
+        plan = self.get_queryset_plan()
+
+        if plan.select_related:
+            queryset = queryset.select_related(*plan.select_related)
+
+        if plan.prefetch_related:
+            queryset = queryset.prefetch_related(*plan.prefetch_related)
+
+        for annotate in plan.annotations:
+            queryset = annotate(queryset)
+
+        if self.is_projectable(plan):
+            queryset = queryset.only(*plan.only, *self.get_ordering_columns(queryset))
+
+        return queryset
+
+    def is_projectable(self, plan: QuerysetPlan) -> bool:
+        """
+        Columns are only narrowed on reading requests: deferred fields would
+        be left out of the UPDATE statements of writing ones.
+        """
+        if plan.only is None or not self.get_requested_fields():
+            return False
+
+        return self.request is not None and self.request.method in SAFE_METHODS
+
+    @staticmethod
+    def get_ordering_columns(queryset) -> list:
+        model = queryset.model
+        columns = list()
+        for name in queryset.query.order_by or model._meta.ordering:
+            if not isinstance(name, str):
+                continue
+
+            name = name.lstrip('-')
+            if name == 'pk':
+                continue
+
+            try:
+                columns.append(model._meta.get_field(name).name)
+            except FieldDoesNotExist:
+                continue
+
+        return columns
@@ -0,0 +1,64 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.response import Response
+
+from core.serializers import get_row_renderer
+
+
+class RowRendererViewsetMixin:
+    """
+    Lists records from `.values()` rows rendered by `RowRenderer` instead of
+    serializing model instances, whenever the serializer output for the
+    requested fields can be read that way. Otherwise, lists as usual.
+    """
+
+    def get_row_renderer(self):
+        get_requested_fields = getattr(self, 'get_requested_fields', None)
+        fields = get_requested_fields() if get_requested_fields else list()
+        excluded_fields = getattr(self, 'excluded_fields', None) or list()
+
+        return get_row_renderer(
+            self.get_serializer_class(),
+            tuple(sorted(fields)),
+            tuple(sorted(excluded_fields)),
+        )
+
+    def list(self, request, *args, **kwargs):
+        renderer = self.get_row_renderer()
+        if renderer is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.prefetch_related(None).values(*dict.fromkeys(
+            renderer.lookups + self.get_row_ordering_columns(queryset)
+        ))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.render_rows(renderer, page))
+
+        return Response(renderer.render_many(queryset))
+
+    def render_rows(self, renderer, rows):
+        return renderer.render_many(rows)
+
+    @staticmethod
+    def get_row_ordering_columns(queryset) -> list:
+        """ Columns the pagination reads the position of rows from """
+        model = queryset.model
+        columns = [model._meta.pk.attname]
+        for name in queryset.query.order_by or model._meta.ordering:
+            if not isinstance(name, str):
+                continue
+
+            name = name.lstrip('-')
+            if name in queryset.query.annotations:
+                columns.append(name)
+                continue
+
+            try:
+                field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            columns.append(field.attname)
+
+        return columns
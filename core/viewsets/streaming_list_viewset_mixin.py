@@ -0,0 +1,45 @@
+from django.http import StreamingHttpResponse
+
+from core.renderers import FastJSONRenderer, iter_json_envelope
+
+
+class StreamingListViewsetMixin:
+    """
+    Streams JSON of list pages of at least `stream_min_page_size` records
+    (eg `?limit=500`): the paginated envelope and the rows are encoded and
+    written one by one, instead of rendering the whole page in memory.
+
+    Rows are rendered lazily when listed by `RowRendererViewsetMixin`, which
+    must come after this mixin.
+    """
+    stream_min_page_size = 200
+    stream_renderer_class = FastJSONRenderer
+
+    def is_streaming_response(self) -> bool:
+        if self.action != 'list' or self.paginator is None:
+            return False
+
+        accepted_renderer = getattr(self.request, 'accepted_renderer', None)
+        if getattr(accepted_renderer, 'format', None) != 'json':
+            return False
+
+        page_size = getattr(self.paginator, 'page_size', None)
+        return page_size is not None and page_size >= self.stream_min_page_size
+
+    def render_rows(self, renderer, rows):
+        if self.is_streaming_response():
+            return renderer.iter_render(rows)
+
+        return super().render_rows(renderer, rows)
+
+    def get_paginated_response(self, data):
+        if self.is_streaming_response() is False:
+            return super().get_paginated_response(data)
+
+        envelope = super().get_paginated_response(list()).data
+        renderer = self.stream_renderer_class()
+
+        return StreamingHttpResponse(
+            iter_json_envelope(envelope, data, renderer.dumps),
+            content_type=renderer.media_type,
+        )
@@ -0,0 +1,56 @@
+from django.contrib.postgres.search import TrigramSimilarity, TrigramWordSimilarity
+from django.db.models.functions import Upper
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from core.pagination import positive_int
+
+
+class SuggestViewsetMixin:
+    """
+    Adds `GET <list url>/suggest/?q=<term>` for typeahead, answering the
+    records whose `suggest_field` best matches the term by trigram word
+    similarity, best first, as `[{"pk": ..., <field>: ..., "similarity": ...}]`.
+    Up to `suggest_limit` records are answered, or `?limit=` up to
+    `suggest_max_limit`, and list filters apply as well.
+
+    Candidates are found by `UPPER(<field>) %> UPPER(<term>)`, which is
+    resolved by a `gin_trgm_ops` index over `UPPER(<field>)`, so only they
+    are ranked. Terms shorter than `suggest_min_length` are not looked up.
+    """
+    suggest_field = 'name'
+    suggest_query_param = 'q'
+    suggest_min_length = 2
+    suggest_limit_query_param = 'limit'
+    suggest_limit = 10
+    suggest_max_limit = 50
+
+    @action(detail=False, methods=['get'], url_path='suggest')
+    def suggest(self, request, *args, **kwargs):
+        term = request.query_params.get(self.suggest_query_param, '').strip().upper()
+        if len(term) < self.suggest_min_length:
+            return Response([])
+
+        field = self.suggest_field
+        queryset = self.filter_queryset(self.get_queryset()).alias(
+            suggest_value=Upper(field),
+        ).filter(
+            suggest_value__trigram_word_similar=term,
+        ).alias(
+            # Ties are broken by how much of the whole value the term covers
+            value_similarity=TrigramSimilarity('suggest_value', term),
+        ).annotate(
+            similarity=TrigramWordSimilarity(term, 'suggest_value'),
+        ).order_by('-similarity', '-value_similarity', field, 'pk')
+
+        return Response(list(queryset.values('pk', field, 'similarity')[:self.get_suggest_limit()]))
+
+    def get_suggest_limit(self) -> int:
+        try:
+            return positive_int(
+                self.request.query_params[self.suggest_limit_query_param],
+                strict=True,
+                cutoff=self.suggest_max_limit,
+            )
+        except (KeyError, ValueError):
+            return self.suggest_limit
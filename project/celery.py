@@ -15,3 +15,6 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
+
+# Profiling of sampled tasks, see core.profiling
+import core.profiling.task_profiling  # noqa: E402,F401 pylint: disable=wrong-import-position,unused-import
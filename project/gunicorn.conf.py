@@ -0,0 +1,14 @@
+"""
+Gunicorn settings. Metrics of every worker are aggregated by /metrics when
+PROMETHEUS_MULTIPROC_DIR is set (see core.metrics.prometheus).
+"""
+import os
+
+from prometheus_client import multiprocess
+
+bind = '0.0.0.0:8000'
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(worker.pid)
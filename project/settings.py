@@ -77,6 +77,8 @@ if DEBUG is True:
 
 # ============================================== WEB APPLICATION =======================================================
 MIDDLEWARE = [
+    'core.middleware.PerformanceMiddleware',
+    'core.middleware.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
@@ -91,6 +93,7 @@ MIDDLEWARE = [
 if DEBUG is True:
     MIDDLEWARE += [
         'debug_toolbar.middleware.DebugToolbarMiddleware',
+        'core.middleware.QueryInspectorMiddleware',
     ]
 
 ROOT_URLCONF = 'project.urls'
@@ -140,6 +143,22 @@ SESSION_COOKIE_SECURE = DEBUG is False
 CSRF_COOKIE_SECURE = DEBUG is False
 SECURE_HSTS_PRELOAD = DEBUG is False
 
+# ================================================ OBSERVABILITY =======================================================
+# Timings of requests in a Server-Timing header (see core.middleware.PerformanceMiddleware)
+SERVER_TIMING = config('SERVER_TIMING', cast=bool, default=DEBUG)
+
+# Bearer token required to scrape /metrics. When empty, /metrics is open under DEBUG only
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Profiling of sampled requests and tasks (see core.profiling). Staff users get
+# tokens profiling the requests they send from /v1/profiling/profiles/token/.
+PROFILING_SAMPLE_RATE = config('PROFILING_SAMPLE_RATE', cast=float, default=0.0)
+PROFILING_TASK_SAMPLE_RATE = config('PROFILING_TASK_SAMPLE_RATE', cast=float, default=0.0)
+PROFILING_TASKS = config('PROFILING_TASKS', cast=Csv(), default='')
+PROFILING_INTERVAL = config('PROFILING_INTERVAL', cast=float, default=0.005)  # seconds between stack samples
+PROFILING_BUFFER_SIZE = config('PROFILING_BUFFER_SIZE', cast=int, default=100)
+PROFILING_TOKEN_MAX_AGE = config('PROFILING_TOKEN_MAX_AGE', cast=int, default=3600)
+
 # ================================================= DATABASES ==========================================================
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
@@ -189,6 +208,12 @@ LANGUAGES = (
     ('pt-br', _('Português (Brasil)')),
 )
 
+# Text search configurations by language (see core.filters.FullTextSearchFilter)
+SEARCH_CONFIGS = {
+    'en-us': 'english',
+    'pt-br': 'portuguese',
+}
+
 LANGUAGE_CODE = config('LANGUAGE_CODE', 'en-us')
 TIME_ZONE = config('TIME_ZONE', 'UTC')
 USE_I18N = config('USE_I18N', cast=bool, default=False)
@@ -265,11 +290,24 @@ REST_FRAMEWORK = {
     # 'DEFAULT_PERMISSION_CLASSES': [
     #    'rest_framework.permissions.DjangoModelPermissionsOrAnonReadOnly'
     # ],
-    'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_FILTER_BACKENDS': [
+        'core.filters.FilterBackend',
+        'core.filters.FullTextSearchFilter',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.KeysetPagination',
     'PAGE_SIZE': 50
 }
 
+# Seconds a filtered list count is kept in cache (see core.pagination.CountStrategy)
+PAGINATION_COUNT_CACHE_TIMEOUT = config('PAGINATION_COUNT_CACHE_TIMEOUT', cast=int, default=300)
+
+# Seconds a list or retrieve response is kept in cache (see core.viewsets.CachedResponseViewsetMixin)
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', cast=int, default=600)
+
 # ======================================================== E-MAIL ==================================================== #
 EMAIL_BACKEND = config('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = config('EMAIL_HOST', 'mailhog')
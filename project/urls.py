@@ -18,14 +18,22 @@ from django.conf.urls import static
 from django.contrib import admin
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
+from rest_framework.routers import DefaultRouter
 from rest_framework_swagger.views import get_swagger_view
 
+from core.metrics import metrics_view
+from core.viewsets import ProfileViewSet
+
 schema_view = get_swagger_view(
     title='Boilerplate API',
 )
 
+profiling_router = DefaultRouter()
+profiling_router.register('profiles', ProfileViewSet, basename='profile')
+
 schema_url_patterns = [
     path('v1/stock/', include(('apps.stock.api.urls', 'stock'), namespace='stock')),
+    path('v1/profiling/', include((profiling_router.urls, 'profiling'), namespace='profiling')),
     path('v1/auth/', include('rest_framework.urls', namespace='rest_framework')),
 
 ]
@@ -36,6 +44,7 @@ urlpatterns = [
 
     path('i18n/', include('django.conf.urls.i18n')),
     path('health/', include('health_check.urls')),
+    path('metrics', metrics_view, name='metrics'),
     path('api-doc/', schema_view),
 ] + schema_url_patterns
 